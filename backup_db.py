@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2016
+# pytutamen_server NDJSON dump and restore
+
+
+### Imports ###
+
+## stdlib ##
+import argparse
+import sys
+import time
+
+## extlib ##
+from pcollections import drivers
+from pcollections import backends
+
+## pytutamen_server ##
+from pytutamen_server import backup
+
+
+_REDIS_DB = 0
+
+
+if __name__ == '__main__':
+
+    # Parse Args
+    parser = argparse.ArgumentParser(description="Dump or restore a storage and access control database as NDJSON")
+    parser.add_argument('--db', type=int, default=_REDIS_DB, help="Redis DB number")
+    subparsers = parser.add_subparsers(dest='command')
+    parser_dump = subparsers.add_parser('dump', help=("Write every object to a file, "
+                                                      "from a quiesced database or replica"))
+    parser_dump.add_argument('path', help="Output file, '-' for stdout")
+    parser_restore = subparsers.add_parser('restore', help="Write objects from a file")
+    parser_restore.add_argument('path', help="Input file, '-' for stdin")
+    parser_restore.add_argument('--workers', type=int, default=backup._RESTORE_WORKERS,
+                                help="Parallel writers")
+    parser_restore.add_argument('--flush', action='store_true',
+                                help="Empty the database first, instead of merging into it")
+    args = parser.parse_args()
+    if args.command is None:
+        parser.error("Requires a command")
+
+    # Setup Connection
+    pdriver = drivers.RedisDriver(db=args.db)
+    pbackend = backends.RedisAtomicBackend(pdriver)
+
+    # Check Target
+    if args.command == 'restore':
+        if args.flush:
+            pdriver.redis.flushdb()
+        elif pdriver.redis.dbsize():
+            msg = ("Warning: DB {} is not empty, restored records merge into existing data "
+                   "(use --flush to empty it first)")
+            print(msg.format(args.db), file=sys.stderr)
+
+    # Run
+    start = time.perf_counter()
+    if args.command == 'dump':
+        if args.path == '-':
+            cnt = backup.dump(pbackend, sys.stdout)
+        else:
+            with open(args.path, 'w') as f:
+                cnt = backup.dump(pbackend, f)
+    else:
+        if args.path == '-':
+            cnt = backup.restore(pbackend, sys.stdin, workers=args.workers)
+        else:
+            with open(args.path, 'r') as f:
+                cnt = backup.restore(pbackend, f, workers=args.workers)
+    dur = time.perf_counter() - start
+    verb = "Dumped" if args.command == 'dump' else "Restored"
+    print("{} {} records in {:.1f}s".format(verb, cnt, dur), file=sys.stderr)
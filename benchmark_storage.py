@@ -19,6 +19,7 @@ from future.utils import native_str
 from builtins import *
 
 ## stdlib ##
+import argparse
 import time
 
 ## extlib ##
@@ -30,6 +31,7 @@ from pytutamen_server import constants
 from pytutamen_server import utility
 from pytutamen_server import datatypes
 from pytutamen_server import storage
+from pytutamen_server import membackend
 
 
 _REDIS_DB = 9
@@ -38,12 +40,23 @@ _TEST_SEC = "Test Secret 33"
 
 if __name__ == '__main__':
 
+    # Parse Args
+    parser = argparse.ArgumentParser(description="Benchmark storage object access")
+    parser.add_argument('--memory', action='store_true',
+                        help="Use the in-process backend instead of redis")
+    args = parser.parse_args()
+
     # Setup Connection
-    pdriver = drivers.RedisDriver(db=_REDIS_DB)
-    pbackend = backends.RedisAtomicBackend(pdriver)
+    if args.memory:
+        pbackend = membackend.MemoryBackend()
+        pdb = pbackend
+    else:
+        pdriver = drivers.RedisDriver(db=_REDIS_DB)
+        pbackend = backends.RedisAtomicBackend(pdriver)
+        pdb = pdriver.redis
 
     # Confirm Empty DB
-    if (pdriver.redis.dbsize() != 0):
+    if (pdb.dbsize() != 0):
         raise Exception("DB Not Empty")
 
 
@@ -121,5 +134,19 @@ if __name__ == '__main__':
     iops = itr/dur
     print("iops ({} iterations) = {}".format(itr, iops))
 
+    # Benchmark One-Shot Read
+    print("Testing Full Stack Read Secret...")
+    srv = None
+    data = None
+    start = time.perf_counter()
+    for i in range(itr):
+        srv = storage.StorageServer(pbackend, create=False)
+        data = srv.read_secret(col_uid, sec_uid)
+    end = time.perf_counter()
+    assert(data == _TEST_SEC)
+    dur = end - start
+    iops = itr/dur
+    print("iops ({} iterations) = {}".format(itr, iops))
+
     # Clear DB
-    pdriver.redis.flushdb()
+    pdb.flushdb()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2016
+# pytutamen_server field migration
+
+
+### Imports ###
+
+## stdlib ##
+import argparse
+
+## extlib ##
+from pcollections import drivers
+from pcollections import backends
+
+## pytutamen_server ##
+from pytutamen_server import storage
+from pytutamen_server import accesscontrol
+
+
+_REDIS_DB = 0
+
+
+def migrate(index):
+
+    cnt = 0
+    for obj in index.iter_by_obj():
+        if obj.migrate_fields():
+            cnt += 1
+    return cnt
+
+if __name__ == '__main__':
+
+    # Parse Args
+    parser = argparse.ArgumentParser(description="Pack legacy scalar field keys and backfill ordered indexes")
+    parser.add_argument('--db', type=int, default=_REDIS_DB, help="Redis DB number")
+    args = parser.parse_args()
+
+    # Setup Connection
+    pdriver = drivers.RedisDriver(db=args.db)
+    pbackend = backends.RedisAtomicBackend(pdriver)
+
+    # Migrate Storage Objects
+    srv = storage.StorageServer(pbackend, create=False)
+    cnt = migrate(srv.collections)
+    print("Migrated {} collections".format(cnt))
+    for col in srv.collections.iter_by_obj():
+        col.secrets.sync_order()
+
+    # Migrate Access Control Objects
+    acs = accesscontrol.AccessControlServer(pbackend, create=False)
+    cnt = migrate(acs.authorizations)
+    print("Migrated {} authorizations".format(cnt))
+    acs.authorizations.sync_order()
+    cnt = migrate(acs.verifiers)
+    print("Migrated {} verifiers".format(cnt))
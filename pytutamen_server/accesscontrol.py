@@ -59,6 +59,34 @@ _POSTFIX_BYPASS_ACCOUNTS = "bypass_accounts"
 _POSTFIX_BYPASS_AUTHENTICATORS = "bypass_authenticators"
 _POSTFIX_CLIENTS = "clients"
 
+datatypes.register_key_codes({_LABEL_AUTHORIZATIONS: "ZI",
+                              _LABEL_VERIFIERS: "YI",
+                              _LABEL_AUTHENTICATORS: "NI",
+                              _LABEL_ACCOUNTS: "AI",
+                              _LABEL_PERMISSIONS: "P",
+                              _PREFIX_AUTHORIZATION: "Z",
+                              _PREFIX_VERIFIER: "Y",
+                              _PREFIX_AUTHENTICATOR: "N",
+                              _PREFIX_ACCOUNT: "A",
+                              _PREFIX_CLIENT: "L",
+                              _POSTFIX_CA_CRT: "CC",
+                              _POSTFIX_CA_KEY: "CK",
+                              _POSTFIX_SIGKEY_PUB: "KP",
+                              _POSTFIX_SIGKEY_PRIV: "KS",
+                              _POSTFIX_CLIENT_CRT: "CR",
+                              _POSTFIX_ACCOUNTUID: "AU",
+                              _POSTFIX_CLIENTUID: "LU",
+                              _POSTFIX_EXPIRATION: "EX",
+                              _POSTFIX_OBJPERM: "OP",
+                              _POSTFIX_OBJTYPE: "OT",
+                              _POSTFIX_OBJUID: "OU",
+                              _POSTFIX_STATUS: "ST",
+                              _POSTFIX_MODULE_NAME: "MN",
+                              _POSTFIX_MODULE_KWARGS: "MK",
+                              _POSTFIX_BYPASS_ACCOUNTS: "BA",
+                              _POSTFIX_BYPASS_AUTHENTICATORS: "BN",
+                              _POSTFIX_CLIENTS: "LI"})
+
 
 ### Logging ###
 
@@ -104,6 +132,13 @@ class AuthorizationAlreadyProcessed(AuthorizationException):
 
 class AccessControlServer(datatypes.ServerObject):
 
+    __slots__ = ()
+
+    _ca_crt = datatypes.lazy_pobj("String", _POSTFIX_CA_CRT)
+    _ca_key = datatypes.lazy_pobj("String", _POSTFIX_CA_KEY)
+    _sigkey_pub = datatypes.lazy_pobj("String", _POSTFIX_SIGKEY_PUB)
+    _sigkey_priv = datatypes.lazy_pobj("String", _POSTFIX_SIGKEY_PRIV)
+
     def __init__(self, pbackend, key=_KEY_ACSRV, create=False,
                  ca_crt_pem=None, ca_key_pem=None,
                  sigkey_pub_pem=None, sigkey_priv_pem=None,
@@ -113,14 +148,7 @@ class AccessControlServer(datatypes.ServerObject):
         # Call Parent
         super().__init__(pbackend, key=key, create=create)
 
-        # Setup Child Indexes
-        self._authorizations = datatypes.ChildIndex(self, Authorization, _LABEL_AUTHORIZATIONS)
-        self._verifiers = datatypes.ChildIndex(self, Verifier, _LABEL_VERIFIERS)
-        self._authenticators = datatypes.ChildIndex(self, Authenticator, _LABEL_AUTHENTICATORS)
-        self._accounts = datatypes.ChildIndex(self, Account, _LABEL_ACCOUNTS)
-        self._permissions = datatypes.ChildIndex(self, Permissions, _LABEL_PERMISSIONS)
-
-        # Setup CA Keys
+        # Setup CA Keys (opened lazily when not creating)
         if create:
             if ca_crt_pem:
                 if ca_key_pem:
@@ -139,14 +167,14 @@ class AccessControlServer(datatypes.ServerObject):
                 ca_crt_pem, ca_key_pem = crypto.gen_ca_pair(cn, country, state, locality,
                                                             org, ou, email,
                                                             ca_key_pem=ca_key_pem)
-        self._ca_crt = self._build_pobj(self.pcollections.String,
-                                        _POSTFIX_CA_CRT,
-                                        create=ca_crt_pem)
-        self._ca_key = self._build_pobj(self.pcollections.String,
-                                        _POSTFIX_CA_KEY,
-                                        create=ca_key_pem)
-
-        # Setup Sig Keys
+            self._ca_crt = self._build_pobj(self.pcollections.String,
+                                            _POSTFIX_CA_CRT,
+                                            create=ca_crt_pem)
+            self._ca_key = self._build_pobj(self.pcollections.String,
+                                            _POSTFIX_CA_KEY,
+                                            create=ca_key_pem)
+
+        # Setup Sig Keys (opened lazily when not creating)
         if create:
             if sigkey_pub_pem:
                 if sigkey_priv_pem:
@@ -157,20 +185,54 @@ class AccessControlServer(datatypes.ServerObject):
             else:
                 sigkey_pub_pem, sigkey_priv_pem = crypto.gen_key_pair(length=4096,
                                                                       priv_key_pem=sigkey_priv_pem)
-        self._sigkey_pub = self._build_pobj(self.pcollections.String,
-                                            _POSTFIX_SIGKEY_PUB,
-                                            create=sigkey_pub_pem)
-        self._sigkey_priv = self._build_pobj(self.pcollections.String,
-                                             _POSTFIX_SIGKEY_PRIV,
-                                             create=sigkey_priv_pem)
+            self._sigkey_pub = self._build_pobj(self.pcollections.String,
+                                                _POSTFIX_SIGKEY_PUB,
+                                                create=sigkey_pub_pem)
+            self._sigkey_priv = self._build_pobj(self.pcollections.String,
+                                                 _POSTFIX_SIGKEY_PRIV,
+                                                 create=sigkey_priv_pem)
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_CA_CRT, _POSTFIX_CA_KEY,
+                                           _POSTFIX_SIGKEY_PUB, _POSTFIX_SIGKEY_PRIV]
+
+    @classmethod
+    def reap_indexes(cls):
+        return [(_LABEL_AUTHORIZATIONS, Authorization, True),
+                (_LABEL_VERIFIERS, Verifier, False),
+                (_LABEL_AUTHENTICATORS, Authenticator, False),
+                (_LABEL_ACCOUNTS, Account, False),
+                (_LABEL_PERMISSIONS, Permissions, False)]
+
+    @datatypes.lazy
+    def _authorizations(self):
+        return datatypes.ChildIndex(self, Authorization, _LABEL_AUTHORIZATIONS,
+                                    ordered=True)
+
+    @datatypes.lazy
+    def _verifiers(self):
+        return datatypes.ChildIndex(self, Verifier, _LABEL_VERIFIERS)
+
+    @datatypes.lazy
+    def _authenticators(self):
+        return datatypes.ChildIndex(self, Authenticator, _LABEL_AUTHENTICATORS)
+
+    @datatypes.lazy
+    def _accounts(self):
+        return datatypes.ChildIndex(self, Account, _LABEL_ACCOUNTS)
+
+    @datatypes.lazy
+    def _permissions(self):
+        return datatypes.ChildIndex(self, Permissions, _LABEL_PERMISSIONS)
 
     def destroy(self):
 
         # Cleanup Objects
-        self._sigkey_priv.rem()
-        self._sigkey_pub.rem()
-        self._ca_key.rem()
-        self._ca_crt.rem()
+        self._rem_pobj("_sigkey_priv", _POSTFIX_SIGKEY_PRIV)
+        self._rem_pobj("_sigkey_pub", _POSTFIX_SIGKEY_PUB)
+        self._rem_pobj("_ca_key", _POSTFIX_CA_KEY)
+        self._rem_pobj("_ca_crt", _POSTFIX_CA_CRT)
 
         # Cleanup Indexes
         self._permissions.destroy()
@@ -204,22 +266,28 @@ class AccessControlServer(datatypes.ServerObject):
 
     @property
     def ca_crt(self):
-        return self._ca_crt.get_val()
+        return self._get_cached("_ca_crt", _POSTFIX_CA_CRT)
 
     @property
     def ca_key(self):
-        return self._ca_key.get_val()
+        return self._get_cached("_ca_key", _POSTFIX_CA_KEY)
 
     @property
     def sigkey_pub(self):
-        return self._sigkey_pub.get_val()
+        return self._get_cached("_sigkey_pub", _POSTFIX_SIGKEY_PUB)
 
     @property
     def sigkey_priv(self):
-        return self._sigkey_priv.get_val()
+        return self._get_cached("_sigkey_priv", _POSTFIX_SIGKEY_PRIV)
 
 class Authorization(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ('_accountuid', '_clientuid', '_expiration', '_objperm', '_status')
+
+    packed_fields = True
+
+    reap_prefix = _PREFIX_AUTHORIZATION
+
     def __init__(self, pbackend, pindex=None, create=False,
                  prefix=_PREFIX_AUTHORIZATION,
                  accountuid=None, clientuid=None, expiration=None,
@@ -254,39 +322,33 @@ class Authorization(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
         super().__init__(pbackend, pindex=pindex, create=create, prefix=prefix, **kwargs)
 
         # Setup Data
-        self._accountuid = self._build_pobj(self.pcollections.String,
-                                           _POSTFIX_ACCOUNTUID,
-                                           create=accountuid)
-        self._clientuid = self._build_pobj(self.pcollections.String,
-                                           _POSTFIX_CLIENTUID,
-                                           create=clientuid)
-        self._expiration = self._build_pobj(self.pcollections.String,
-                                            _POSTFIX_EXPIRATION,
-                                            create=expiration)
-        self._objperm = self._build_pobj(self.pcollections.String,
-                                         _POSTFIX_OBJPERM,
-                                         create=objperm)
-        self._objtype = self._build_pobj(self.pcollections.String,
-                                         _POSTFIX_OBJTYPE,
-                                         create=objtype)
-        self._objuid = self._build_pobj(self.pcollections.String,
-                                        _POSTFIX_OBJUID,
-                                        create=objuid)
-        self._status = self._build_pobj(self.pcollections.MutableString,
-                                        _POSTFIX_STATUS,
-                                        create=constants.AUTHZ_STATUS_NEW)
+        self._accountuid = self._build_field(_POSTFIX_ACCOUNTUID, create=accountuid)
+        self._clientuid = self._build_field(_POSTFIX_CLIENTUID, create=clientuid)
+        self._expiration = self._build_field(_POSTFIX_EXPIRATION, create=expiration)
+        self._objperm = self._build_field(_POSTFIX_OBJPERM, create=objperm)
+        self._objtype = self._build_field(_POSTFIX_OBJTYPE, create=objtype)
+        self._objuid = self._build_field(_POSTFIX_OBJUID, create=objuid)
+        self._status = self._build_field(_POSTFIX_STATUS,
+                                         create=constants.AUTHZ_STATUS_NEW,
+                                         mutable=True)
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_ACCOUNTUID, _POSTFIX_CLIENTUID,
+                                           _POSTFIX_EXPIRATION, _POSTFIX_OBJPERM,
+                                           _POSTFIX_OBJTYPE, _POSTFIX_OBJUID, _POSTFIX_STATUS]
 
     def destroy(self):
         """Delete Authorization"""
 
         # Cleanup Status and Token
-        self._status.rem()
-        self._objuid.rem()
-        self._objtype.rem()
-        self._objperm.rem()
-        self._expiration.rem()
-        self._clientuid.rem()
-        self._accountuid.rem()
+        self._rem_pobj("_status", _POSTFIX_STATUS)
+        self._rem_pobj("_objuid", _POSTFIX_OBJUID)
+        self._rem_pobj("_objtype", _POSTFIX_OBJTYPE)
+        self._rem_pobj("_objperm", _POSTFIX_OBJPERM)
+        self._rem_pobj("_expiration", _POSTFIX_EXPIRATION)
+        self._rem_pobj("_clientuid", _POSTFIX_CLIENTUID)
+        self._rem_pobj("_accountuid", _POSTFIX_ACCOUNTUID)
 
         # Call Parent
         super().destroy()
@@ -478,6 +540,13 @@ class Authorization(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
 
 class Verifier(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ('_accounts', '_authenticators', '_bypass_accounts', '_bypass_authenticators')
+
+    packed_fields = True
+
+    reap_prefix = _PREFIX_VERIFIER
+    reap_linked = True
+
     def __init__(self, pbackend, pindex=None, create=False,
                  prefix=_PREFIX_VERIFIER,
                  accounts=None, authenticators=None,
@@ -503,33 +572,40 @@ class Verifier(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildOb
         super().__init__(pbackend, pindex=pindex, create=create, prefix=prefix, **kwargs)
 
         # Setup Objects
-        self._bypass_accounts = self._build_pobj(self.pcollections.MutableString,
-                                                 _POSTFIX_BYPASS_ACCOUNTS,
-                                                 create=str(int(bypass_accounts)))
-        self._bypass_authenticators = self._build_pobj(self.pcollections.MutableString,
-                                                 _POSTFIX_BYPASS_AUTHENTICATORS,
-                                                 create=str(int(bypass_authenticators)))
+        self._bypass_accounts = self._build_field(_POSTFIX_BYPASS_ACCOUNTS,
+                                                  create=str(int(bypass_accounts)),
+                                                  mutable=True)
+        self._bypass_authenticators = self._build_field(_POSTFIX_BYPASS_AUTHENTICATORS,
+                                                        create=str(int(bypass_authenticators)),
+                                                        mutable=True)
 
         # Setup Index
-        def account_masters(key, **kwargs):
-            return Account(self.pbackend, key=key, **kwargs).verifiers
+        def account_masters(key, pindex=None):
+            return pindex.get(key=key).verifiers
         self._accounts = datatypes.MasterObjIndex(self, _POSTFIX_ACCOUNTS,
                                                   account_masters,
                                                   Account,
+                                                  peer_label=_POSTFIX_VERIFIERS,
+                                                  peer_prefix=_PREFIX_ACCOUNT,
                                                   pindex=self.server.accounts)
-        def authenticator_masters(key, **kwargs):
-            return Authenticator(self.pbackend, key=key, **kwargs).verifiers
+        def authenticator_masters(key, pindex=None):
+            return pindex.get(key=key).verifiers
         self._authenticators = datatypes.MasterObjIndex(self, _POSTFIX_AUTHENTICATORS,
                                                         authenticator_masters,
                                                         Authenticator,
+                                                        peer_label=_POSTFIX_VERIFIERS,
+                                                        peer_prefix=_PREFIX_AUTHENTICATOR,
                                                         pindex=self.server.authenticators)
 
         # Add initial index values:
         if create:
-            for account in accounts:
-                self.accounts.add(account)
-            for authenticator in authenticators:
-                self.authenticators.add(authenticator)
+            self.accounts.add_many(accounts)
+            self.authenticators.add_many(authenticators)
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_BYPASS_ACCOUNTS, _POSTFIX_BYPASS_AUTHENTICATORS,
+                                           _POSTFIX_ACCOUNTS, _POSTFIX_AUTHENTICATORS]
 
     def destroy(self):
         """Delete Verifier"""
@@ -539,8 +615,8 @@ class Verifier(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildOb
         self._accounts.destroy()
 
         # Cleanup Objects
-        self._bypass_authenticators.rem()
-        self._bypass_accounts.rem()
+        self._rem_pobj("_bypass_authenticators", _POSTFIX_BYPASS_AUTHENTICATORS)
+        self._rem_pobj("_bypass_accounts", _POSTFIX_BYPASS_ACCOUNTS)
 
         # Call Parent
         super().destroy()
@@ -572,6 +648,11 @@ class Verifier(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildOb
 
 class Authenticator(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ('_verifiers', '_module_name', '_module_kwargs')
+
+    reap_prefix = _PREFIX_AUTHENTICATOR
+    reap_linked = True
+
     def __init__(self, pbackend, pindex=None, create=False,
                  prefix=_PREFIX_AUTHENTICATOR,
                  module_name=None, module_kwargs=None, **kwargs):
@@ -592,11 +673,13 @@ class Authenticator(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
         super().__init__(pbackend, pindex=pindex, create=create, prefix=prefix, **kwargs)
 
         # Setup Vars
-        def verifier_slaves(key, **kwargs):
-            return Verifier(self.pbackend, key=key, **kwargs).authenticators
+        def verifier_slaves(key, pindex=None):
+            return pindex.get(key=key).authenticators
         self._verifiers = datatypes.SlaveObjIndex(self, _POSTFIX_VERIFIERS,
                                                   verifier_slaves,
                                                   Verifier,
+                                                  peer_label=_POSTFIX_AUTHENTICATORS,
+                                                  peer_prefix=_PREFIX_VERIFIER,
                                                   pindex=self.server.verifiers)
         self._module_name = self._build_pobj(self.pcollections.String,
                                              _POSTFIX_MODULE_NAME,
@@ -605,28 +688,49 @@ class Authenticator(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
                                                _POSTFIX_MODULE_KWARGS,
                                                create=module_kwargs)
 
-        # Setup Module
+        # Setup Module, loaded on first use when opening existing
+        if create:
+
+            # Open pobjs before reading module settings
+            self._open_pobjs()
+
+            try:
+                module = self._load_module()
+                instance = module.Authmod(self, **self.module_kwargs)
+            except Exception as err:
+                self.destroy()
+                raise
+            else:
+                self._module = module
+                self._instance = instance
+
+    @datatypes.lazy
+    def _module(self):
+        return self._load_module()
+
+    @datatypes.lazy
+    def _instance(self):
+        return self._module.Authmod(self, **self.module_kwargs)
+
+    def _load_module(self):
         import_name = self._to_import_name(self.module_name)
-        try:
-            module = importlib.import_module(import_name, package='authmods')
-            instance = module.Authmod(self, **self.module_kwargs)
-        except Exception as err:
-            self.destroy()
-            raise
-        else:
-            self._module = module
-            self._instance = instance
+        return importlib.import_module(import_name, package='authmods')
 
     def _to_import_name(self, module_name):
         module_name = module_name.lstrip('.')
         return ".{}".format(module_name)
 
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_VERIFIERS, _POSTFIX_MODULE_NAME,
+                                           _POSTFIX_MODULE_KWARGS]
+
     def destroy(self):
         """Delete Authenticator"""
 
         # Cleanup Vars
-        self._module_kwargs.rem()
-        self._module_name.rem()
+        self._rem_pobj("_module_kwargs", _POSTFIX_MODULE_KWARGS)
+        self._rem_pobj("_module_name", _POSTFIX_MODULE_NAME)
         self._verifiers.destroy()
 
         # Call Parent
@@ -645,7 +749,7 @@ class Authenticator(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
     @property
     def module_name(self):
         """Return Module Name"""
-        return self._module_name.get_val()
+        return self._get_cached("_module_name", _POSTFIX_MODULE_NAME)
 
     @property
     def module_kwargs(self):
@@ -658,6 +762,11 @@ class Authenticator(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Ch
 
 class Account(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ('_verifiers', '_clients')
+
+    reap_prefix = _PREFIX_ACCOUNT
+    reap_linked = True
+
     def __init__(self, pbackend, pindex=None, create=False,
                  prefix=_PREFIX_ACCOUNT, **kwargs):
         """Initialize Account"""
@@ -672,19 +781,29 @@ class Account(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObj
 
         # Setup Vars
         self._clients = datatypes.ChildIndex(self, Client, _POSTFIX_CLIENTS)
-        def verifier_slaves(key, **kwargs):
-            return Verifier(self.pbackend, key=key, **kwargs).accounts
+        def verifier_slaves(key, pindex=None):
+            return pindex.get(key=key).accounts
         self._verifiers = datatypes.SlaveObjIndex(self, _POSTFIX_VERIFIERS,
                                                   verifier_slaves,
                                                   Verifier,
+                                                  peer_label=_POSTFIX_ACCOUNTS,
+                                                  peer_prefix=_PREFIX_VERIFIER,
                                                   pindex=self.server.verifiers)
 
-    def destroy(self):
-        """Delete Account"""
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_VERIFIERS]
+
+    @classmethod
+    def reap_indexes(cls):
+        return [(_POSTFIX_CLIENTS, Client, False)]
+
+    def destroy(self, cascade=None):
+        """Delete Account, reaping its clients in the background if cascade"""
 
         # Cleanup Indexes
         self._verifiers.destroy()
-        self._clients.destroy()
+        self._clients.destroy(cascade=cascade)
 
         # Call Parent
         super().destroy()
@@ -706,6 +825,12 @@ class Account(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObj
 
 class Client(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ()
+
+    reap_prefix = _PREFIX_CLIENT
+
+    _crt = datatypes.lazy_pobj("String", _POSTFIX_CLIENT_CRT)
+
     def __init__(self, pbackend, pindex=None, create=False,
                  prefix=_PREFIX_CLIENT, csr_pem=None, **kwargs):
         """Initialize Client"""
@@ -721,19 +846,21 @@ class Client(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObje
         # Setup Client Cert
         if create:
             crt_pem = crypto.csr_to_crt(csr_pem, self.server.ca_crt, self.server.ca_key,
-                                        cn=self.key, ou=self.account.key,
+                                        cn=str(self.uid), ou=str(self.account.uid),
                                         serial=self.uid.int, org=str(self.account.uid.int))
-        else:
-            crt_pem = None
-        self._crt = self._build_pobj(self.pcollections.String,
-                                     _POSTFIX_CLIENT_CRT,
-                                     create=crt_pem)
+            self._crt = self._build_pobj(self.pcollections.String,
+                                         _POSTFIX_CLIENT_CRT,
+                                         create=crt_pem)
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_CLIENT_CRT]
 
     def destroy(self):
         """Delete Account"""
 
         # Cleanup Objects
-        self._crt.rem()
+        self._rem_pobj("_crt", _POSTFIX_CLIENT_CRT)
 
         # Call Parent
         super().destroy()
@@ -751,10 +878,14 @@ class Client(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObje
     @property
     def crt(self):
         """Return Certificate"""
-        return self._crt.get_val()
+        return self._get_cached("_crt", _POSTFIX_CLIENT_CRT)
 
 class Permissions(datatypes.PermissionsObject, datatypes.ChildObject):
 
+    __slots__ = ('_v_perms', '_v_create', '_v_read', '_v_modify', '_v_delete')
+
+    reap_prefix = _PREFIX_PERMISSIONS
+
     def __init__(self, pbackend, pindex=None, create=False,
                  v_create=None, v_read=None,
                  v_modify=None, v_delete=None,
@@ -822,6 +953,13 @@ class Permissions(datatypes.PermissionsObject, datatypes.ChildObject):
         self._v_perms = datatypes.PlainObjIndex(self, perms_label, Verifier,
                                                 pindex=self.server.verifiers, init=v_perms)
 
+    @classmethod
+    def reap_postfixes(cls):
+        perms = [constants.PERM_CREATE, constants.PERM_READ, constants.PERM_MODIFY,
+                 constants.PERM_DELETE, constants.PERM_PERMS]
+        return super().reap_postfixes() + [_POSTFIX_VERIFIERS + _PERM_SEPERATOR + perm
+                                           for perm in perms]
+
     def destroy(self):
         """Delete Account"""
 
@@ -844,10 +982,8 @@ class Permissions(datatypes.PermissionsObject, datatypes.ChildObject):
         for verifier in verifiers:
             if isinstance(verifier, Verifier):
                 out.append(verifier.key)
-            elif isinstance(verifier, uuid.UUID):
-                out.append(str(verifier))
-            elif isinstance(verifier, str):
-                out.append(verifier)
+            elif isinstance(verifier, (uuid.UUID, str)):
+                out.append(self.val_to_key(verifier))
             else:
                 raise TypeError("Unsupported verifier type: '{}'".format(type(verifier)))
 
@@ -0,0 +1,935 @@
+# -*- coding: utf-8 -*-
+
+# Andy Sayler
+# Copyright 2015
+
+
+### Imports ###
+
+import abc
+import asyncio
+import functools
+import inspect
+import time
+import uuid
+
+import redis.asyncio
+
+from . import utility
+from . import datatypes
+
+
+### Constants ###
+
+# Keys and values follow the layout of the sync pcollections redis backend,
+# so both layers can serve the same database.
+
+_SCAN_BATCH_SIZE = datatypes._SCAN_BATCH_SIZE
+
+
+### Exceptions ###
+
+class ObjectDNE(datatypes.ObjectDNE):
+
+    def __init__(self, obj):
+
+        # Check Args
+        utility.check_isinstance(obj, PersistentObject)
+
+        # Call Grandparent
+        msg = "Object '{}' does not exist".format(obj.key)
+        Exception.__init__(self, msg)
+
+class ObjectExists(datatypes.ObjectExists):
+
+    def __init__(self, obj):
+
+        # Check Args
+        utility.check_isinstance(obj, ChildObject)
+
+        # Call Grandparent
+        msg = "Object '{}' already exists in parent '{}'".format(obj, obj.parent)
+        Exception.__init__(self, msg)
+
+class PObjectDNE(datatypes.PObjectDNE):
+
+    def __init__(self, pobj):
+
+        # Check Args
+        utility.check_isinstance(pobj, PObject)
+
+        # Call Grandparent
+        msg = "PObject '{}' does not exist".format(pobj.key)
+        Exception.__init__(self, msg)
+
+
+### Functions ###
+
+async def resolve(val):
+    """Return val, awaiting it first if it is awaitable"""
+
+    if inspect.isawaitable(val):
+        return await val
+    else:
+        return val
+
+
+### Backend ###
+
+class Backend(object):
+
+    # Weakly referenced by the datatypes registries
+    __slots__ = ('_redis', '__weakref__')
+
+    def __init__(self, client):
+        """Initialize Async Backend"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(client, redis.asyncio.Redis)
+
+        # Save Args
+        self._redis = client
+
+    @classmethod
+    def from_db(cls, db=0, **kwargs):
+        return cls(redis.asyncio.Redis(db=db, **kwargs))
+
+    @property
+    def redis(self):
+        return self._redis
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+### PObjects ###
+
+class PObject(object):
+
+    __slots__ = ('_pbackend', '_key')
+
+    # Redis drops empty containers, so only scalars can be checked for existence
+    checked = True
+
+    def __init__(self, pbackend, key):
+        """Initialize PObject Handle"""
+
+        # Call Parent
+        super().__init__()
+
+        # Save Args
+        self._pbackend = pbackend
+        self._key = key
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def redis(self):
+        return self._pbackend.redis
+
+    async def exists(self):
+        return bool(await self.redis.exists(self.key))
+
+    async def rem(self):
+        await self.redis.delete(self.key)
+
+class String(PObject):
+
+    __slots__ = ()
+
+    def _create_args(self, val):
+        return ("SET", [val, "NX"])
+
+    async def get_val(self):
+        val = await self.redis.get(self.key)
+        if val is None:
+            raise PObjectDNE(self)
+        return datatypes.decode_val(val)
+
+    async def set_val(self, val):
+        await self.redis.set(self.key, val)
+
+class Set(PObject):
+
+    __slots__ = ()
+
+    checked = False
+
+    def _create_args(self, val):
+        return ("SADD", list(val)) if val else None
+
+    async def get_val(self):
+        return set(datatypes.decode_val(val) for val in await self.redis.smembers(self.key))
+
+    async def add(self, *vals):
+        await self.redis.sadd(self.key, *vals)
+
+    async def discard(self, *vals):
+        await self.redis.srem(self.key, *vals)
+
+    async def contains(self, val):
+        return bool(await self.redis.sismember(self.key, val))
+
+    async def length(self):
+        return await self.redis.scard(self.key)
+
+class Dictionary(PObject):
+
+    __slots__ = ()
+
+    checked = False
+
+    def _create_args(self, val):
+        args = []
+        for field, item in val.items():
+            args += [field, item]
+        return ("HSET", args) if args else None
+
+    async def get_val(self):
+        vals = await self.redis.hgetall(self.key)
+        return {datatypes.decode_val(k): datatypes.decode_val(v) for k, v in vals.items()}
+
+    async def get_item(self, field):
+        val = await self.redis.hget(self.key, field)
+        if val is None:
+            raise KeyError(field)
+        return datatypes.decode_val(val)
+
+    async def set_item(self, field, val):
+        await self.redis.hset(self.key, field, val)
+
+class List(PObject):
+
+    __slots__ = ()
+
+    checked = False
+
+    def _create_args(self, val):
+        return ("RPUSH", list(val)) if val else None
+
+    async def get_val(self):
+        return [datatypes.decode_val(val) for val in await self.redis.lrange(self.key, 0, -1)]
+
+
+### Objects ###
+
+def _batched_destroy(destroy):
+    """Wrap destroy so the outermost call removes everything in one transaction"""
+
+    @functools.wraps(destroy)
+    async def wrapper(self, *args, **kwargs):
+
+        # Nested super() calls join the outer batch
+        if self._removals is not None:
+            return await destroy(self, *args, **kwargs)
+
+        self._removals = []
+        try:
+            ret = await destroy(self, *args, **kwargs)
+        except Exception:
+            self._removals = None
+            raise
+        await self._flush_removals()
+        return ret
+
+    return wrapper
+
+class _PersistentObjectMeta(type):
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+
+        if 'destroy' in namespace:
+            namespace['destroy'] = _batched_destroy(namespace['destroy'])
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __call__(cls, *args, **kwargs):
+        """Return an awaitable that constructs the Object and opens its pobjs"""
+
+        async def construct():
+            obj = super(_PersistentObjectMeta, cls).__call__(*args, **kwargs)
+            await obj._open_pobjs()
+            return obj
+
+        return construct()
+
+class PersistentObject(object, metaclass=_PersistentObjectMeta):
+
+    # Mixin state lives here too so mixins can share one slot layout
+    __slots__ = ('_pbackend', '_scheme', '_key', '_prefix', '_create',
+                 '_pending', '_writes', '_removals',
+                 '_uid', '_pindex', '_registering')
+
+    def __init__(self, pbackend, key=None, prefix=None, create=False):
+
+        #                      create
+        # OPEN_EXISTING        False
+        # CREATE_OR_OPEN       True
+
+        # Check args
+        utility.check_isinstance(pbackend, Backend)
+        utility.check_isinstance(key, str)
+        if prefix is not None:
+            utility.check_isinstance(prefix, str)
+
+        # Call Parent
+        super().__init__()
+
+        # Save Attrs
+        self._pbackend = pbackend
+        self._scheme = datatypes.key_scheme(pbackend)
+        self._key = key
+        self._prefix = prefix
+        self._create = create
+
+        # Defer pobj writes and checks until construction completes
+        self._pending = []
+        self._writes = []
+        self._removals = None
+
+        # Tag this creation for the sync value cache
+        if create:
+            self._build_pobj(String, datatypes._NONCE_POSTFIX, create=uuid.uuid4().hex)
+
+    async def destroy(self):
+
+        # Cleanup Generation
+        self._queue_rem("delete", self.generation_pkey)
+
+        # Cleanup Nonce
+        self._queue_rem("delete", self._build_pkey(postfix=datatypes._NONCE_POSTFIX))
+
+    @property
+    def pbackend(self):
+        return self._pbackend
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @property
+    def generation_pkey(self):
+        return self._build_pkey(postfix=datatypes._GENERATION_POSTFIX)
+
+    async def generation(self):
+        """Return the count of mutations to this object, 0 if none since creation"""
+
+        val = await self.pbackend.redis.get(self.generation_pkey)
+        return int(val) if val else 0
+
+    def __repr__(self):
+        return "{:s}_{:s}".format(type(self).__name__, self.key)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        if type(other) == type(self):
+            return self.key == other.key
+        else:
+            return False
+
+    def _build_pkey(self, postfix):
+        return datatypes.build_pkey(self.key, prefix=self.prefix, postfix=postfix,
+                                    scheme=self._scheme)
+
+    def _build_pobj(self, obj_type, postfix, create=None):
+
+        #                      create
+        # OPEN_EXISTING         None
+        # CREATE_OR_OPEN        Val
+
+        pobj = obj_type(self.pbackend, self._build_pkey(postfix=postfix))
+        if create is not None:
+            write = pobj._create_args(create)
+            if write is not None:
+                self._writes.append((pobj.key, write))
+        if pobj.checked:
+            self._pending.append(("exists", (pobj.key,), functools.partial(PObjectDNE, pobj)))
+        return pobj
+
+    async def _open_pobjs(self):
+        """Write new pobjs and run all deferred checks in one round trip"""
+
+        writes = self._writes
+        pending = self._pending
+        self._writes = None
+        self._pending = None
+        await self._check_pending(writes, pending)
+
+    async def _check_pending(self, writes, pending):
+
+        if not (writes or pending):
+            return
+
+        pipe = self.pbackend.redis.pipeline(transaction=False)
+        for pkey, (command, args) in writes:
+            pipe.execute_command(command, pkey, *args)
+        for command, args, _ in pending:
+            getattr(pipe, command)(*args)
+        results = (await pipe.execute())[-len(pending):] if pending else []
+
+        for (_, _, error), result in zip(pending, results):
+            if not result:
+                raise error()
+
+    def _queue_rem(self, command, *args):
+        """Queue a removal for the destroy transaction"""
+        self._removals.append((command, args))
+
+    def _rem_pobj(self, pobj):
+        self._queue_rem("delete", pobj.key)
+
+    async def _flush_removals(self):
+        """Run all queued removals in a single MULTI/EXEC transaction"""
+
+        removals = self._removals
+        self._removals = None
+        if not removals:
+            return
+
+        pipe = self.pbackend.redis.pipeline(transaction=True)
+        for command, args in removals:
+            getattr(pipe, command)(*args)
+        await pipe.execute()
+
+    def val_to_key(self, val):
+
+        if isinstance(val, str):
+            return self._scheme.normalize_key(val)
+        elif isinstance(val, uuid.UUID):
+            return self._scheme.encode_uid(val)
+        elif isinstance(val, PersistentObject):
+            return val.key
+        else:
+            raise TypeError("val must be a str, uuid.UUID, or PersistentObject")
+
+    def val_to_uid(self, val):
+
+        if isinstance(val, uuid.UUID):
+            return val
+        elif isinstance(val, str):
+            return self._scheme.decode_uid(val)
+        elif isinstance(val, UUIDObject):
+            return val.uid
+        else:
+            raise TypeError("val must be a uuid.UUID, str, or UUIDObject")
+
+    async def val_to_obj(self, val, obj_type, **kwargs):
+
+        if isinstance(val, obj_type):
+            return val
+        elif isinstance(val, str):
+            if issubclass(obj_type, PersistentObject):
+                kwargs['key'] = val
+            else:
+                raise TypeError("val can not be str unless obj_type is PersistentObject")
+        elif isinstance(val, uuid.UUID):
+            if issubclass(obj_type, UUIDObject):
+                kwargs['uid'] = val
+            else:
+                raise TypeError("val can not be uuid.UUID unless obj_type is UUIDObject")
+        else:
+            raise TypeError("val must be an {}, str, or uuid.UUID".format(obj_type))
+
+        return await obj_type(self.pbackend, **kwargs)
+
+class UUIDObject(PersistentObject):
+
+    __slots__ = ()
+
+    def __init__(self, pbackend, key=None, uid=None, create=False, **kwargs):
+        """Initialize Object"""
+
+        # Check Args
+        if key:
+            utility.check_isinstance(key, str)
+        if uid:
+            utility.check_isinstance(uid, uuid.UUID)
+
+        # Setup key and uid
+        scheme = datatypes.key_scheme(pbackend)
+        if not key:
+            if not uid:
+                if create:
+                    uid = uuid.uuid4()
+                    key = scheme.encode_uid(uid)
+                else:
+                    raise TypeError("Requires either uid or key")
+            else:
+                key = scheme.encode_uid(uid)
+        else:
+            key = scheme.normalize_key(key)
+        if not uid:
+            uid = scheme.decode_uid(key)
+
+        # Call Parent
+        super().__init__(pbackend, key=key, create=create, **kwargs)
+
+        # Save UUID
+        self._uid = uid
+
+    @property
+    def uid(self):
+        return self._uid
+
+class UserDataObject(PersistentObject):
+
+    __slots__ = ()
+
+    def __init__(self, pbackend, create=False, userdata={}, **kwargs):
+        """Initialize Object"""
+
+        # Check Args
+        if create:
+            utility.check_isinstance(userdata, dict)
+
+        # Call Parent
+        super().__init__(pbackend, create=create, **kwargs)
+
+        # Setup Metadata
+        if create:
+            self._build_pobj(Dictionary, datatypes._USERDATA_POSTFIX, create=userdata)
+
+    @property
+    def _userdata(self):
+        return Dictionary(self.pbackend, self._build_pkey(postfix=datatypes._USERDATA_POSTFIX))
+
+    async def destroy(self):
+        """Cleanup Object"""
+
+        # Cleanup pbackend object
+        self._rem_pobj(self._userdata)
+
+        # Call Parent
+        await super().destroy()
+
+    @property
+    async def userdata(self):
+        return await self._userdata.get_val()
+
+class ServerObject(PersistentObject):
+
+    __slots__ = ()
+
+    def __init__(self, pbackend, create=False, prefix="srv", **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, prefix=prefix, create=create, **kwargs)
+
+class ChildObject(PersistentObject):
+
+    __slots__ = ()
+
+    def __init__(self, pbackend, create=False, pindex=None, **kwargs):
+        """Initialize Child"""
+
+        #                      create
+        # OPEN_EXISTING        False
+        # CREATE_OR_OPEN       True
+
+        # Check Input
+        utility.check_isinstance(pindex, ChildIndex)
+        if pindex.parent.pbackend != pbackend:
+            raise TypeError("parent and child must have common pbackend")
+
+        # Call Parent
+        super().__init__(pbackend, create=create, **kwargs)
+
+        # Save Attrs
+        self._pindex = pindex
+
+        # Register with Index once the rest of the object is written
+        self._registering = create
+        if not create:
+            self._pending.append(("sismember", (self._pindex.pkey, self.key),
+                                  functools.partial(ObjectDNE, self)))
+
+    async def destroy(self):
+        """Cleanup Object"""
+
+        # Unregister with Index
+        self._queue_rem("srem", self._pindex.pkey, self.key)
+        if self._pindex.ordered:
+            self._queue_rem("zrem", self._pindex.order_pkey, self.key)
+        self._queue_rem("incr", self.parent.generation_pkey)
+
+        # Call Parent
+        await super().destroy()
+
+    async def _check_pending(self, writes, pending):
+        """Write new pobjs, check the rest and register with the index in one script"""
+
+        if not self._registering:
+            return await super()._check_pending(writes, pending)
+        self._registering = False
+
+        # Pobjs written by the script need no check
+        written = set([pkey for pkey, _ in writes])
+        pending = [entry for entry in pending if entry[1][0] not in written]
+
+        keys = [args[0] for _, args, _ in pending]
+        keys += [pkey for pkey, _ in writes]
+        keys.append(self._pindex.pkey)
+        if self._pindex.ordered:
+            keys.append(self._pindex.order_pkey)
+        keys.append(self.parent.generation_pkey)
+        args = datatypes.register_args(pending, writes, self.key, time.time())
+        script = self.pbackend.redis.register_script(datatypes._REGISTER_SCRIPT)
+        ret = int(await script(keys=keys, args=args))
+        if ret < 0:
+            raise ObjectExists(self)
+        elif ret > 0:
+            _, _, error = pending[ret - 1]
+            raise error()
+
+    @property
+    def pindex(self):
+        return self._pindex
+
+    @property
+    def parent(self):
+        return self._pindex.parent
+
+    async def exists(self):
+        return await self._pindex.exists(self.key)
+
+
+### Indexes ###
+
+class _SetIndex(object):
+
+    __slots__ = ('_owner', '_label')
+
+    def __init__(self, owner, label):
+        """Initialize Set Index"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(owner, PersistentObject)
+        utility.check_isinstance(label, str)
+
+        # Save Args
+        self._owner = owner
+        self._label = label
+
+    @property
+    def pkey(self):
+        return self._owner._build_pkey(postfix=self._label)
+
+    @property
+    def _set(self):
+        return Set(self._owner.pbackend, self.pkey)
+
+    async def length(self):
+        return await self._set.length()
+
+    async def by_key(self):
+        return await self._set.get_val()
+
+    async def by_uid(self):
+        return set([self._owner.val_to_uid(key) for key in await self.by_key()])
+
+    async def iter_by_key(self, batch_size=None):
+        """Yield members in batches of about batch_size with SSCAN"""
+
+        if batch_size is None:
+            batch_size = _SCAN_BATCH_SIZE
+        cursor = 0
+        while True:
+            cursor, vals = await self._owner.pbackend.redis.sscan(self.pkey, cursor,
+                                                                  count=batch_size)
+            for val in vals:
+                yield datatypes.decode_val(val)
+            if not int(cursor):
+                break
+
+    async def page_by_key(self, cursor=None, count=None):
+        """Return (cursor, members) for one page, cursor is None when done"""
+
+        if count is None:
+            count = _SCAN_BATCH_SIZE
+        cursor = int(cursor) if cursor else 0
+        cursor, vals = await self._owner.pbackend.redis.sscan(self.pkey, cursor, count=count)
+        cursor = int(cursor)
+        return (str(cursor) if cursor else None, [datatypes.decode_val(val) for val in vals])
+
+    async def _open_all(self, keys, open_obj):
+        """Open an object per key concurrently"""
+        return await asyncio.gather(*[open_obj(key) for key in keys])
+
+class ChildIndex(_SetIndex):
+
+    __slots__ = ('_type_child', '_ordered')
+
+    def __init__(self, parent, type_child, label, ordered=False):
+        """Initialize Child Index"""
+
+        # Call Parent
+        super().__init__(parent, label)
+
+        # Check Args
+        utility.check_issubclass(type_child, ChildObject)
+        utility.check_isinstance(ordered, bool)
+
+        # Save Args
+        self._type_child = type_child
+        self._ordered = ordered
+
+    async def destroy(self):
+        """Cleanup Index"""
+
+        keys = [self.pkey]
+        if self.ordered:
+            keys.append(self.order_pkey)
+        if self.parent._removals is None:
+            await self.parent.pbackend.redis.delete(*keys)
+        else:
+            self.parent._queue_rem("delete", *keys)
+
+    @property
+    def parent(self):
+        return self._owner
+
+    @property
+    def type_child(self):
+        return self._type_child
+
+    @property
+    def ordered(self):
+        return self._ordered
+
+    @property
+    def order_pkey(self):
+        return datatypes.build_pkey(self.pkey, postfix=datatypes._ORDER_POSTFIX,
+                                    scheme=self.parent._scheme)
+
+    async def create(self, **kwargs):
+        return await self.type_child(self.parent.pbackend, pindex=self, create=True, **kwargs)
+
+    async def get(self, **kwargs):
+        return await self.type_child(self.parent.pbackend, pindex=self, create=False, **kwargs)
+
+    async def exists(self, val):
+        return await self._set.contains(self.parent.val_to_key(val))
+
+    async def exists_many(self, vals):
+        """Return a list of membership flags for vals in one round trip"""
+
+        keys = [self.parent.val_to_key(val) for val in vals]
+        if not keys:
+            return []
+        pipe = self.parent.pbackend.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.sismember(self.pkey, key)
+        return [bool(found) for found in await pipe.execute()]
+
+    async def by_obj(self):
+        return set(await self._open_all(await self.by_key(), self._open_key))
+
+    async def _open_key(self, key):
+        return await self.parent.val_to_obj(key, self.type_child, pindex=self)
+
+    async def iter_by_obj(self, batch_size=None):
+        async for key in self.iter_by_key(batch_size=batch_size):
+            yield await self._open_key(key)
+
+    async def range_by_key(self, start=0, stop=-1, reverse=False):
+        """Return keys ranked start..stop (inclusive) by creation time"""
+
+        if not self.ordered:
+            raise TypeError("Index '{}' is not ordered".format(self.pkey))
+        if reverse:
+            keys = await self.parent.pbackend.redis.zrevrange(self.order_pkey, start, stop)
+        else:
+            keys = await self.parent.pbackend.redis.zrange(self.order_pkey, start, stop)
+        return [datatypes.decode_val(key) for key in keys]
+
+    async def range_by_obj(self, start=0, stop=-1, reverse=False):
+        keys = await self.range_by_key(start=start, stop=stop, reverse=reverse)
+        return await self._open_all(keys, self._open_key)
+
+class _MemberIndex(_SetIndex, abc.ABC):
+
+    __slots__ = ('_generator', '_type_member', '_extra_kwargs')
+
+    def __init__(self, obj, label, generator, type_member, **extra_kwargs):
+        """Initialize Member Index"""
+
+        # Call Parent
+        super().__init__(obj, label)
+
+        # Check Args
+        if not hasattr(generator, '__call__'):
+            raise TypeError("generator must be callable")
+        utility.check_issubclass(type_member, PersistentObject)
+
+        # Save Args
+        self._generator = generator
+        self._type_member = type_member
+        self._extra_kwargs = extra_kwargs
+
+    @property
+    def obj(self):
+        return self._owner
+
+    @property
+    def type_member(self):
+        return self._type_member
+
+    async def _peer(self, key):
+        """Return the peer index for key, the generator may be sync or async"""
+
+        peer = await resolve(self._generator(key, **self._extra_kwargs))
+        self._check_peer(peer)
+        return peer
+
+    @abc.abstractmethod
+    def _check_peer(self, peer):
+        """Raise TypeError unless peer is the other side of this index"""
+        pass
+
+    async def destroy(self):
+        """Cleanup Index"""
+
+        peers = await asyncio.gather(*[self._peer(key) for key in await self.by_key()])
+        removals = []
+        for peer in peers:
+            removals.append(("srem", peer.pkey, self.obj.key))
+            removals.append(("incr", peer.obj.generation_pkey))
+        removals.append(("delete", self.pkey))
+
+        if self.obj._removals is None:
+            pipe = self.obj.pbackend.redis.pipeline(transaction=True)
+            for command, *args in removals:
+                getattr(pipe, command)(*args)
+            await pipe.execute()
+        else:
+            for command, *args in removals:
+                self.obj._queue_rem(command, *args)
+
+    async def ismember(self, val):
+        return await self._set.contains(self.obj.val_to_key(val))
+
+    async def _open_key(self, key):
+        return await self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
+
+    async def by_obj(self):
+        return set(await self._open_all(await self.by_key(), self._open_key))
+
+    async def iter_by_obj(self, batch_size=None):
+        async for key in self.iter_by_key(batch_size=batch_size):
+            yield await self._open_key(key)
+
+class MasterObjIndex(_MemberIndex):
+
+    __slots__ = ()
+
+    def _check_peer(self, peer):
+        utility.check_isinstance(peer, SlaveObjIndex)
+
+    async def add(self, val):
+        await self.add_many([val])
+
+    async def remove(self, val):
+        await self.remove_many([val])
+
+    async def add_many(self, vals):
+        """Link each of vals to this object, updating both sides in one transaction"""
+        await self._link(vals, "sadd")
+
+    async def remove_many(self, vals):
+        """Unlink each of vals from this object, updating both sides in one transaction"""
+        await self._link(vals, "srem")
+
+    async def _link(self, vals, command):
+
+        keys = [self.obj.val_to_key(val) for val in vals]
+        if not keys:
+            return
+
+        slvs = await asyncio.gather(*[self._peer(key) for key in keys])
+        for slv in slvs:
+            utility.check_isinstance(slv.obj, self.type_member)
+            utility.check_isinstance(self.obj, slv.type_member)
+        pipe = self.obj.pbackend.redis.pipeline(transaction=True)
+        getattr(pipe, command)(self.pkey, *keys)
+        for slv in slvs:
+            getattr(pipe, command)(slv.pkey, self.obj.key)
+        pipe.incr(self.obj.generation_pkey)
+        for slv in slvs:
+            pipe.incr(slv.obj.generation_pkey)
+        await pipe.execute()
+
+class SlaveObjIndex(_MemberIndex):
+
+    __slots__ = ()
+
+    def _check_peer(self, peer):
+        utility.check_isinstance(peer, MasterObjIndex)
+
+class PlainObjIndex(_SetIndex):
+
+    __slots__ = ('_type_member', '_extra_kwargs')
+
+    def __init__(self, obj, label, type_member, **extra_kwargs):
+        """Initialize Member Index"""
+
+        # Call Parent
+        super().__init__(obj, label)
+
+        # Check Args
+        utility.check_issubclass(type_member, PersistentObject)
+
+        # Save Args
+        self._type_member = type_member
+        self._extra_kwargs = extra_kwargs
+
+    async def destroy(self):
+        """Cleanup Index"""
+
+        if self.obj._removals is None:
+            await self._set.rem()
+        else:
+            self.obj._queue_rem("delete", self.pkey)
+
+    @property
+    def obj(self):
+        return self._owner
+
+    @property
+    def type_member(self):
+        return self._type_member
+
+    async def add(self, val):
+        await self._update("sadd", self.obj.val_to_key(val))
+
+    async def remove(self, val):
+        await self._update("srem", self.obj.val_to_key(val))
+
+    async def _update(self, command, key):
+        """Update the set and bump the owner's generation in one transaction"""
+
+        pipe = self.obj.pbackend.redis.pipeline(transaction=True)
+        getattr(pipe, command)(self.pkey, key)
+        pipe.incr(self.obj.generation_pkey)
+        await pipe.execute()
+
+    async def ismember(self, val):
+        return await self._set.contains(self.obj.val_to_key(val))
+
+    async def _open_key(self, key):
+        return await self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
+
+    async def by_obj(self):
+        return set(await self._open_all(await self.by_key(), self._open_key))
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+# Andy Sayler
+# Copyright 2016
+
+
+### Imports ###
+
+import functools
+import json
+import logging
+import queue
+import threading
+import zlib
+
+from . import utility
+from . import datatypes
+from . import membackend
+from . import storage
+from . import accesscontrol
+
+
+### Constants ###
+
+_BATCH_SIZE = 500
+_RESTORE_WORKERS = 4
+_QUEUED_BATCHES = 4
+
+TYPE_STRING = "string"
+TYPE_LIST = "list"
+TYPE_SET = "set"
+TYPE_HASH = "hash"
+
+_MEMORY_TYPES = {"String": TYPE_STRING,
+                 "List": TYPE_LIST,
+                 "Set": TYPE_SET,
+                 "Dictionary": TYPE_HASH}
+
+_MEMORY_TYPE_NAMES = {TYPE_STRING: "MutableString",
+                      TYPE_LIST: "MutableList",
+                      TYPE_SET: "MutableSet",
+                      TYPE_HASH: "MutableDictionary"}
+
+# Servers at the roots of the object graph, everything else hangs off their indexes
+_ROOTS = [(storage.StorageServer, storage._KEY_STORAGESRV),
+          (accesscontrol.AccessControlServer, accesscontrol._KEY_ACSRV)]
+
+
+### Logging ###
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+logger.addHandler(logging.NullHandler())
+
+
+### Functions ###
+
+def dump(pbackend, out, batch_size=_BATCH_SIZE):
+    """Write each object in pbackend to out as an NDJSON record, returning the record count"""
+
+    # Objects are found by walking each server's indexes with the layouts their
+    # classes declare for the reaper, so reap jobs, objects left by an unfinished
+    # destroy and internal keys are never written. Children are read batch_size
+    # at a time, so memory use is bounded by batch_size objects
+
+    # Indexes are walked with SSCAN, so this is not a snapshot: writes made while
+    # it runs may be missed or caught half applied. Dump a quiesced database, or a
+    # replica with replication paused, to get a consistent copy
+
+    utility.check_isinstance(batch_size, int)
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    redis = datatypes.pbackend_redis(pbackend)
+    if redis is None:
+        utility.check_isinstance(pbackend, membackend.MemoryBackend)
+        read = functools.partial(_read_memory, pbackend)
+    else:
+        read = functools.partial(_read_redis, redis)
+
+    walk = _Walk(pbackend, read, batch_size)
+    cnt = 0
+    for obj_type, key in _ROOTS:
+        for record in walk.objects(obj_type, [key]):
+            out.write(json.dumps(record, separators=(',', ':')) + "\n")
+            cnt += 1
+    return cnt
+
+def restore(pbackend, lines, workers=_RESTORE_WORKERS, batch_size=_BATCH_SIZE):
+    """Write the NDJSON records in lines to pbackend, returning the record count"""
+
+    # Each record replaces the pobjs of its object and adds the object to the
+    # index of its parent. Objects missing from the dump are left alone, so this
+    # merges into existing data; restore into an empty database to get exactly
+    # what was dumped. Keys are restored as dumped, so pbackend must use the key
+    # scheme of the dumped database
+
+    utility.check_isinstance(workers, int)
+    utility.check_isinstance(batch_size, int)
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    redis = datatypes.pbackend_redis(pbackend)
+    if redis is None:
+        return _restore_memory(pbackend, _parse(lines))
+    else:
+        return _restore_redis(redis, _parse(lines), workers, batch_size)
+
+def _text(val):
+    """Return a raw redis value as str, keeping any undecodable bytes"""
+
+    if isinstance(val, bytes):
+        return val.decode('utf-8', 'surrogateescape')
+    else:
+        return val
+
+def _raw(val):
+    """Invert _text"""
+    return val.encode('utf-8', 'surrogateescape')
+
+def _grouped(vals, size):
+
+    group = []
+    for val in vals:
+        group.append(val)
+        if len(group) >= size:
+            yield group
+            group = []
+    if group:
+        yield group
+
+def _decode(rtype, val):
+    """Return a pobj value as a JSON friendly value"""
+
+    if rtype == TYPE_HASH:
+        return {_text(field): _text(item) for field, item in val.items()}
+    elif rtype == TYPE_SET:
+        # Sorted so dumps of unchanged data can be diffed
+        return sorted([_text(item) for item in val])
+    elif rtype == TYPE_LIST:
+        return [_text(item) for item in val]
+    else:
+        return _text(val)
+
+def _parse(lines):
+
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        for pkey, (rtype, _) in record['pobjs'].items():
+            if rtype not in _MEMORY_TYPE_NAMES:
+                raise ValueError("Unknown type '{}' for '{}'".format(rtype, pkey))
+        yield record
+
+class _Walk(object):
+
+    def __init__(self, pbackend, read, batch_size):
+        """Initialize depth first walk of the objects below the servers in pbackend"""
+
+        # Call Parent
+        super().__init__()
+
+        # Save Args
+        self._pbackend = pbackend
+        self._scheme = datatypes.key_scheme(pbackend)
+        self._read = read
+        self._batch_size = batch_size
+
+    def objects(self, obj_type, keys, index=None, order_pkey=None):
+        """Yield the records of the obj_type objects at keys, each followed by its children"""
+
+        postfixes = obj_type.reap_postfixes()
+        pkeys = [self._pkey(obj_type, key, postfix) for key in keys for postfix in postfixes]
+        vals, scores = self._read(pkeys, order_pkey, keys)
+
+        cnt = len(postfixes)
+        for i, key in enumerate(keys):
+
+            # Members with no pobjs left are still being created or destroyed
+            found = zip(pkeys[i*cnt:(i+1)*cnt], vals[i*cnt:(i+1)*cnt])
+            pobjs = {pkey: val for pkey, val in found if val is not None}
+            if not pobjs:
+                continue
+
+            record = {'class': obj_type.__name__, 'key': key, 'pobjs': pobjs}
+            if index is not None:
+                record['index'] = index
+            if order_pkey is not None and scores[i] is not None:
+                record['order'] = [order_pkey, scores[i]]
+            yield record
+
+            for label, type_child, ordered in obj_type.reap_indexes():
+                yield from self._children(obj_type, key, label, type_child, ordered)
+
+    def _children(self, obj_type, key, label, type_child, ordered):
+
+        pkey = self._pkey(obj_type, key, label)
+        order_pkey = None
+        if ordered:
+            order_pkey = datatypes.build_pkey(pkey, postfix=datatypes._ORDER_POSTFIX,
+                                              scheme=self._scheme)
+        load = functools.partial(self._read_members, pkey)
+        members = datatypes.scan_pset(self._pbackend, pkey, load, batch_size=self._batch_size)
+        for batch in _grouped(members, self._batch_size):
+            yield from self.objects(type_child, batch, index=pkey, order_pkey=order_pkey)
+
+    def _pkey(self, obj_type, key, postfix):
+        return datatypes.build_pkey(key, prefix=obj_type.reap_prefix, postfix=postfix,
+                                    scheme=self._scheme)
+
+    def _read_members(self, pkey):
+
+        vals, _ = self._read([pkey], None, [])
+        return vals[0][1] if vals[0] is not None else []
+
+
+### Redis ###
+
+def _read_redis(redis, pkeys, order_pkey, keys):
+    """Return the [type, value] at each of pkeys and the score of each of keys in two rounds"""
+
+    pipe = redis.pipeline(transaction=False)
+    for pkey in pkeys:
+        pipe.type(pkey)
+    rtypes = [_text(rtype) for rtype in pipe.execute()]
+
+    pipe = redis.pipeline(transaction=False)
+    for pkey, rtype in zip(pkeys, rtypes):
+        if rtype == TYPE_STRING:
+            pipe.get(pkey)
+        elif rtype == TYPE_LIST:
+            pipe.lrange(pkey, 0, -1)
+        elif rtype == TYPE_SET:
+            pipe.smembers(pkey)
+        elif rtype == TYPE_HASH:
+            pipe.hgetall(pkey)
+        elif rtype != "none":
+            logger.warning("Skipping '{}' of unsupported type '{}'".format(pkey, rtype))
+    if order_pkey is not None:
+        for key in keys:
+            pipe.zscore(order_pkey, key)
+    replies = iter(pipe.execute())
+
+    vals = []
+    for rtype in rtypes:
+        if rtype in _MEMORY_TYPE_NAMES:
+            vals.append([rtype, _decode(rtype, next(replies))])
+        else:
+            vals.append(None)
+    scores = list(replies)
+    return vals, scores
+
+def _restore_redis(redis, records, workers, batch_size):
+    """Write records with pipelined batches spread over worker threads"""
+
+    # Each object always goes to the same worker, so its records are applied in order
+    jobs = [queue.Queue(maxsize=_QUEUED_BATCHES) for i in range(workers)]
+    errors = []
+    threads = []
+    for i in range(workers):
+        thread = threading.Thread(target=_restore_worker, args=(redis, jobs[i], errors),
+                                  name="tutamen-restore-{}".format(i))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    batches = [[] for i in range(workers)]
+    cnt = 0
+    try:
+        for record in records:
+            i = zlib.crc32(_raw(record['key'])) % workers
+            batches[i].append(record)
+            if len(batches[i]) >= batch_size:
+                jobs[i].put(batches[i])
+                batches[i] = []
+            cnt += 1
+            if errors:
+                break
+        for i in range(workers):
+            if batches[i]:
+                jobs[i].put(batches[i])
+    finally:
+        for i in range(workers):
+            jobs[i].put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return cnt
+
+def _restore_worker(redis, jobs, errors):
+
+    while True:
+        batch = jobs.get()
+        if batch is None:
+            return
+        if errors:
+            # Keep draining so the reader never blocks
+            continue
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for record in batch:
+                _queue_write(pipe, record)
+            pipe.execute()
+        except Exception as err:
+            logger.exception("Failed to restore batch")
+            errors.append(err)
+
+def _queue_write(pipe, record):
+
+    for pkey, (rtype, val) in record['pobjs'].items():
+        pkey = _raw(pkey)
+        pipe.delete(pkey)
+        if rtype == TYPE_STRING:
+            pipe.set(pkey, _raw(val))
+        elif not val:
+            # Redis drops empty containers
+            continue
+        elif rtype == TYPE_LIST:
+            pipe.rpush(pkey, *[_raw(item) for item in val])
+        elif rtype == TYPE_SET:
+            pipe.sadd(pkey, *[_raw(item) for item in val])
+        else:
+            pipe.hset(pkey, mapping={_raw(field): _raw(item) for field, item in val.items()})
+
+    key = _raw(record['key'])
+    if 'index' in record:
+        pipe.sadd(_raw(record['index']), key)
+    if 'order' in record:
+        order_pkey, score = record['order']
+        pipe.zadd(_raw(order_pkey), {key: score})
+
+
+### Memory ###
+
+def _read_memory(pbackend, pkeys, order_pkey, keys):
+    """Return the [type, value] at each of pkeys and the score of each of keys"""
+
+    vals = []
+    for pkey in pkeys:
+        item = pbackend.item(pkey)
+        if item is None:
+            vals.append(None)
+        else:
+            rtype = _MEMORY_TYPES[item[0]]
+            # Compressed secrets hold bytes
+            vals.append([rtype, _decode(rtype, item[1])])
+
+    scores = []
+    if order_pkey is not None:
+        # Without redis, ordered indexes keep their scores in a dictionary
+        item = pbackend.item(order_pkey)
+        created = item[1] if item is not None else {}
+        scores = [float(created[key]) if key in created else None for key in keys]
+    return vals, scores
+
+def _restore_memory(pbackend, records):
+
+    utility.check_isinstance(pbackend, membackend.MemoryBackend)
+
+    pcollections = pbackend.pcollections
+    cnt = 0
+    for record in records:
+        for pkey, (rtype, val) in record['pobjs'].items():
+            obj_type = getattr(pcollections, _MEMORY_TYPE_NAMES[rtype])
+            obj_type(pkey).rem()
+            obj_type(pkey, create=val)
+
+        key = record['key']
+        if 'index' in record:
+            pcollections.MutableSet(record['index'], create=set()).add(key)
+        if 'order' in record:
+            order_pkey, score = record['order']
+            pcollections.MutableDictionary(order_pkey, create={})[key] = repr(float(score))
+        cnt += 1
+
+    return cnt
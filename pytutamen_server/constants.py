@@ -37,3 +37,6 @@ AUTHZ_STATUS_NEW = "pending"
 AUTHZ_STATUS_APPROVED = "approved"
 AUTHZ_STATUS_DENIED = "denied"
 AUTHZ_STATUS_FAILED = "failed"
+
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_TYPES = [COMPRESSION_ZLIB]
@@ -7,13 +7,27 @@
 ### Imports ###
 
 import abc
+import base64
+import functools
+import json
+import logging
+import queue
+import sys
+import threading
+import time
 import uuid
+import weakref
+
+from collections import OrderedDict
 
 from pcollections import abc_base
 from pcollections import backends
 from pcollections import collections
 
+from redis import exceptions as redis_exceptions
+
 from . import utility
+from . import membackend
 
 
 ### Constants ###
@@ -21,6 +35,156 @@ from . import utility
 _SEPERATOR = "_"
 
 _USERDATA_POSTFIX = "userdata"
+_FIELDS_POSTFIX = "fields"
+_ORDER_POSTFIX = "created"
+_GENERATION_POSTFIX = "generation"
+_NONCE_POSTFIX = "nonce"
+
+_REAP_PREFIX = "reap"
+_REAP_JOBS_PKEY = "tutamen_reap_jobs"
+_KEY_SCHEME_PKEY = "tutamen_key_scheme"
+
+_VALUE_CACHE_BYTES = 16 * 1024 * 1024
+_GENERATION_CACHE_ITEMS = 4096
+_SCAN_BATCH_SIZE = 500
+_REAP_BATCH_SIZE = 100
+
+_scope = threading.local()
+
+# Keyed weakly so dropped backends don't linger
+_factories = weakref.WeakKeyDictionary()
+_factories_lock = threading.Lock()
+
+_key_codes = {}
+_key_schemes = weakref.WeakKeyDictionary()
+
+# KEYS: pobjs to check, pobjs to write, the index set, optionally the ordered
+#       index, then the parent generation counter
+# ARGV: number of pobjs to check, number of pobjs to write, child key, creation
+#       score, then a command, argument count and arguments per pobj to write
+_REGISTER_SCRIPT = """
+local cnt = tonumber(ARGV[1])
+local wcnt = tonumber(ARGV[2])
+local idx = cnt + wcnt + 1
+if redis.call('SISMEMBER', KEYS[idx], ARGV[3]) == 1 then
+    return -1
+end
+for i = 1, cnt do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        return i
+    end
+end
+local pos = 5
+for i = 1, wcnt do
+    local last = pos + 1 + tonumber(ARGV[pos + 1])
+    if redis.call('EXISTS', KEYS[cnt + i]) == 0 then
+        for j = pos + 2, last, 1000 do
+            redis.call(ARGV[pos], KEYS[cnt + i], unpack(ARGV, j, math.min(j + 999, last)))
+        end
+    end
+    pos = last + 1
+end
+redis.call('SADD', KEYS[idx], ARGV[3])
+if #KEYS > idx + 1 then
+    redis.call('ZADD', KEYS[idx + 1], ARGV[4], ARGV[3])
+end
+redis.call('INCR', KEYS[#KEYS])
+return 0
+"""
+
+# KEYS: the index set, optionally the ordered index, then the parent generation
+#       counter
+# ARGV: creation score, child keys
+# Returns the positions of any keys already in the index, registering none
+_REGISTER_MANY_SCRIPT = """
+local found = {}
+for i = 2, #ARGV do
+    if redis.call('SISMEMBER', KEYS[1], ARGV[i]) == 1 then
+        found[#found + 1] = i - 1
+    end
+end
+if #found > 0 then
+    return found
+end
+for i = 2, #ARGV do
+    redis.call('SADD', KEYS[1], ARGV[i])
+    if #KEYS > 2 then
+        redis.call('ZADD', KEYS[2], ARGV[1], ARGV[i])
+    end
+end
+redis.call('INCR', KEYS[#KEYS])
+return found
+"""
+
+# KEYS: the child index holding the members, the index set, the peer index set
+#       of each member, then the generation counters to bump
+# ARGV: number of members, the owner's key, then the member keys
+# Returns the position of the first member missing from the child index,
+# linking none
+_LINK_CHECKED_SCRIPT = """
+local cnt = tonumber(ARGV[1])
+for i = 1, cnt do
+    if redis.call('SISMEMBER', KEYS[1], ARGV[i + 2]) == 0 then
+        return i
+    end
+end
+for i = 1, cnt do
+    redis.call('SADD', KEYS[2], ARGV[i + 2])
+    redis.call('SADD', KEYS[i + 2], ARGV[2])
+end
+for i = cnt + 3, #KEYS do
+    redis.call('INCR', KEYS[i])
+end
+return 0
+"""
+
+# KEYS: index set, reap set, reap job list
+# ARGV: optionally the job record, recorded only if there was anything to move
+# Returns 1 if the index was moved
+_MOVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[2])
+    if ARGV[1] then
+        redis.call('RPUSH', KEYS[3], ARGV[1])
+    end
+    return 1
+end
+return 0
+"""
+
+# KEYS: sets to search
+# ARGV: members to look for
+_ISMEMBER_ANY_SCRIPT = """
+local found = {}
+for i, val in ipairs(ARGV) do
+    found[i] = 0
+    for _, key in ipairs(KEYS) do
+        if redis.call('SISMEMBER', key, val) == 1 then
+            found[i] = 1
+            break
+        end
+    end
+end
+return found
+"""
+
+# KEYS: sets to intersect
+# ARGV: limit, 0 for none
+_INTER_COUNT_SCRIPT = """
+local cnt = #redis.call('SINTER', unpack(KEYS))
+local limit = tonumber(ARGV[1])
+if limit > 0 and cnt > limit then
+    return limit
+end
+return cnt
+"""
+
+
+### Logging ###
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+logger.addHandler(logging.NullHandler())
 
 
 ### Exceptions ###
@@ -67,9 +231,122 @@ class PObjectDNE(Exception):
         msg = "PObject '{}' does not exist".format(pobj.key)
         super().__init__(msg)
 
+### Key Schemes ###
+
+class KeyScheme(object):
+
+    __slots__ = ()
+
+    # Recorded in the database by set_key_scheme
+    name = "plain"
+
+    def encode_affix(self, affix):
+        return affix
+
+    def encode_uid(self, uid):
+        return str(uid)
+
+    def decode_uid(self, key):
+        return uuid.UUID(key)
+
+    def normalize_key(self, key):
+        return key
+
+class CompactKeyScheme(KeyScheme):
+
+    __slots__ = ()
+
+    name = "compact"
+
+    # Base64 never emits the separator, unlike the urlsafe alphabet
+    _UID_LEN = 22
+
+    def encode_affix(self, affix):
+        return _key_codes.get(affix, affix)
+
+    def encode_uid(self, uid):
+        return base64.b64encode(uid.bytes).decode('ascii')[:self._UID_LEN]
+
+    def decode_uid(self, key):
+        if len(key) == self._UID_LEN:
+            return uuid.UUID(bytes=base64.b64decode(key + "=="))
+        else:
+            return uuid.UUID(key)
+
+    def normalize_key(self, key):
+        """Return the compact form of canonical UUID strings, other keys unchanged"""
+
+        if len(key) == 36:
+            try:
+                return self.encode_uid(uuid.UUID(key))
+            except ValueError:
+                pass
+        return key
+
+PLAIN_KEYS = KeyScheme()
+COMPACT_KEYS = CompactKeyScheme()
+
+
 ### Functions ###
 
-def build_pkey(base_key, prefix=None, postfix=None):
+def register_key_codes(codes):
+    """Register the short codes CompactKeyScheme uses for key prefixes and postfixes"""
+
+    for affix, code in codes.items():
+        utility.check_isinstance(affix, str)
+        utility.check_isinstance(code, str)
+        if not code or _SEPERATOR in code:
+            raise ValueError("Bad key code '{}'".format(code))
+        for other, other_code in _key_codes.items():
+            if (other == affix) != (other_code == code):
+                msg = "Key code '{}' for '{}' conflicts with '{}' for '{}'"
+                raise ValueError(msg.format(code, affix, other_code, other))
+        _key_codes[affix] = code
+
+def set_key_scheme(pbackend, scheme):
+    """Select the key scheme for all objects on pbackend"""
+
+    # Schemes do not mix, so the database records any scheme other than plain
+    # and refuses to be opened with another one
+
+    utility.check_isinstance(scheme, KeyScheme)
+
+    if isinstance(pbackend, (backends.Backend, membackend.MemoryBackend)):
+        pcollections = pcollections_for(pbackend)
+        marker = pcollections.String(_KEY_SCHEME_PKEY, create=None, existing=None)
+        current = marker.get_val() if marker.exists() else PLAIN_KEYS.name
+        if current != scheme.name:
+            if marker.exists() or _dbsize(pbackend):
+                msg = "Database uses key scheme '{}', not '{}'".format(current, scheme.name)
+                raise ValueError(msg)
+            pcollections.String(_KEY_SCHEME_PKEY, create=scheme.name, existing=None)
+
+    _key_schemes[pbackend] = scheme
+
+def key_scheme(pbackend):
+    """Return the key scheme for pbackend, checking the database on first use"""
+
+    try:
+        return _key_schemes[pbackend]
+    except KeyError:
+        set_key_scheme(pbackend, PLAIN_KEYS)
+        return PLAIN_KEYS
+
+def _dbsize(pbackend):
+    """Return the number of keys in pbackend, or 0 if it can't tell"""
+
+    if isinstance(pbackend, membackend.MemoryBackend):
+        return pbackend.dbsize()
+    redis = pbackend_redis(pbackend)
+    return redis.dbsize() if redis is not None else 0
+
+def build_pkey(base_key, prefix=None, postfix=None, scheme=None):
+
+    if scheme is not None:
+        if prefix is not None:
+            prefix = scheme.encode_affix(prefix)
+        if postfix is not None:
+            postfix = scheme.encode_affix(postfix)
 
     key = str()
     if prefix is not None:
@@ -80,10 +357,888 @@ def build_pkey(base_key, prefix=None, postfix=None):
 
     return key
 
+def pbackend_redis(pbackend):
+    """Return the redis client behind 'pbackend', or None if it has none"""
+
+    driver = getattr(pbackend, "_driver", None)
+    return getattr(driver, "redis", None)
+
+def decode_val(val):
+    """Return a raw redis reply as str"""
+
+    if isinstance(val, bytes):
+        return val.decode('utf-8')
+    else:
+        return val
+
+def scan_pset(pbackend, pkey, load, batch_size=None):
+    """Yield members of the set at pkey in batches of about batch_size"""
+
+    if batch_size is None:
+        batch_size = _SCAN_BATCH_SIZE
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        yield from load()
+        return
+
+    cursor = 0
+    while True:
+        cursor, vals = redis.sscan(pkey, cursor, count=batch_size)
+        for val in vals:
+            yield decode_val(val)
+        if not int(cursor):
+            break
+
+def page_pset(pbackend, pkey, load, cursor=None, count=None):
+    """Return (cursor, members) for one page of the set at pkey"""
+
+    # Pass the returned cursor back in to resume, None marks the end
+
+    if count is None:
+        count = _SCAN_BATCH_SIZE
+    cursor = int(cursor) if cursor else 0
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        vals = sorted(load())
+        page = vals[cursor:cursor+count]
+        cursor += count
+        return (str(cursor) if cursor < len(vals) else None, page)
+
+    cursor, vals = redis.sscan(pkey, cursor, count=count)
+    cursor = int(cursor)
+    return (str(cursor) if cursor else None, [decode_val(val) for val in vals])
+
+def range_plist(pbackend, pkey, load, start, stop):
+    """Return items start..stop (inclusive, negative counts from the end) of the list at pkey"""
+
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        plist = load()
+        length = len(plist)
+        if start < 0:
+            start += length
+        if stop < 0:
+            stop += length
+        return [plist[i] for i in range(max(start, 0), min(stop, length - 1) + 1)]
+
+    return [decode_val(val) for val in redis.lrange(pkey, start, stop)]
+
+def val_to_key(val, scheme=None):
+    """Return the object key for a str, uuid.UUID, or PersistentObject"""
+
+    if scheme is None:
+        scheme = PLAIN_KEYS
+
+    if isinstance(val, str):
+        return scheme.normalize_key(val)
+    elif isinstance(val, uuid.UUID):
+        return scheme.encode_uid(val)
+    elif isinstance(val, PersistentObject):
+        return val.key
+    else:
+        raise TypeError("val must be a str, uuid.UUID, or PersistentObject")
+
+def member_pkeys(index, label, prefix=None):
+    """Return the pkey of the 'label' index set of each member of index"""
+
+    # Lets set queries fan out to member indexes without opening the members
+    owner = index.parent if isinstance(index, ChildIndex) else index.obj
+    return [build_pkey(key, prefix=prefix, postfix=label, scheme=owner._scheme)
+            for key in index.by_key()]
+
+def _source_pkey(source):
+    """Return the pkey of an index or raw set pkey"""
+
+    if isinstance(source, str):
+        return source
+    else:
+        return source.pkey
+
+def _load_source(pbackend, source):
+    """Return the members of an index or raw set pkey as a set"""
+
+    if not isinstance(source, str):
+        return set(source.by_key())
+
+    pobj = pcollections_for(pbackend).MutableSet(source)
+    return pobj.get_val() if pobj.exists() else set()
+
+def _set_op(pbackend, sources, command, combine):
+
+    pkeys = [_source_pkey(source) for source in sources]
+    if not pkeys:
+        return set()
+
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        vals = [_load_source(pbackend, source) for source in sources]
+        return combine(*vals)
+
+    return set([decode_val(val) for val in getattr(redis, command)(pkeys)])
+
+def inter_keys(pbackend, sources):
+    """Return the keys in every one of sources, computed server side"""
+    return _set_op(pbackend, sources, "sinter", set.intersection)
+
+def union_keys(pbackend, sources):
+    """Return the keys in any of sources, computed server side"""
+    return _set_op(pbackend, sources, "sunion", set.union)
+
+def diff_keys(pbackend, sources):
+    """Return the keys in the first of sources but none of the rest, computed server side"""
+    return _set_op(pbackend, sources, "sdiff", set.difference)
+
+def inter_count(pbackend, sources, limit=0):
+    """Return the number of keys in every one of sources, stopping at limit if non-zero"""
+
+    utility.check_isinstance(limit, int)
+
+    pkeys = [_source_pkey(source) for source in sources]
+    if not pkeys:
+        return 0
+
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        cnt = len(set.intersection(*[_load_source(pbackend, source) for source in sources]))
+        return min(cnt, limit) if limit else cnt
+
+    # SINTERCARD needs redis 7, older servers count in a script instead
+    try:
+        return int(redis.sintercard(len(pkeys), pkeys, limit=limit))
+    except redis_exceptions.ResponseError:
+        return int(redis.eval(_INTER_COUNT_SCRIPT, len(pkeys), *pkeys, limit))
+
+def ismember_any(pbackend, sources, vals):
+    """Return whether each of vals is in any of sources, in one round trip"""
+
+    keys = [val_to_key(val, scheme=key_scheme(pbackend)) for val in vals]
+    pkeys = [_source_pkey(source) for source in sources]
+    if not keys:
+        return []
+    if not pkeys:
+        return [False for key in keys]
+
+    redis = pbackend_redis(pbackend)
+    if redis is None:
+        found = union_keys(pbackend, sources)
+        return [key in found for key in keys]
+
+    return [bool(val) for val in redis.eval(_ISMEMBER_ANY_SCRIPT, len(pkeys), *(pkeys + keys))]
+
+def pcollections_for(pbackend):
+    """Return the PCollections factory shared by all objects on pbackend"""
+
+    if isinstance(pbackend, membackend.MemoryBackend):
+        return pbackend.pcollections
+
+    with _factories_lock:
+        try:
+            return _factories[pbackend]
+        except KeyError:
+            factory = collections.PCollections(pbackend)
+            _factories[pbackend] = factory
+            return factory
+
+def identity_map():
+    """Return the innermost active IdentityMap for this thread, or None"""
+
+    stack = getattr(_scope, "stack", None)
+    return stack[-1] if stack else None
+
+def open_many(build):
+    """Return build(), opening every object it constructs in one round trip"""
+
+    # Nested calls join the outer batch
+    if getattr(_scope, "opening", None) is not None:
+        return build()
+
+    _scope.opening = opening = []
+    try:
+        ret = build()
+        _scope.opening = None
+        _open_batch(opening)
+    except Exception:
+        imap = identity_map()
+        if imap is not None:
+            for obj, _, _ in opening:
+                imap.discard(obj)
+        raise
+    finally:
+        _scope.opening = None
+
+    return ret
+
+def _open_batch(opening):
+    """Run the deferred checks and packed field loads of (obj, args, kwargs) entries"""
+
+    # Objects that opened themselves during construction are done
+    opening = [entry for entry in opening if entry[0]._pending is not None]
+    if not opening:
+        return
+
+    objs = [obj for obj, _, _ in opening]
+    pendings = []
+    for obj in objs:
+        pendings.append(obj._pending)
+        obj._pending = None
+    probes = [obj for obj in objs if obj._fields is not None and obj._field_vals is None]
+
+    redis = pbackend_redis(objs[0].pbackend)
+    if redis is None:
+        results = [[fallback() for _, _, fallback, _ in pending] for pending in pendings]
+        vals = [obj._fields.get_val() if obj._fields.exists() else {} for obj in probes]
+    else:
+        pipe = redis.pipeline(transaction=False)
+        for pending in pendings:
+            for command, args, _, _ in pending:
+                getattr(pipe, command)(*args)
+        for obj in probes:
+            pipe.hgetall(obj._fields.key)
+        replies = pipe.execute()
+        results = []
+        for pending in pendings:
+            results.append(replies[:len(pending)])
+            replies = replies[len(pending):]
+        vals = [{decode_val(k): decode_val(v) for k, v in reply.items()} for reply in replies]
+
+    # Check Objects
+    for pending, result in zip(pendings, results):
+        for (_, _, _, error), found in zip(pending, result):
+            if not found:
+                raise error()
+
+    # Load Fields
+    legacy = set()
+    for obj, val in zip(probes, vals):
+        if val:
+            obj._field_vals = val
+        else:
+            legacy.add(id(obj))
+
+    # Objects without a field hash reopen on their legacy keys
+    for obj, args, kwargs in opening:
+        if id(obj) in legacy:
+            type(obj).__init__(obj, *args, **kwargs)
+            obj._open_pobjs()
+
+def reaping():
+    """Return True on the reaper thread, where index destroys cascade"""
+
+    return getattr(_scope, "reaping", False)
+
+def generations(objs):
+    """Return the generation of each of objs, sharing one pbackend, in one round trip"""
+
+    objs = list(objs)
+    if not objs:
+        return []
+
+    redis = pbackend_redis(objs[0].pbackend)
+    if redis is None:
+        return [obj.generation() for obj in objs]
+
+    vals = redis.mget([obj.generation_pkey for obj in objs])
+    return [int(val) if val else 0 for val in vals]
+
+def create_args(obj_type, val):
+    """Return the (command, args) writing val to a new pobj of obj_type, or None"""
+
+    # Redis drops empty containers, so those are left to pcollections
+    if issubclass(obj_type, abc_base.String):
+        return ("SET", [_arg(val)])
+    elif not val:
+        return None
+    elif issubclass(obj_type, abc_base.Dictionary):
+        args = []
+        for field, item in val.items():
+            args += [_arg(field), _arg(item)]
+        return ("HSET", args)
+    elif issubclass(obj_type, abc_base.List):
+        return ("RPUSH", [_arg(item) for item in val])
+    elif issubclass(obj_type, abc_base.Set):
+        return ("SADD", [_arg(item) for item in val])
+    else:
+        return None
+
+def _arg(val):
+    """Return val as a script argument, passing bytes through untouched"""
+    return val if isinstance(val, bytes) else str(val)
+
+def register_args(checks, writes, key, score):
+    """Return the ARGV for _REGISTER_SCRIPT"""
+
+    args = [len(checks), len(writes), key, repr(score)]
+    for _, (command, vals) in writes:
+        args += [command, len(vals)] + vals
+    return args
+
+def _generation_entry(pcollections, pkey):
+    """Return a (command, args, fallback) entry bumping the generation at pkey"""
+    return ("incr", (pkey,), functools.partial(_incr_generation, pcollections, pkey))
+
+def _incr_generation(pcollections, pkey):
+    """Bump the generation at pkey without redis"""
+
+    pobj = pcollections.MutableString(pkey, create="0")
+    pobj.set_val(str(int(pobj.get_val()) + 1))
+
+def _run_bumped(obj, entries, pkeys):
+    """Apply (command, args, fallback) entries and bump the generations at pkeys together"""
+
+    entries = list(entries)
+    entries += [_generation_entry(obj.pcollections, pkey) for pkey in pkeys]
+    run_removals(pbackend_redis(obj.pbackend), entries)
+
+def run_removals(redis, removals, transaction=True, unlink=False):
+    """Apply queued (command, args, fallback) removals in one pipeline"""
+
+    # Entries without a command run once everything before them is applied
+
+    if redis is None:
+        for _, _, fallback in removals:
+            fallback()
+        return
+
+    pipe = redis.pipeline(transaction=transaction)
+    for command, args, _ in removals:
+        if command is None:
+            continue
+        if unlink and command == "delete":
+            command = "unlink"
+        getattr(pipe, command)(*args)
+    pipe.execute()
+
+    for command, _, fallback in removals:
+        if command is None:
+            fallback()
+
+
+register_key_codes({"srv": "V",
+                    _USERDATA_POSTFIX: "U",
+                    _FIELDS_POSTFIX: "F",
+                    _ORDER_POSTFIX: "T",
+                    _GENERATION_POSTFIX: "G",
+                    _NONCE_POSTFIX: "O"})
+
 
 ### Objects ###
 
-class PersistentObject(object):
+class IdentityMap(object):
+
+    def __init__(self):
+        """Initialize request scoped map of open objects"""
+
+        # Call Parent
+        super().__init__()
+
+        # Setup Map
+        self._objs = {}
+
+    def __enter__(self):
+
+        stack = getattr(_scope, "stack", None)
+        if stack is None:
+            stack = _scope.stack = []
+        stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        _scope.stack.remove(self)
+        self._objs.clear()
+        return False
+
+    def __len__(self):
+        return len(self._objs)
+
+    @staticmethod
+    def _index_pkey(pindex):
+        """Return the pkey of the index a child was opened through, or None"""
+
+        # Children of different indexes may share a key, and a hit must never
+        # skip the membership check of the index it is looked up through
+        return pindex.pkey if pindex is not None else None
+
+    def get(self, pbackend, obj_type, key, pindex=None):
+        return self._objs.get((pbackend, obj_type, key, self._index_pkey(pindex)))
+
+    def add(self, obj):
+        pindex = getattr(obj, "pindex", None)
+        self._objs[(obj.pbackend, type(obj), obj.key, self._index_pkey(pindex))] = obj
+
+    def discard(self, obj):
+        pindex = getattr(obj, "pindex", None)
+        self._objs.pop((obj.pbackend, type(obj), obj.key, self._index_pkey(pindex)), None)
+
+class ValueCache(object):
+
+    def __init__(self, max_bytes=_VALUE_CACHE_BYTES):
+        """Initialize LRU cache of immutable pobj values"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(max_bytes, int)
+
+        # Save Args
+        self._max_bytes = max_bytes
+
+        # Setup Cache
+        self._lock = threading.Lock()
+        self._vals = OrderedDict()
+        self._owners = {}
+        self._size = 0
+
+    def __len__(self):
+        return len(self._vals)
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @property
+    def size(self):
+        return self._size
+
+    def _sizeof(self, val):
+
+        if isinstance(val, (str, bytes)):
+            return len(val)
+        else:
+            return sys.getsizeof(val)
+
+    def get(self, owner, pkey, loader):
+        """Return the value stored at pkey, calling loader on a miss"""
+
+        # Values of an owner recreated elsewhere carry a different nonce
+        nonce = owner.get_nonce()
+
+        key = (owner.pbackend, pkey)
+        with self._lock:
+            try:
+                val, _, _, cached = self._vals[key]
+            except KeyError:
+                pass
+            else:
+                if cached == nonce:
+                    self._vals.move_to_end(key)
+                    return val
+                self._evict(key)
+
+        # Loaders return None for values that are missing, which are never kept
+        val = loader()
+        size = self._sizeof(val)
+        if val is None or size > self._max_bytes:
+            return val
+
+        oid = (owner.pbackend, owner.prefix, owner.key)
+        with self._lock:
+            if key not in self._vals:
+                self._vals[key] = (val, size, oid, nonce)
+                self._owners.setdefault(oid, set()).add(key)
+                self._size += size
+                while self._size > self._max_bytes:
+                    self._evict(next(iter(self._vals)))
+        return val
+
+    def _evict(self, key):
+
+        _, size, oid, _ = self._vals.pop(key)
+        self._size -= size
+        keys = self._owners[oid]
+        keys.discard(key)
+        if not keys:
+            del self._owners[oid]
+
+    def discard(self, owner):
+        """Drop all cached values belonging to owner"""
+        self.discard_key(owner.pbackend, owner.prefix, owner.key)
+
+    def discard_key(self, pbackend, prefix, key):
+        """Drop all cached values belonging to the object at key"""
+
+        oid = (pbackend, prefix, key)
+        with self._lock:
+            for key in list(self._owners.get(oid, ())):
+                self._evict(key)
+
+    def clear(self):
+
+        with self._lock:
+            self._vals.clear()
+            self._owners.clear()
+            self._size = 0
+
+value_cache = ValueCache()
+
+class GenerationCache(object):
+
+    def __init__(self, max_items=_GENERATION_CACHE_ITEMS):
+        """Initialize LRU cache of values derived from objects, keyed on their generation"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(max_items, int)
+
+        # Save Args
+        self._max_items = max_items
+
+        # Setup Cache
+        self._lock = threading.Lock()
+        self._vals = OrderedDict()
+        self._owners = {}
+
+    def __len__(self):
+        return len(self._vals)
+
+    @property
+    def max_items(self):
+        return self._max_items
+
+    def get(self, owner, name, loader):
+        """Return the value 'name' derived from owner, calling loader if owner has changed"""
+
+        # Read before loading, so changes made during the load force another one
+        # A recreated owner counts from 0 again, so entries also carry its nonce
+        generation = owner.generation_tag()
+
+        oid = (owner.pbackend, owner.prefix, owner.key)
+        key = oid + (name,)
+        with self._lock:
+            try:
+                cached, val = self._vals[key]
+            except KeyError:
+                pass
+            else:
+                if cached == generation:
+                    self._vals.move_to_end(key)
+                    return val
+
+        val = loader()
+        with self._lock:
+            self._vals[key] = (generation, val)
+            self._vals.move_to_end(key)
+            self._owners.setdefault(oid, set()).add(key)
+            while len(self._vals) > self._max_items:
+                self._evict(next(iter(self._vals)))
+        return val
+
+    def _evict(self, key):
+
+        del self._vals[key]
+        keys = self._owners[key[:3]]
+        keys.discard(key)
+        if not keys:
+            del self._owners[key[:3]]
+
+    def discard(self, owner):
+        """Drop all cached values derived from owner"""
+        self.discard_key(owner.pbackend, owner.prefix, owner.key)
+
+    def discard_key(self, pbackend, prefix, key):
+        """Drop all cached values derived from the object at key"""
+
+        oid = (pbackend, prefix, key)
+        with self._lock:
+            for key in list(self._owners.get(oid, ())):
+                self._evict(key)
+
+    def clear(self):
+
+        with self._lock:
+            self._vals.clear()
+            self._owners.clear()
+
+generation_cache = GenerationCache()
+
+def reap_layout(obj_type):
+    """Return how the reaper unlinks children of obj_type by key, or None to open each one"""
+
+    if obj_type.reap_prefix is None or obj_type.reap_linked:
+        return None
+
+    indexes = []
+    for label, type_child, ordered in obj_type.reap_indexes():
+        layout = reap_layout(type_child)
+        if layout is None:
+            return None
+        indexes.append({'label': label, 'ordered': ordered, 'layout': layout})
+
+    return {'prefix': obj_type.reap_prefix,
+            'postfixes': obj_type.reap_postfixes(),
+            'indexes': indexes}
+
+def reap_record(pkey, layout):
+    """Return the reap job list entry for the children held in the set at pkey"""
+    return json.dumps({'pkey': pkey, 'layout': layout}, sort_keys=True)
+
+class Reaper(object):
+
+    def __init__(self, batch_size=None):
+        """Initialize background remover for the children of destroyed indexes"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        if batch_size is None:
+            batch_size = _REAP_BATCH_SIZE
+        utility.check_isinstance(batch_size, int)
+
+        # Save Args
+        self._batch_size = batch_size
+
+        # Setup Queue
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._queued = set()
+        self._resumed = weakref.WeakSet()
+
+    def submit(self, pindex, keys=None, pkey=None):
+        """Queue the children of pindex, listed in keys or held in the set at pkey"""
+
+        if keys is None and pkey is None:
+            raise TypeError("Requires either keys or pkey")
+
+        self._put(pindex.pkey, functools.partial(self._reap, pindex, keys, pkey))
+
+    def submit_record(self, pbackend, record):
+        """Queue the job in record, an entry of the reap job list in pbackend"""
+
+        with self._lock:
+            if (pbackend, record) in self._queued:
+                return
+            self._queued.add((pbackend, record))
+
+        self._put(json.loads(record)['pkey'],
+                  functools.partial(self._reap_record, pbackend, record))
+
+    def resume(self, pbackend):
+        """Queue the jobs an earlier process left in the reap job list of pbackend"""
+
+        redis = pbackend_redis(pbackend)
+        if redis is None:
+            return
+        with self._lock:
+            if pbackend in self._resumed:
+                return
+            self._resumed.add(pbackend)
+
+        for record in redis.lrange(_REAP_JOBS_PKEY, 0, -1):
+            self.submit_record(pbackend, decode_val(record))
+
+    def join(self):
+        """Block until all queued children, and theirs, are removed"""
+        self._jobs.join()
+
+    def _put(self, name, job):
+
+        self._jobs.put((name, job))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tutamen-reaper")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _run(self):
+
+        _scope.reaping = True
+        while True:
+            name, job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                logger.exception("Failed to reap children of '{}'".format(name))
+            finally:
+                self._jobs.task_done()
+
+    def _reap(self, pindex, keys, pkey):
+
+        pbackend = pindex.parent.pbackend
+        redis = pbackend_redis(pbackend)
+        if keys is not None:
+            keys = list(keys)
+
+        # The index itself is already gone
+        skip = set([pindex.pkey, pindex.order_pkey, pindex.parent.generation_pkey])
+
+        while True:
+
+            # Take Batch
+            if keys is None:
+                batch = [decode_val(key) for key in redis.spop(pkey, self._batch_size)]
+            else:
+                batch = keys[:self._batch_size]
+                keys = keys[self._batch_size:]
+            if not batch:
+                break
+
+            # Collect Removals
+            removals = []
+            for key in batch:
+                try:
+                    child = pindex.type_child(pbackend, pindex=pindex, create=False,
+                                              batched=True, key=key)
+                    removals.extend(child._collect_removals())
+                except Exception:
+                    logger.exception("Failed to reap '{}'".format(key))
+            removals = [removal for removal in removals
+                        if not (removal[1] and removal[1][0] in skip)]
+
+            # Remove Batch
+            run_removals(redis, removals, transaction=False, unlink=True)
+
+    def _reap_record(self, pbackend, record):
+
+        try:
+            self._reap_keys(pbackend, record)
+        finally:
+            with self._lock:
+                self._queued.discard((pbackend, record))
+
+    def _reap_keys(self, pbackend, record):
+        """Unlink the pobjs of each child in the job, never opening the children"""
+
+        redis = pbackend_redis(pbackend)
+        scheme = key_scheme(pbackend)
+        job = json.loads(record)
+        layout = job['layout']
+        prefix = layout['prefix']
+
+        while True:
+
+            # Members leave the set with their pobjs, so a failed batch is retried
+            batch = [decode_val(key) for key in redis.srandmember(job['pkey'], self._batch_size)]
+            if not batch:
+                break
+
+            pipe = redis.pipeline(transaction=True)
+            moves = []
+            for key in batch:
+                pkey = functools.partial(build_pkey, key, prefix=prefix, scheme=scheme)
+                pipe.unlink(*[pkey(postfix=postfix) for postfix in layout['postfixes']])
+                for index in layout['indexes']:
+                    index_pkey = pkey(postfix=index['label'])
+                    reap_pkey = build_pkey(uuid.uuid4(), prefix=_REAP_PREFIX)
+                    nested = reap_record(reap_pkey, index['layout'])
+                    moves.append((len(pipe), nested))
+                    pipe.eval(_MOVE_SCRIPT, 3, index_pkey, reap_pkey, _REAP_JOBS_PKEY, nested)
+                    if index['ordered']:
+                        pipe.unlink(build_pkey(index_pkey, postfix=_ORDER_POSTFIX, scheme=scheme))
+            pipe.srem(job['pkey'], *batch)
+            replies = pipe.execute()
+
+            for pos, nested in moves:
+                if replies[pos]:
+                    self.submit_record(pbackend, nested)
+            for key in batch:
+                value_cache.discard_key(pbackend, prefix, key)
+                generation_cache.discard_key(pbackend, prefix, key)
+
+        redis.lrem(_REAP_JOBS_PKEY, 1, record)
+
+reaper = Reaper()
+
+class lazy(object):
+
+    def __init__(self, builder):
+        """Initialize attribute built by 'builder' on first access"""
+
+        # Call Parent
+        super().__init__()
+
+        # Save Args
+        self._builder = builder
+        self._name = builder.__name__
+        self.__doc__ = builder.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+
+        if obj is None:
+            return self
+        try:
+            return obj._lazy[self._name]
+        except KeyError:
+            val = self._builder(obj)
+            obj._lazy[self._name] = val
+            return val
+
+    def __set__(self, obj, val):
+        obj._lazy[self._name] = val
+
+def lazy_pobj(type_name, postfix):
+    """Return a lazy handle to an existing pobj, validated on first access"""
+
+    def builder(obj):
+        obj_type = getattr(obj.pcollections, type_name)
+        return obj._build_pobj(obj_type, postfix)
+
+    return lazy(builder)
+
+def _batched_destroy(destroy):
+    """Wrap destroy so the outermost call removes everything in one transaction"""
+
+    @functools.wraps(destroy)
+    def wrapper(self, *args, **kwargs):
+
+        # Nested super() calls join the outer batch
+        if self._removals is not None:
+            return destroy(self, *args, **kwargs)
+
+        self._removals = []
+        try:
+            ret = destroy(self, *args, **kwargs)
+        except Exception:
+            self._removals = None
+            raise
+        self._flush_removals()
+        return ret
+
+    return wrapper
+
+class _PersistentObjectMeta(type):
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+
+        if 'destroy' in namespace:
+            namespace['destroy'] = _batched_destroy(namespace['destroy'])
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __call__(cls, *args, **kwargs):
+        """Construct Object and open its deferred pobjs"""
+
+        obj = super().__call__(*args, **kwargs)
+        opening = getattr(_scope, "opening", None)
+        if opening is not None and not obj._create:
+            # Opened along with the rest of the batch by open_many
+            opening.append((obj, args, kwargs))
+        else:
+            obj._open_pobjs()
+        return obj
+
+class PersistentObject(object, metaclass=_PersistentObjectMeta):
+
+    # Mixin state lives here too so mixins can share one slot layout
+    __slots__ = ('_pbackend', '_pcollections', '_scheme', '_key', '_prefix', '_create',
+                 '_pending', '_writes', '_removals', '_lazy', '_nonce',
+                 '_field_mode', '_field_pobjs', '_field_vals', '_fields',
+                 '_uid', '_objtype', '_objuid', '_pindex', '_registering')
+
+    # Subclasses set this to store their scalar fields in one hash
+    packed_fields = False
+
+    # Set to the prefix of instances' pobjs, so they can be dumped, and reaped by key
+    reap_prefix = None
+
+    # Children linked from other objects set this, so the reaper opens each one to unlink it
+    reap_linked = False
 
     def __init__(self, pbackend, key=None, prefix=None, create=False):
 
@@ -92,7 +1247,7 @@ class PersistentObject(object):
         # CREATE_OR_OPEN       True
 
         # Check args
-        utility.check_isinstance(pbackend, backends.Backend)
+        utility.check_isinstance(pbackend, backends.Backend, membackend.MemoryBackend)
         utility.check_isinstance(key, str)
         if prefix is not None:
             utility.check_isinstance(prefix, str)
@@ -102,12 +1257,60 @@ class PersistentObject(object):
 
         # Save Attrs
         self._pbackend = pbackend
-        self._pcollections = collections.PCollections(pbackend)
+        self._pcollections = pcollections_for(pbackend)
+        self._scheme = key_scheme(pbackend)
         self._key = key
         self._prefix = prefix
+        self._create = create
+
+        # Defer pobj checks until construction completes
+        self._pending = []
+        self._writes = []
+        self._removals = None
+        self._lazy = {}
+        self._nonce = None
+
+        # Setup Field Storage
+        self._field_mode = None
+        self._field_pobjs = {}
+        self._field_vals = None
+        self._fields = None
+
+    @classmethod
+    def reap_postfixes(cls):
+        """Return the postfix of every pobj an instance may own"""
+
+        return [_FIELDS_POSTFIX, _GENERATION_POSTFIX, _NONCE_POSTFIX]
+
+    @classmethod
+    def reap_indexes(cls):
+        """Return (label, type_child, ordered) for each index destroy cascades to"""
+        return []
 
     def destroy(self):
-        pass
+
+        # Cleanup Packed Fields
+        if self._fields is not None:
+            self._queue_rem("delete", (self._build_pkey(postfix=_FIELDS_POSTFIX),),
+                            self._fields.rem)
+
+        # Cleanup Generation
+        self._queue_rem("delete", (self.generation_pkey,),
+                        lambda: self.pcollections.MutableString(self.generation_pkey).rem())
+
+        # Cleanup Nonce
+        pkey = self._build_pkey(postfix=_NONCE_POSTFIX)
+        self._queue_rem("delete", (pkey,),
+                        lambda: self.pcollections.String(pkey).rem())
+
+        # Invalidate Open Instance
+        imap = identity_map()
+        if imap is not None:
+            imap.discard(self)
+
+        # Invalidate Cached Values
+        value_cache.discard(self)
+        generation_cache.discard(self)
 
     @property
     def pbackend(self):
@@ -125,6 +1328,59 @@ class PersistentObject(object):
     def prefix(self):
         return self._prefix
 
+    @property
+    def generation_pkey(self):
+        return self._build_pkey(postfix=_GENERATION_POSTFIX)
+
+    def generation(self):
+        """Return the count of mutations to this object, 0 if none since creation"""
+
+        # Destroying a child bumps its parent, the child's own counter is removed
+
+        redis = pbackend_redis(self.pbackend)
+        if redis is None:
+            pobj = self.pcollections.MutableString(self.generation_pkey)
+            return int(pobj.get_val()) if pobj.exists() else 0
+
+        val = redis.get(self.generation_pkey)
+        return int(val) if val else 0
+
+    def generation_tag(self):
+        """Return (nonce, generation), which only repeats for the same creation"""
+
+        redis = pbackend_redis(self.pbackend)
+        if redis is None or self._nonce is not None:
+            return (self.get_nonce(), self.generation())
+
+        # Fetch the nonce along with the first generation read
+        nonce, val = redis.mget([self._build_pkey(postfix=_NONCE_POSTFIX), self.generation_pkey])
+        nonce = decode_val(nonce)
+        self._nonce = nonce if nonce else ""
+        return (self._nonce, int(val) if val else 0)
+
+    def get_nonce(self):
+        """Return the token written when this object was created"""
+
+        # Read once per instance, an open instance already outlives a recreation
+        if self._nonce is None:
+            pkey = self._build_pkey(postfix=_NONCE_POSTFIX)
+            redis = pbackend_redis(self.pbackend)
+            if redis is None:
+                pobj = self.pcollections.String(pkey, create=None, existing=None)
+                val = pobj.get_val() if pobj.exists() else None
+            else:
+                val = decode_val(redis.get(pkey))
+            # Objects created before nonces share the empty one
+            self._nonce = val if val else ""
+        return self._nonce
+
+    def _bump_entry(self):
+        """Return a (command, args, fallback) entry bumping this object's generation"""
+        return _generation_entry(self.pcollections, self.generation_pkey)
+
+    def _bump_generation(self):
+        run_removals(pbackend_redis(self.pbackend), [self._bump_entry()])
+
     def __repr__(self):
         return "{:s}_{:s}".format(type(self).__name__, self.key)
 
@@ -138,7 +1394,7 @@ class PersistentObject(object):
             return False
 
     def _build_pkey(self, postfix):
-        return build_pkey(self.key, prefix=self.prefix, postfix=postfix)
+        return build_pkey(self.key, prefix=self.prefix, postfix=postfix, scheme=self._scheme)
 
     def _build_pobj(self, obj_type, postfix, create=None):
 
@@ -146,29 +1402,234 @@ class PersistentObject(object):
         # OPEN_EXISTING         None
         # CREATE_OR_OPEN        Val
 
+        # Opening an existing object never writes defaults
+        if not self._create:
+            create = None
+
         pkey = self._build_pkey(postfix=postfix)
+
+        # A registering child writes its defaults in the registration script
+        if (create is not None and self._pending is not None and
+            getattr(self, "_registering", False) and
+            pbackend_redis(self.pbackend) is not None):
+            write = create_args(obj_type, create)
+            if write is not None:
+                self._writes.append((pkey, write))
+                return obj_type(pkey, create=None, existing=None)
+
         pobj = obj_type(pkey, create=create, existing=None)
-        if not pobj.exists():
-            raise PObjectDNE(pobj)
+        self._defer_check("exists", (pobj.key,), pobj.exists,
+                          functools.partial(PObjectDNE, pobj))
         return pobj
 
-    def val_to_key(self, val):
+    def _ensure_pobj(self, obj_type, postfix, create):
+        """Create-or-open a pobj added after creation, such as an index set"""
 
-        if isinstance(val, str):
-            return val
-        elif isinstance(val, uuid.UUID):
-            return str(val)
-        elif isinstance(val, PersistentObject):
-            return val.key
+        # Only written once this object's own checks have passed, so a lookup of
+        # a missing object still leaves the database untouched
+        if self._create or self._pending is not None:
+            return self._build_pobj(obj_type, postfix, create=create)
+
+        pkey = self._build_pkey(postfix=postfix)
+        pobj = obj_type(pkey, create=create, existing=None)
+        self._defer_check("exists", (pobj.key,), pobj.exists,
+                          functools.partial(PObjectDNE, pobj))
+        return pobj
+
+    def _get_cached(self, name, postfix):
+        """Return the value of immutable pobj attribute 'name' through the value cache"""
+
+        # Hits skip opening the pobj handle entirely
+        pkey = self._build_pkey(postfix=postfix)
+        return value_cache.get(self, pkey, lambda: getattr(self, name).get_val())
+
+    def _defer_check(self, command, args, fallback, error):
+        """Queue an existence check for the batched open"""
+
+        # Check now if the object is already open
+        if self._pending is None:
+            if not fallback():
+                raise error()
+        else:
+            self._pending.append((command, args, fallback, error))
+
+    def _open_pobjs(self):
+        """Finish construction and run all deferred checks"""
+
+        # Write new packed fields in one go
+        if self._field_mode and self._fields is None:
+            self._fields = self._build_pobj(self.pcollections.MutableDictionary,
+                                            _FIELDS_POSTFIX, create=self._field_vals)
+
+        # Tag this creation, an existing object keeps its nonce
+        if self._create:
+            self._build_pobj(self.pcollections.String, _NONCE_POSTFIX, create=uuid.uuid4().hex)
+
+        pending = self._pending
+        self._pending = None
+        self._check_pending(pbackend_redis(self.pbackend), pending)
+
+    def _check_pending(self, redis, pending):
+        """Run deferred checks in a single pipelined round trip"""
+
+        if not pending:
+            return
+
+        if redis is None:
+            results = [fallback() for _, _, fallback, _ in pending]
+        else:
+            pipe = redis.pipeline(transaction=False)
+            for command, args, _, _ in pending:
+                getattr(pipe, command)(*args)
+            results = pipe.execute()
+
+        for (_, _, _, error), result in zip(pending, results):
+            if not result:
+                raise error()
+
+    def _queue_rem(self, command, args, fallback):
+        """Queue a removal for the destroy transaction"""
+
+        # Remove now if the object is not being destroyed
+        if self._removals is None:
+            fallback()
+        else:
+            self._removals.append((command, args, fallback))
+
+    def _rem_pobj(self, name, postfix):
+        """Queue removal of the pobj held in attribute 'name'"""
+
+        pkey = self._build_pkey(postfix=postfix)
+        self._queue_rem("delete", (pkey,), lambda: getattr(self, name).rem())
+
+    def _rem_optional(self, obj_type, postfix):
+        """Queue removal of the pobj at postfix, which may not exist"""
+
+        pkey = self._build_pkey(postfix=postfix)
+        self._queue_rem("delete", (pkey,),
+                        lambda: obj_type(pkey, create=None, existing=None).rem())
+
+    def _queue_after(self, callback):
+        """Run callback once the queued removals are applied"""
+        self._queue_rem(None, (), callback)
+
+    def _flush_removals(self):
+        """Run all queued removals in a single MULTI/EXEC transaction"""
+
+        removals = self._removals
+        self._removals = None
+        if not removals:
+            return
+
+        run_removals(pbackend_redis(self.pbackend), removals)
+
+    def _collect_removals(self):
+        """Run destroy and return its removals instead of applying them"""
+
+        self._removals = []
+        try:
+            self.destroy()
+            return self._removals
+        finally:
+            self._removals = None
+
+    def _fields_packed(self):
+        """Return True if this object keeps its scalar fields in a hash"""
+
+        if self._field_mode is None:
+            if not self.packed_fields:
+                self._field_mode = False
+            elif self._create:
+                self._field_mode = True
+                self._field_vals = {}
+            else:
+                # Objects written before packing keep their legacy keys
+                pkey = self._build_pkey(postfix=_FIELDS_POSTFIX)
+                fields = self.pcollections.MutableDictionary(pkey, create=None, existing=None)
+                if getattr(_scope, "opening", None) is not None:
+                    # Probed and loaded by the batched open
+                    self._fields = fields
+                    self._field_mode = True
+                elif fields.exists():
+                    self._fields = fields
+                    self._field_mode = True
+                else:
+                    self._field_mode = False
+
+        return self._field_mode
+
+    def _build_field(self, postfix, create=None, mutable=False):
+
+        #                      create
+        # OPEN_EXISTING         None
+        # CREATE_OR_OPEN        Val
+
+        if not self._fields_packed():
+            if mutable:
+                obj_type = self.pcollections.MutableString
+            else:
+                obj_type = self.pcollections.String
+            pobj = self._build_pobj(obj_type, postfix, create=create)
+            self._field_pobjs[postfix] = pobj
+            return TrackedField(self, pobj) if mutable else pobj
+
+        if self._fields is None and create is not None:
+            self._field_vals[postfix] = create
+        return PackedField(self, postfix, mutable)
+
+    def _get_field(self, postfix, mutable=False):
+
+        if mutable and self._fields is not None:
+            return self._fields[postfix]
+        if self._field_vals is None:
+            self._field_vals = self._fields.get_val()
+        return self._field_vals[postfix]
+
+    def _set_field(self, postfix, val):
+
+        if self._fields is not None:
+            entry = ("hset", (self._fields.key, postfix, val),
+                     functools.partial(self._fields.__setitem__, postfix, val))
+            _run_bumped(self, [entry], [self.generation_pkey])
+        if self._field_vals is not None:
+            self._field_vals[postfix] = val
+
+    def migrate_fields(self):
+        """Move legacy scalar field keys into the packed hash"""
+
+        if not self.packed_fields or self._fields_packed():
+            return False
+
+        vals = {postfix: pobj.get_val() for postfix, pobj in self._field_pobjs.items()}
+        pkey = self._build_pkey(postfix=_FIELDS_POSTFIX)
+
+        # Write the hash and drop the legacy keys in one transaction, so a crash
+        # never leaves an object with both or neither
+        redis = pbackend_redis(self.pbackend)
+        if redis is None:
+            self.pcollections.MutableDictionary(pkey, create=vals, existing=None)
+            for pobj in self._field_pobjs.values():
+                pobj.rem()
         else:
-            raise TypeError("val must be a str, uuid.UUID, or PersistentObject")
+            entries = [("hset", (pkey, postfix, val), None) for postfix, val in vals.items()]
+            entries += [("delete", (pobj.key,), None) for pobj in self._field_pobjs.values()]
+            run_removals(redis, entries)
+        self._fields = self.pcollections.MutableDictionary(pkey, create=None, existing=None)
+
+        # Existing handles are stale, callers should reopen the object
+        self._field_pobjs = {}
+        self._field_mode = True
+        return True
+
+    def val_to_key(self, val):
+        return val_to_key(val, scheme=self._scheme)
 
     def val_to_uid(self, val):
 
         if isinstance(val, uuid.UUID):
             return val
         elif isinstance(val, str):
-            return uuid.UUID(val)
+            return self._scheme.decode_uid(val)
         elif isinstance(val, UUIDObject):
             return val.uid
         else:
@@ -180,19 +1641,103 @@ class PersistentObject(object):
             return val
         elif isinstance(val, str):
             if issubclass(obj_type, PersistentObject):
-                return obj_type(self.pbackend, key=val, **kwargs)
+                key = self.val_to_key(val)
+                kwargs['key'] = key
             else:
                 raise TypeError("val can not be str unless obj_type is PersistentObject")
         elif isinstance(val, uuid.UUID):
             if issubclass(obj_type, UUIDObject):
-                return obj_type(self.pbackend, uid=val, **kwargs)
+                key = self.val_to_key(val)
+                kwargs['uid'] = val
             else:
                 raise TypeError("val can not be uuid.UUID unless obj_type is UUIDObject")
         else:
             raise TypeError("val must be an {}, str, or uuid.UUID".format(obj_type))
 
+        # Reuse Open Instance
+        imap = identity_map()
+        if imap is not None:
+            obj = imap.get(self.pbackend, obj_type, key, kwargs.get('pindex'))
+            if obj is None:
+                obj = obj_type(self.pbackend, **kwargs)
+                imap.add(obj)
+            return obj
+        else:
+            return obj_type(self.pbackend, **kwargs)
+
+    def vals_to_objs(self, vals, obj_type, **kwargs):
+        """Return val_to_obj for each of vals, opening them in one round trip"""
+        return open_many(lambda: [self.val_to_obj(val, obj_type, **kwargs) for val in vals])
+
+class PackedField(object):
+
+    __slots__ = ('_obj', '_postfix', '_mutable')
+
+    def __init__(self, obj, postfix, mutable):
+        """Initialize Packed Field Handle"""
+
+        # Call Parent
+        super().__init__()
+
+        # Save Args
+        self._obj = obj
+        self._postfix = postfix
+        self._mutable = mutable
+
+    @property
+    def key(self):
+        return self._obj._build_pkey(postfix=self._postfix)
+
+    def exists(self):
+        return self._obj._fields_packed()
+
+    def get_val(self):
+        return self._obj._get_field(self._postfix, mutable=self._mutable)
+
+    def set_val(self, val):
+        if not self._mutable:
+            raise TypeError("Field '{}' is immutable".format(self._postfix))
+        self._obj._set_field(self._postfix, val)
+
+    def rem(self):
+        # Removed along with the object's field hash
+        pass
+
+class TrackedField(object):
+
+    __slots__ = ('_obj', '_pobj')
+
+    def __init__(self, obj, pobj):
+        """Initialize Handle to a legacy mutable field, bumping obj's generation on set"""
+
+        # Call Parent
+        super().__init__()
+
+        # Save Args
+        self._obj = obj
+        self._pobj = pobj
+
+    @property
+    def key(self):
+        return self._pobj.key
+
+    def exists(self):
+        return self._pobj.exists()
+
+    def get_val(self):
+        return self._pobj.get_val()
+
+    def set_val(self, val):
+        entry = ("set", (self._pobj.key, val), functools.partial(self._pobj.set_val, val))
+        _run_bumped(self._obj, [entry], [self._obj.generation_pkey])
+
+    def rem(self):
+        self._pobj.rem()
+
 class UUIDObject(PersistentObject):
 
+    __slots__ = ()
+
     def __init__(self, pbackend, key=None, uid=None, create=False, **kwargs):
         """Initialize Object"""
 
@@ -207,17 +1752,20 @@ class UUIDObject(PersistentObject):
             utility.check_isinstance(uid, uuid.UUID)
 
         # Setup key and uid
+        scheme = key_scheme(pbackend)
         if not key:
             if not uid:
                 if create:
                     uid = uuid.uuid4()
-                    key = str(uid)
+                    key = scheme.encode_uid(uid)
                 else:
                     raise TypeError("Requires either uid or key")
             else:
-                key = str(uid)
+                key = scheme.encode_uid(uid)
+        else:
+            key = scheme.normalize_key(key)
         if not uid:
-            uid = uuid.UUID(key)
+            uid = scheme.decode_uid(key)
 
         # Call Parent
         super().__init__(pbackend, key=key, create=create, **kwargs)
@@ -231,10 +1779,13 @@ class UUIDObject(PersistentObject):
 
 class PermissionsObject(PersistentObject):
 
+    __slots__ = ()
+
     def __init__(self, pbackend, key=None, objtype=None, objuid=None, **kwargs):
         """Initialize Object Permissions"""
 
         # Setup key/objtype/objperm
+        scheme = key_scheme(pbackend)
         if key:
             utility.check_isinstance(key, str)
             parts = key.split(_SEPERATOR)
@@ -242,7 +1793,8 @@ class PermissionsObject(PersistentObject):
                 objtype = parts[0]
             elif len(parts) == 2:
                 objtype = parts[0]
-                objuid = uuid.UUID(parts[1])
+                objuid = scheme.decode_uid(parts[1])
+                key = objtype + _SEPERATOR + scheme.encode_uid(objuid)
             else:
                 raise ValueError("Could Not Parse Key: {}".format(key))
         else:
@@ -254,7 +1806,7 @@ class PermissionsObject(PersistentObject):
                 assert(key.count(_SEPERATOR) == 0)
                 if objuid:
                     utility.check_isinstance(objuid, uuid.UUID)
-                    key += _SEPERATOR + str(objuid)
+                    key += _SEPERATOR + scheme.encode_uid(objuid)
                     assert(key.count(_SEPERATOR) == 1)
 
         # Call Parent
@@ -276,6 +1828,10 @@ class PermissionsObject(PersistentObject):
 
 class UserDataObject(PersistentObject):
 
+    __slots__ = ()
+
+    _userdata = lazy_pobj("MutableDictionary", _USERDATA_POSTFIX)
+
     def __init__(self, pbackend, create=False, userdata={}, **kwargs):
         """Initialize Object"""
 
@@ -287,15 +1843,20 @@ class UserDataObject(PersistentObject):
         super().__init__(pbackend, create=create, **kwargs)
 
         # Setup Metadata
-        self._userdata = self._build_pobj(self.pcollections.MutableDictionary,
-                                          _USERDATA_POSTFIX,
-                                          create=userdata)
+        if create:
+            self._userdata = self._build_pobj(self.pcollections.MutableDictionary,
+                                              _USERDATA_POSTFIX,
+                                              create=userdata)
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_USERDATA_POSTFIX]
 
     def destroy(self):
         """Cleanup Object"""
 
         # Cleanup pbackend object
-        self._userdata.rem()
+        self._rem_pobj("_userdata", _USERDATA_POSTFIX)
 
         # Call Parent
         super().destroy()
@@ -306,6 +1867,10 @@ class UserDataObject(PersistentObject):
 
 class ServerObject(PersistentObject):
 
+    __slots__ = ()
+
+    reap_prefix = "srv"
+
     def __init__(self, pbackend, create=False, prefix="srv", **kwargs):
 
         #                      create
@@ -313,7 +1878,10 @@ class ServerObject(PersistentObject):
         # CREATE_OR_OPEN       True
 
         # Call Parent
-        super().__init__(pbackend, prefix=prefix, **kwargs)
+        super().__init__(pbackend, prefix=prefix, create=create, **kwargs)
+
+        # Pick up reaping left unfinished by an earlier process
+        reaper.resume(pbackend)
 
     def destroy(self):
 
@@ -322,13 +1890,17 @@ class ServerObject(PersistentObject):
 
 class ChildObject(PersistentObject):
 
-    def __init__(self, pbackend, create=False, pindex=None, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, pbackend, create=False, pindex=None, batched=False, **kwargs):
         """Initialize Child"""
 
         #                      create
         # OPEN_EXISTING        False
         # CREATE_OR_OPEN       True
 
+        # batched: index membership is checked and updated by the caller
+
         # Check Input
         utility.check_isinstance(pindex, ChildIndex)
         if pindex.parent.pbackend != pbackend:
@@ -341,26 +1913,68 @@ class ChildObject(PersistentObject):
         self._pindex = pindex
 
         # Register with Index
-        # TODO: These operations need to be atomic
-        if create:
-            if self._pindex.exists(self.key):
-                # TODO: Cleanup?
-                raise ObjectExists(self)
-            self._pindex._children.add(self.key)
+        self._registering = False
+        if batched:
+            pass
+        elif create:
+            # Written and registered in one script once construction completes,
+            # which raises ObjectExists if the key is already in the index
+            self._registering = True
         else:
-            if not self._pindex.exists(self.key):
-                # TODO: Cleanup?
-                raise ObjectDNE(self)
+            # Checked with the rest of the batched open
+            self._defer_check("sismember", (self._pindex.pkey, self.key),
+                              functools.partial(self._pindex.exists, self.key),
+                              functools.partial(ObjectDNE, self))
 
     def destroy(self):
         """Cleanup Object"""
 
         # Unregister with Index
-        self._pindex._children.discard(self.key)
+        self._queue_rem("srem", (self._pindex.pkey, self.key),
+                        lambda: self._pindex._children.discard(self.key))
+        if self._pindex.ordered:
+            self._queue_rem("zrem", (self._pindex.order_pkey, self.key),
+                            functools.partial(self._pindex._order_discard, self.key))
+        self._queue_rem(*self.parent._bump_entry())
 
         # Call Parent
         super().destroy()
 
+    def _check_pending(self, redis, pending):
+        """Write new pobjs, check the rest and register with the index in one server-side script"""
+
+        if not self._registering:
+            return super()._check_pending(redis, pending)
+        self._registering = False
+
+        score = time.time()
+        if redis is None:
+            if self._pindex.exists(self.key):
+                raise ObjectExists(self)
+            super()._check_pending(redis, pending)
+            self._pindex._children.add(self.key)
+            if self._pindex.ordered:
+                self._pindex._order_add([self.key], score)
+            self.parent._bump_generation()
+            return
+
+        writes = self._writes
+        self._writes = []
+        keys = [args[0] for _, args, _, _ in pending]
+        keys += [pkey for pkey, _ in writes]
+        keys.append(self._pindex.pkey)
+        if self._pindex.ordered:
+            keys.append(self._pindex.order_pkey)
+        keys.append(self.parent.generation_pkey)
+        args = register_args(pending, writes, self.key, score)
+        script = redis.register_script(_REGISTER_SCRIPT)
+        ret = int(script(keys=keys, args=args))
+        if ret < 0:
+            raise ObjectExists(self)
+        elif ret > 0:
+            _, _, _, error = pending[ret - 1]
+            raise error()
+
     @property
     def pindex(self):
         return self._pindex
@@ -374,7 +1988,9 @@ class ChildObject(PersistentObject):
 
 class ChildIndex(object):
 
-    def __init__(self, parent, type_child, label):
+    __slots__ = ('_parent', '_type_child', '_label', '_ordered', '_lazy')
+
+    def __init__(self, parent, type_child, label, ordered=False):
         """Initialize Child Index"""
 
         # Call Parent
@@ -384,28 +2000,81 @@ class ChildIndex(object):
         utility.check_isinstance(parent, PersistentObject)
         utility.check_issubclass(type_child, ChildObject)
         utility.check_isinstance(label, str)
+        utility.check_isinstance(ordered, bool)
 
         # Save Args
         self._parent = parent
         self._type_child = type_child
         self._label = label
-
-        # Setup Index Set
-        self._children = parent._build_pobj(self.parent.pcollections.MutableSet,
-                                            label, create=set())
-
-    def destroy(self):
-        """Cleanup Index"""
-
-        # ToDo: Delete children?
+        self._ordered = ordered
+        self._lazy = {}
+
+    @lazy
+    def _children(self):
+        """Index Set, opened on first use"""
+        return self.parent._ensure_pobj(self.parent.pcollections.MutableSet,
+                                        self._label, create=set())
+
+    @lazy
+    def _created(self):
+        """Creation Time Map, used in place of the sorted set without redis"""
+        return self.parent._ensure_pobj(self.parent.pcollections.MutableDictionary,
+                                        build_pkey(self._label, postfix=_ORDER_POSTFIX),
+                                        create={})
+
+    def destroy(self, cascade=None):
+        """Cleanup Index, handing its children to the reaper if cascade"""
+
+        # Indexes destroyed by the reaper cascade by default
+        if cascade is None:
+            cascade = reaping()
+        if cascade:
+            self._queue_reap()
 
         # Cleanup Set
-        self._children.rem()
+        self.parent._queue_rem("delete", (self.pkey,), lambda: self._children.rem())
+        if self.ordered:
+            self.parent._queue_rem("delete", (self.order_pkey,), lambda: self._created.rem())
+
+    def _queue_reap(self):
+        """Move the children out of the index as part of the parent destroy"""
+
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            keys = list(self.by_key())
+            self.parent._queue_after(functools.partial(reaper.submit, self, keys=keys))
+            return
+
+        # Renamed in the same transaction, so later creates can't be swept up
+        reap_pkey = build_pkey(uuid.uuid4(), prefix=_REAP_PREFIX)
+        layout = reap_layout(self.type_child)
+        if layout is None:
+            record = ()
+            job = functools.partial(reaper.submit, self, pkey=reap_pkey)
+        else:
+            # Recorded with the move, so the job outlives this process
+            record = (reap_record(reap_pkey, layout),)
+            job = functools.partial(reaper.submit_record, self.parent.pbackend, record[0])
+        args = (_MOVE_SCRIPT, 3, self.pkey, reap_pkey, _REAP_JOBS_PKEY) + record
+        self.parent._queue_rem("eval", args, functools.partial(redis.eval, *args))
+        self.parent._queue_after(job)
 
     @property
     def parent(self):
         return self._parent
 
+    @property
+    def pkey(self):
+        return self.parent._build_pkey(postfix=self._label)
+
+    @property
+    def ordered(self):
+        return self._ordered
+
+    @property
+    def order_pkey(self):
+        return build_pkey(self.pkey, postfix=_ORDER_POSTFIX, scheme=self.parent._scheme)
+
     @property
     def type_child(self):
         return self._type_child
@@ -414,15 +2083,118 @@ class ChildIndex(object):
         return len(self._children)
 
     def create(self, **kwargs):
-        return self.type_child(self.parent.pbackend, pindex=self, create=True, **kwargs)
+        obj = self.type_child(self.parent.pbackend, pindex=self, create=True, **kwargs)
+        imap = identity_map()
+        if imap is not None:
+            imap.add(obj)
+        return obj
 
     def get(self, **kwargs):
-        return self.type_child(self.parent.pbackend, pindex=self, create=False, **kwargs)
+
+        imap = identity_map()
+        if imap is None:
+            return self.type_child(self.parent.pbackend, pindex=self, create=False, **kwargs)
+
+        # Reuse Open Instance
+        if kwargs.get('key'):
+            key = self.parent.val_to_key(kwargs['key'])
+        elif kwargs.get('uid'):
+            key = self.parent.val_to_key(kwargs['uid'])
+        else:
+            key = None
+        obj = imap.get(self.parent.pbackend, self.type_child, key, self) if key else None
+        if obj is None:
+            obj = self.type_child(self.parent.pbackend, pindex=self, create=False, **kwargs)
+            imap.add(obj)
+        return obj
+
+    def create_many(self, kwargs_list):
+        """Create a child per kwargs dict with one index check and one index update"""
+
+        keyed = []
+        for kwargs in kwargs_list:
+            if kwargs.get('key'):
+                keyed.append((self.parent.val_to_key(kwargs['key']), kwargs))
+            elif kwargs.get('uid'):
+                keyed.append((self.parent.val_to_key(kwargs['uid']), kwargs))
+        keys = [key for key, _ in keyed]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate keys in kwargs_list")
+
+        # Check Index before writing over an existing child's pobjs
+        for key, found in zip(keys, self.exists_many(keys)):
+            if found:
+                raise ObjectExists(self.get(key=key))
+
+        # Create Children
+        children = []
+        try:
+            for kwargs in kwargs_list:
+                children.append(self.type_child(self.parent.pbackend, pindex=self,
+                                                create=True, batched=True, **kwargs))
+        except Exception:
+            for child in children:
+                child.destroy()
+            raise
+
+        # Register with Index, checking again in the same script
+        keys = [child.key for child in children]
+        score = time.time()
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            for key in keys:
+                self._children.add(key)
+            if self.ordered:
+                self._order_add(keys, score)
+            if keys:
+                self.parent._bump_generation()
+        elif keys:
+            pkeys = [self.pkey]
+            if self.ordered:
+                pkeys.append(self.order_pkey)
+            pkeys.append(self.parent.generation_pkey)
+            script = redis.register_script(_REGISTER_MANY_SCRIPT)
+            found = set([int(i) - 1 for i in script(keys=pkeys, args=[repr(score)] + keys)])
+            if found:
+                # Lost a race, the winners share the clashing children's pobjs
+                for i, child in enumerate(children):
+                    if i not in found:
+                        child.destroy()
+                raise ObjectExists(children[min(found)])
+
+        imap = identity_map()
+        if imap is not None:
+            for child in children:
+                imap.add(child)
+
+        return children
+
+    def get_many(self, vals):
+        """Open the child for each val in one round trip"""
+
+        keys = [self.parent.val_to_key(val) for val in vals]
+        return open_many(lambda: [self.get(key=key) for key in keys])
 
     def exists(self, val):
         key = self.parent.val_to_key(val)
         return key in self._children
 
+    def exists_many(self, vals):
+        """Return a list of membership flags for vals in one round trip"""
+
+        keys = [self.parent.val_to_key(val) for val in vals]
+        if not keys:
+            return []
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            members = self.by_key()
+            return [key in members for key in keys]
+
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.sismember(self.pkey, key)
+        return [bool(found) for found in pipe.execute()]
+
     def by_key(self):
         return self._children.get_val()
 
@@ -431,14 +2203,159 @@ class ChildIndex(object):
                     for key in self._children])
 
     def by_obj(self):
-        return set([self.parent.val_to_obj(key, self.type_child, pindex=self)
-                    for key in self._children])
+        return set(self.parent.vals_to_objs(self.by_key(), self.type_child, pindex=self))
+
+    def iter_by_key(self, batch_size=None):
+        return scan_pset(self.parent.pbackend, self.pkey, self.by_key,
+                         batch_size=batch_size)
+
+    def iter_by_uid(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.parent.val_to_uid(key)
+
+    def iter_by_obj(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.parent.val_to_obj(key, self.type_child, pindex=self)
+
+    def page_by_key(self, cursor=None, count=None):
+        return page_pset(self.parent.pbackend, self.pkey, self.by_key,
+                         cursor=cursor, count=count)
+
+    def _check_ordered(self):
+
+        if not self.ordered:
+            raise TypeError("Index '{}' is not ordered".format(self.pkey))
+
+    def _order_add(self, keys, score):
+        """Record creation time for keys without redis"""
+
+        for key in keys:
+            self._created[key] = repr(score)
+
+    def _order_discard(self, key):
+        """Drop creation time for key without redis"""
+
+        vals = self._created.get_val()
+        if key in vals:
+            del self._created[key]
+
+    def range_by_key(self, start=0, stop=-1, reverse=False):
+        """Return keys ranked start..stop (inclusive) by creation time"""
+
+        self._check_ordered()
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            vals = self._created.get_val()
+            keys = sorted(vals, key=(lambda key: (float(vals[key]), key)), reverse=reverse)
+            stop = (len(keys) + stop) if (stop < 0) else stop
+            return keys[start:(stop + 1)]
+
+        if reverse:
+            keys = redis.zrevrange(self.order_pkey, start, stop)
+        else:
+            keys = redis.zrange(self.order_pkey, start, stop)
+        return [decode_val(key) for key in keys]
+
+    def range_by_uid(self, start=0, stop=-1, reverse=False):
+        return [self.parent.val_to_uid(key)
+                for key in self.range_by_key(start=start, stop=stop, reverse=reverse)]
+
+    def range_by_obj(self, start=0, stop=-1, reverse=False):
+        return self.parent.vals_to_objs(self.range_by_key(start=start, stop=stop,
+                                                          reverse=reverse),
+                                        self.type_child, pindex=self)
+
+    def page_by_created(self, cursor=None, count=None, reverse=False):
+        """Return (cursor, keys) for one page in creation order, cursor is None when done"""
+
+        # The cursor holds the (score, key) of the last key returned, so children
+        # created or destroyed meanwhile never shift the pages after it. Keys
+        # sharing a score are ordered by key, as redis does.
+
+        self._check_ordered()
+        count = count if count else _SCAN_BATCH_SIZE
+        after = None
+        if cursor:
+            score, key = cursor.split(" ", 1)
+            after = (float(score), key)
+
+        def _past(item):
+            if after is None:
+                return True
+            return item < after if reverse else item > after
+
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            vals = self._created.get_val()
+            items = sorted([(float(val), key) for key, val in vals.items()], reverse=reverse)
+            page = [item for item in items if _past(item)][:count]
+        else:
+            # Only keys tied with the cursor are read and skipped
+            bound = repr(after[0]) if after else None
+            page = []
+            offset = 0
+            while len(page) < count:
+                if reverse:
+                    batch = redis.zrevrangebyscore(self.order_pkey, bound or "+inf", "-inf",
+                                                   start=offset, num=count, withscores=True)
+                else:
+                    batch = redis.zrangebyscore(self.order_pkey, bound or "-inf", "+inf",
+                                                start=offset, num=count, withscores=True)
+                for key, score in batch:
+                    item = (score, decode_val(key))
+                    if _past(item) and len(page) < count:
+                        page.append(item)
+                if len(batch) < count:
+                    break
+                offset += len(batch)
+
+        keys = [key for _, key in page]
+        if len(keys) < count:
+            return None, keys
+        score, key = page[-1]
+        return "{!r} {}".format(score, key), keys
+
+    def sync_order(self):
+        """Give children created before ordering was enabled a zero creation time"""
+
+        self._check_ordered()
+        keys = self.by_key()
+        redis = pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            vals = self._created.get_val()
+            self._order_add([key for key in keys if key not in vals], 0)
+        elif keys:
+            redis.zadd(self.order_pkey, {key: 0 for key in keys}, nx=True)
+
+def _peer_set(index, key, generator, type_peer):
+    """Return the pkeys of the peer index set and peer generation for key, and a
+    callable opening the peer index set"""
+
+    if index._peer_label is None:
+        peer = generator(key, **index._extra_kwargs)
+        utility.check_isinstance(peer, type_peer)
+        utility.check_isinstance(peer.obj, index.type_member)
+        utility.check_isinstance(index.obj, peer.type_member)
+        return peer.pkey, peer.obj.generation_pkey, lambda: peer._members
+
+    scheme = index.obj._scheme
+    pkey = build_pkey(key, prefix=index._peer_prefix, postfix=index._peer_label, scheme=scheme)
+    gen_pkey = build_pkey(key, prefix=index._peer_prefix, postfix=_GENERATION_POSTFIX,
+                          scheme=scheme)
+    return pkey, gen_pkey, lambda: index.obj.pcollections.MutableSet(pkey, create=set())
 
 class MasterObjIndex(object):
 
-    def __init__(self, obj, label, slave_generator, type_member, **extra_kwargs):
+    __slots__ = ('_obj', '_label', '_slave_generator', '_type_member', '_extra_kwargs', '_lazy',
+                 '_peer_label', '_peer_prefix')
+
+    def __init__(self, obj, label, slave_generator, type_member,
+                 peer_label=None, peer_prefix=None, **extra_kwargs):
         """Initialize Member Index"""
 
+        # peer_label/peer_prefix describe the slave index set so links can be
+        # updated by key alone; without them the slave generator is used
+
         # Call Parent
         super().__init__()
 
@@ -448,28 +2365,38 @@ class MasterObjIndex(object):
         if not hasattr(slave_generator, '__call__'):
             raise TypeError("master_generator must be callable")
         utility.check_issubclass(type_member, PersistentObject)
+        if peer_label is not None:
+            utility.check_isinstance(peer_label, str)
+        if peer_prefix is not None:
+            utility.check_isinstance(peer_prefix, str)
 
         # Save Args
         self._obj = obj
         self._label = label
         self._slave_generator = slave_generator
         self._type_member = type_member
+        self._peer_label = peer_label
+        self._peer_prefix = peer_prefix
         self._extra_kwargs = extra_kwargs
+        self._lazy = {}
 
-        # Setup Index Set
-        self._members = self.obj._build_pobj(self.obj.pcollections.MutableSet,
-                                             label, create=set())
+    @lazy
+    def _members(self):
+        """Index Set, opened on first use"""
+        return self.obj._ensure_pobj(self.obj.pcollections.MutableSet,
+                                     self._label, create=set())
 
     def destroy(self):
         """Cleanup Index"""
 
         for key in self.by_key():
-            slv = self._slave_generator(key, **self._extra_kwargs)
-            utility.check_isinstance(slv, SlaveObjIndex)
-            slv._members.discard(self.obj.key)
+            pkey, gen_pkey, peer_set = _peer_set(self, key, self._slave_generator, SlaveObjIndex)
+            self.obj._queue_rem("srem", (pkey, self.obj.key),
+                                lambda peer_set=peer_set: peer_set().discard(self.obj.key))
+            self.obj._queue_rem(*_generation_entry(self.obj.pcollections, gen_pkey))
 
         # Cleanup Set
-        self._members.rem()
+        self.obj._queue_rem("delete", (self.pkey,), lambda: self._members.rem())
 
     @property
     def obj(self):
@@ -479,23 +2406,70 @@ class MasterObjIndex(object):
     def type_member(self):
         return self._type_member
 
+    @property
+    def pkey(self):
+        return self.obj._build_pkey(postfix=self._label)
+
     def add(self, val):
-        key = self.obj.val_to_key(val)
-        slv = self._slave_generator(key, **self._extra_kwargs)
-        utility.check_isinstance(slv, SlaveObjIndex)
-        utility.check_isinstance(slv.obj, self.type_member)
-        utility.check_isinstance(self.obj, slv.type_member)
-        self._members.add(key)
-        slv._members.add(self.obj.key)
+        self.add_many([val])
 
     def remove(self, val):
-        key = self.obj.val_to_key(val)
-        slv = self._slave_generator(key, **self._extra_kwargs)
-        utility.check_isinstance(slv, SlaveObjIndex)
-        utility.check_isinstance(slv.obj, self.type_member)
-        utility.check_isinstance(self.obj, slv.type_member)
-        slv._members.discard(self.obj.key)
-        self._members.discard(key)
+        self.remove_many([val])
+
+    def add_many(self, vals):
+        """Link each of vals to this object, updating both sides in one batch"""
+        self._link(vals, True)
+
+    def remove_many(self, vals):
+        """Unlink each of vals from this object, updating both sides in one batch"""
+        self._link(vals, False)
+
+    def _link(self, vals, add):
+
+        keys = [self.obj.val_to_key(val) for val in vals]
+        peers = [_peer_set(self, key, self._slave_generator, SlaveObjIndex) for key in keys]
+        if not keys:
+            return
+
+        # Links made by key alone never opened the members, so check they exist
+        pindex = self._extra_kwargs.get('pindex')
+        checked = add and self._peer_label is not None and isinstance(pindex, ChildIndex)
+
+        gen_pkeys = [self.obj.generation_pkey] + [gen_pkey for _, gen_pkey, _ in peers]
+        redis = pbackend_redis(self.obj.pbackend)
+        if redis is None:
+            if checked:
+                for key, found in zip(keys, pindex.exists_many(keys)):
+                    if not found:
+                        pindex.get(key=key)
+            for key, (_, _, peer_set) in zip(keys, peers):
+                if add:
+                    self._members.add(key)
+                    peer_set().add(self.obj.key)
+                else:
+                    peer_set().discard(self.obj.key)
+                    self._members.discard(key)
+            _run_bumped(self.obj, [], gen_pkeys)
+            return
+
+        if checked:
+            pkeys = [pindex.pkey, self.pkey] + [pkey for pkey, _, _ in peers] + gen_pkeys
+            script = redis.register_script(_LINK_CHECKED_SCRIPT)
+            ret = int(script(keys=pkeys, args=[len(keys), self.obj.key] + keys))
+            if ret > 0:
+                # Raises ObjectDNE, unless the member was created since
+                pindex.get(key=keys[ret - 1])
+                self._link(keys, add)
+            return
+
+        pipe = redis.pipeline(transaction=True)
+        command = pipe.sadd if add else pipe.srem
+        command(self.pkey, *keys)
+        for pkey, _, _ in peers:
+            command(pkey, self.obj.key)
+        for gen_pkey in gen_pkeys:
+            pipe.incr(gen_pkey)
+        pipe.execute()
 
     def __len__(self):
         return len(self._members)
@@ -512,12 +2486,31 @@ class MasterObjIndex(object):
                     for key in self._members])
 
     def by_obj(self):
-        return set([self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
-                    for key in self._members])
+        return set(self.obj.vals_to_objs(self.by_key(), self.type_member, **self._extra_kwargs))
+
+    def iter_by_key(self, batch_size=None):
+        return scan_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         batch_size=batch_size)
+
+    def iter_by_uid(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_uid(key)
+
+    def iter_by_obj(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
+
+    def page_by_key(self, cursor=None, count=None):
+        return page_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         cursor=cursor, count=count)
 
 class SlaveObjIndex(object):
 
-    def __init__(self, obj, label, master_generator, type_member, **extra_kwargs):
+    __slots__ = ('_obj', '_label', '_master_generator', '_type_member', '_extra_kwargs', '_lazy',
+                 '_peer_label', '_peer_prefix')
+
+    def __init__(self, obj, label, master_generator, type_member,
+                 peer_label=None, peer_prefix=None, **extra_kwargs):
         """Initialize Slave Index"""
 
         # Call Parent
@@ -529,28 +2522,38 @@ class SlaveObjIndex(object):
         if not hasattr(master_generator, '__call__'):
             raise TypeError("slave_generator must be callable")
         utility.check_issubclass(type_member, PersistentObject)
+        if peer_label is not None:
+            utility.check_isinstance(peer_label, str)
+        if peer_prefix is not None:
+            utility.check_isinstance(peer_prefix, str)
 
         # Save Args
         self._obj = obj
         self._label = label
         self._master_generator = master_generator
         self._type_member = type_member
+        self._peer_label = peer_label
+        self._peer_prefix = peer_prefix
         self._extra_kwargs = extra_kwargs
+        self._lazy = {}
 
-        # Setup Index Set
-        self._members = self.obj._build_pobj(self.obj.pcollections.MutableSet,
-                                             label, create=set())
+    @lazy
+    def _members(self):
+        """Index Set, opened on first use"""
+        return self.obj._ensure_pobj(self.obj.pcollections.MutableSet,
+                                     self._label, create=set())
 
     def destroy(self):
         """Cleanup Index"""
 
         for key in self.by_key():
-            mas = self._master_generator(key, **self._extra_kwargs)
-            utility.check_isinstance(mas, MasterObjIndex)
-            mas._members.discard(self.obj.key)
+            pkey, gen_pkey, peer_set = _peer_set(self, key, self._master_generator, MasterObjIndex)
+            self.obj._queue_rem("srem", (pkey, self.obj.key),
+                                lambda peer_set=peer_set: peer_set().discard(self.obj.key))
+            self.obj._queue_rem(*_generation_entry(self.obj.pcollections, gen_pkey))
 
         # Cleanup Set
-        self._members.rem()
+        self.obj._queue_rem("delete", (self.pkey,), lambda: self._members.rem())
 
     @property
     def obj(self):
@@ -560,6 +2563,10 @@ class SlaveObjIndex(object):
     def type_member(self):
         return self._type_member
 
+    @property
+    def pkey(self):
+        return self.obj._build_pkey(postfix=self._label)
+
     def __len__(self):
         return len(self._members)
 
@@ -575,11 +2582,28 @@ class SlaveObjIndex(object):
                     for key in self._members])
 
     def by_obj(self):
-        return set([self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
-                    for key in self._members])
+        return set(self.obj.vals_to_objs(self.by_key(), self.type_member, **self._extra_kwargs))
+
+    def iter_by_key(self, batch_size=None):
+        return scan_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         batch_size=batch_size)
+
+    def iter_by_uid(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_uid(key)
+
+    def iter_by_obj(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
+
+    def page_by_key(self, cursor=None, count=None):
+        return page_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         cursor=cursor, count=count)
 
 class PlainObjIndex(object):
 
+    __slots__ = ('_obj', '_label', '_type_member', '_extra_kwargs', '_lazy')
+
     def __init__(self, obj, label, type_member, init=None, **extra_kwargs):
         """Initialize Member Index"""
 
@@ -593,24 +2617,30 @@ class PlainObjIndex(object):
         if init:
             utility.check_isinstance(init, set, list)
             init = set(init)
-        else:
-            init = set()
 
         # Save Args
         self._obj = obj
         self._label = label
         self._type_member = type_member
         self._extra_kwargs = extra_kwargs
+        self._lazy = {}
 
         # Setup Index Set
-        self._members = self.obj._build_pobj(self.obj.pcollections.MutableSet,
-                                             label, create=init)
+        if init:
+            self._members = self.obj._build_pobj(self.obj.pcollections.MutableSet,
+                                                 label, create=init)
+
+    @lazy
+    def _members(self):
+        """Index Set, opened on first use"""
+        return self.obj._ensure_pobj(self.obj.pcollections.MutableSet,
+                                     self._label, create=set())
 
     def destroy(self):
         """Cleanup Index"""
 
         # Cleanup Set
-        self._members.rem()
+        self.obj._queue_rem("delete", (self.pkey,), lambda: self._members.rem())
 
     @property
     def obj(self):
@@ -620,13 +2650,19 @@ class PlainObjIndex(object):
     def type_member(self):
         return self._type_member
 
+    @property
+    def pkey(self):
+        return self.obj._build_pkey(postfix=self._label)
+
     def add(self, val):
         key = self.obj.val_to_key(val)
-        self._members.add(key)
+        _run_bumped(self.obj, [("sadd", (self.pkey, key), lambda: self._members.add(key))],
+                    [self.obj.generation_pkey])
 
     def remove(self, val):
         key = self.obj.val_to_key(val)
-        self._members.discard(key)
+        _run_bumped(self.obj, [("srem", (self.pkey, key), lambda: self._members.discard(key))],
+                    [self.obj.generation_pkey])
 
     def __len__(self):
         return len(self._members)
@@ -643,5 +2679,20 @@ class PlainObjIndex(object):
                     for key in self._members])
 
     def by_obj(self):
-        return set([self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
-                    for key in self._members])
+        return set(self.obj.vals_to_objs(self.by_key(), self.type_member, **self._extra_kwargs))
+
+    def iter_by_key(self, batch_size=None):
+        return scan_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         batch_size=batch_size)
+
+    def iter_by_uid(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_uid(key)
+
+    def iter_by_obj(self, batch_size=None):
+        for key in self.iter_by_key(batch_size=batch_size):
+            yield self.obj.val_to_obj(key, self.type_member, **self._extra_kwargs)
+
+    def page_by_key(self, cursor=None, count=None):
+        return page_pset(self.obj.pbackend, self.pkey, self.by_key,
+                         cursor=cursor, count=count)
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+
+# Andy Sayler
+# Copyright 2015
+
+
+### Imports ###
+
+import copy
+import fnmatch
+import os
+import pickle
+import tempfile
+import threading
+
+from pcollections import abc_base
+
+from . import utility
+
+
+### Backend ###
+
+class MemoryBackend(object):
+
+    def __init__(self, path=None):
+        """Initialize in-process backend, loading the snapshot at path if present"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        if path is not None:
+            utility.check_isinstance(path, str)
+
+        # Save Args
+        self._path = path
+
+        # Setup Store
+        self._lock = threading.RLock()
+        self._store = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+
+        # Setup Types
+        self._pcollections = MemoryCollections(self)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def pcollections(self):
+        return self._pcollections
+
+    def __len__(self):
+        return self.dbsize()
+
+    def dbsize(self):
+        with self._lock:
+            return len(self._store)
+
+    def keys(self, pattern="*"):
+        with self._lock:
+            return [key for key in self._store if fnmatch.fnmatchcase(key, pattern)]
+
+    def items(self, pattern="*"):
+        """Yield (key, type name, value) for each stored pobj matching pattern"""
+
+        for key in self.keys(pattern):
+            with self._lock:
+                try:
+                    type_name, val = self._store[key]
+                except KeyError:
+                    continue
+                val = copy.deepcopy(val)
+            yield key, type_name, val
+
+    def item(self, key):
+        """Return (type name, value) of the pobj at key, or None if missing"""
+
+        with self._lock:
+            try:
+                type_name, val = self._store[key]
+            except KeyError:
+                return None
+            return type_name, copy.deepcopy(val)
+
+    def flushdb(self):
+        with self._lock:
+            self._store.clear()
+
+    def snapshot(self, path=None):
+        """Atomically write the store to path"""
+
+        path = path if path else self._path
+        if path is None:
+            raise ValueError("No snapshot path")
+
+        with self._lock:
+            data = pickle.dumps(self._store, protocol=pickle.HIGHEST_PROTOCOL)
+
+        fd, tmp = tempfile.mkstemp(dir=(os.path.dirname(os.path.abspath(path))))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def load(self, path=None):
+        """Replace the store with the snapshot at path"""
+
+        path = path if path else self._path
+        if path is None:
+            raise ValueError("No snapshot path")
+
+        with open(path, 'rb') as f:
+            store = pickle.load(f)
+        with self._lock:
+            self._store = store
+
+    def close(self):
+        """Snapshot to path, if one was given"""
+
+        if self._path is not None:
+            self.snapshot()
+
+    def _read(self, pobj, view=copy.deepcopy):
+        """Return view applied to the value stored for pobj"""
+
+        # The live value must not escape the lock, so view copies what it returns
+        with self._lock:
+            try:
+                type_name, val = self._store[pobj.key]
+            except KeyError:
+                raise KeyError("PObject '{}' does not exist".format(pobj.key))
+            pobj._check_type(type_name)
+            return view(val)
+
+    def _write(self, pobj, val, create_only=False):
+        """Store val for pobj, unless create_only and the key already exists"""
+
+        with self._lock:
+            if pobj.key in self._store:
+                type_name, _ = self._store[pobj.key]
+                pobj._check_type(type_name)
+                if create_only:
+                    return
+            self._store[pobj.key] = (pobj.type_name, val)
+
+    def _update(self, pobj, update):
+        """Apply update to the stored value for pobj in place and return its result"""
+
+        return self._read(pobj, update)
+
+    def _exists(self, pobj):
+        with self._lock:
+            return pobj.key in self._store
+
+    def _delete(self, pobj):
+        with self._lock:
+            self._store.pop(pobj.key, None)
+
+
+### PObjects ###
+
+class MemoryPersistent(object):
+
+    # Set on the per-backend subclasses built by MemoryCollections
+    _pbackend = None
+
+    # Shared by the mutable and immutable variant of each type
+    type_name = None
+    _convert = staticmethod(copy.deepcopy)
+
+    def __init__(self, key, create=None, existing=None):
+        """Initialize PObject, writing create if the key does not exist"""
+
+        #                      create
+        # OPEN_EXISTING         None
+        # CREATE_OR_OPEN        Val
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(key, str)
+
+        # Save Args
+        self._key = key
+
+        # Create Value
+        if create is not None:
+            self._pbackend._write(self, self._convert(create), create_only=True)
+
+    def __repr__(self):
+        return "{:s}_{:s}".format(type(self).__name__, self.key)
+
+    @property
+    def key(self):
+        return self._key
+
+    def _check_type(self, type_name):
+        if type_name != self.type_name:
+            msg = "PObject '{}' holds a '{}', not a '{}'".format(self.key, type_name,
+                                                                 self.type_name)
+            raise TypeError(msg)
+
+    def exists(self):
+        return self._pbackend._exists(self)
+
+    def rem(self):
+        self._pbackend._delete(self)
+
+    def get_val(self):
+        return self._pbackend._read(self)
+
+    def set_val(self, val):
+        self._pbackend._write(self, self._convert(val))
+
+    def __len__(self):
+        return self._pbackend._read(self, len)
+
+    def __iter__(self):
+        return iter(self.get_val())
+
+    def __contains__(self, item):
+        return self._pbackend._read(self, lambda val: item in val)
+
+class String(MemoryPersistent):
+
+    type_name = "String"
+    _convert = staticmethod(str)
+
+    def __str__(self):
+        return self.get_val()
+
+class MutableString(String):
+    pass
+
+class List(MemoryPersistent):
+
+    type_name = "List"
+    _convert = staticmethod(lambda val: list(copy.deepcopy(val)))
+
+    def __getitem__(self, i):
+        return self._pbackend._read(self, lambda val: copy.deepcopy(val[i]))
+
+class MutableList(List):
+
+    def __setitem__(self, i, item):
+        item = copy.deepcopy(item)
+        self._pbackend._update(self, lambda val: val.__setitem__(i, item))
+
+    def __delitem__(self, i):
+        self._pbackend._update(self, lambda val: val.__delitem__(i))
+
+    def append(self, item):
+        item = copy.deepcopy(item)
+        self._pbackend._update(self, lambda val: val.append(item))
+
+    def extend(self, items):
+        items = copy.deepcopy(list(items))
+        self._pbackend._update(self, lambda val: val.extend(items))
+
+    def insert(self, i, item):
+        item = copy.deepcopy(item)
+        self._pbackend._update(self, lambda val: val.insert(i, item))
+
+    def pop(self, i=-1):
+        return self._pbackend._update(self, lambda val: val.pop(i))
+
+class Set(MemoryPersistent):
+
+    type_name = "Set"
+    _convert = staticmethod(lambda val: set(copy.deepcopy(val)))
+
+class MutableSet(Set):
+
+    def add(self, item):
+        self._pbackend._update(self, lambda val: val.add(item))
+
+    def discard(self, item):
+        self._pbackend._update(self, lambda val: val.discard(item))
+
+    def remove(self, item):
+        self._pbackend._update(self, lambda val: val.remove(item))
+
+    def update(self, items):
+        items = set(items)
+        self._pbackend._update(self, lambda val: val.update(items))
+
+class Dictionary(MemoryPersistent):
+
+    type_name = "Dictionary"
+    _convert = staticmethod(lambda val: dict(copy.deepcopy(val)))
+
+    def __getitem__(self, k):
+        return self._pbackend._read(self, lambda val: copy.deepcopy(val[k]))
+
+    def get(self, k, default=None):
+        return self._pbackend._read(self, lambda val: copy.deepcopy(val.get(k, default)))
+
+    def keys(self):
+        return self.get_val().keys()
+
+    def values(self):
+        return self.get_val().values()
+
+    def items(self):
+        return self.get_val().items()
+
+class MutableDictionary(Dictionary):
+
+    def __setitem__(self, k, item):
+        item = copy.deepcopy(item)
+        self._pbackend._update(self, lambda val: val.__setitem__(k, item))
+
+    def __delitem__(self, k):
+        self._pbackend._update(self, lambda val: val.__delitem__(k))
+
+    def update(self, items):
+        items = copy.deepcopy(dict(items))
+        self._pbackend._update(self, lambda val: val.update(items))
+
+    def pop(self, k, *default):
+        return self._pbackend._update(self, lambda val: val.pop(k, *default))
+
+_TYPES = (String, MutableString, List, MutableList, Set, MutableSet,
+          Dictionary, MutableDictionary)
+
+# Let pobj type checks written against pcollections accept these too
+abc_base.Persistent.register(MemoryPersistent)
+for _type in _TYPES:
+    if hasattr(abc_base, _type.__name__):
+        getattr(abc_base, _type.__name__).register(_type)
+
+class MemoryCollections(object):
+
+    def __init__(self, pbackend):
+        """Initialize PCollections style factory of pobj types bound to pbackend"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(pbackend, MemoryBackend)
+
+        # Save Args
+        self._pbackend = pbackend
+
+        # Bind Types
+        for obj_type in _TYPES:
+            bound = type(obj_type.__name__, (obj_type,), {'_pbackend': pbackend})
+            setattr(self, obj_type.__name__, bound)
+
+    @property
+    def pbackend(self):
+        return self._pbackend
@@ -6,10 +6,14 @@
 
 ### Imports ###
 
+import functools
+import time
 import uuid
 import urllib.parse
+import zlib
 
 
+from . import constants
 from . import utility
 from . import datatypes
 
@@ -21,30 +25,141 @@ _INDEX_KEY_COLLECTIONS = "collections"
 
 _KEY_STORAGESRV = "storage"
 
+_READ_CHUNKS = 16
+_COMPRESS_THRESHOLD = 256
+
 _PREFIX_COLLECTION = "collection"
 _PREFIX_SECRET = "secret"
 
 _POSTFIX_DATA = "data"
+_POSTFIX_CHUNKS = "chunks"
+_POSTFIX_CHUNKSIZE = "chunksize"
+_POSTFIX_ZDATA = "zdata"
+_POSTFIX_VERSION = "version"
+_POSTFIX_VERSIONS = "versions"
+_POSTFIX_VERSIONTIMES = "versiontimes"
+_POSTFIX_COMPRESSION = "compression"
 _POSTFIX_ACSERVERS = "acservers"
 _POSTFIX_ACREQUIRED = "acrequired"
 
+datatypes.register_key_codes({_INDEX_KEY_SECRETS: "SI",
+                              _PREFIX_COLLECTION: "C",
+                              _PREFIX_SECRET: "S",
+                              _POSTFIX_DATA: "D",
+                              _POSTFIX_CHUNKS: "DC",
+                              _POSTFIX_CHUNKSIZE: "DZ",
+                              _POSTFIX_ZDATA: "DX",
+                              _POSTFIX_VERSION: "DV",
+                              _POSTFIX_VERSIONS: "DH",
+                              _POSTFIX_VERSIONTIMES: "DT",
+                              _POSTFIX_COMPRESSION: "CZ",
+                              _POSTFIX_ACSERVERS: "AS",
+                              _POSTFIX_ACREQUIRED: "AR"})
+
+# KEYS: collections index, secrets index, data, zdata, chunks, latest version, versions
+# ARGV: collection key, secret key
+_READ_SECRET_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 0 then
+    return {1}
+end
+if redis.call('SISMEMBER', KEYS[2], ARGV[2]) == 0 then
+    return {2}
+end
+local data = redis.call('GET', KEYS[3])
+if data then
+    return {0, data}
+end
+local zdata = redis.call('HMGET', KEYS[4], 'compression', 'data')
+if zdata[1] then
+    return {0, zdata[2], zdata[1]}
+end
+local chunks = redis.call('LRANGE', KEYS[5], 0, -1)
+if #chunks > 0 then
+    return {0, table.concat(chunks)}
+end
+local version = redis.call('GET', KEYS[6])
+if version then
+    return {0, redis.call('HGET', KEYS[7], version)}
+end
+return {3}
+"""
+
+# KEYS: latest version, versions, version times, generation
+# ARGV: data, creation time
+_ADD_VERSION_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('HSET', KEYS[2], version, ARGV[1])
+redis.call('HSET', KEYS[3], version, ARGV[2])
+redis.call('INCR', KEYS[4])
+return version
+"""
+
+
+### Functions ###
+
+def compress_data(compression, data):
+    """Return data compressed with compression, as bytes"""
+
+    if compression == constants.COMPRESSION_ZLIB:
+        return zlib.compress(data.encode('utf-8'))
+    else:
+        raise ValueError("Unknown compression '{}'".format(compression))
+
+def decompress_data(compression, stored):
+    """Return data from the bytes returned by compress_data"""
+
+    # Backups hand raw bytes back as surrogate escaped text
+    if isinstance(stored, str):
+        stored = stored.encode('utf-8', 'surrogateescape')
+
+    if compression == constants.COMPRESSION_ZLIB:
+        return zlib.decompress(stored).decode('utf-8')
+    else:
+        raise ValueError("Unknown compression '{}'".format(compression))
+
+def _read_secret_pkeys(sec_key, scheme):
+    """Return the pkeys of each layout _READ_SECRET_SCRIPT reads for the secret at sec_key"""
+
+    pkey = functools.partial(datatypes.build_pkey, sec_key, prefix=_PREFIX_SECRET, scheme=scheme)
+    return [pkey(postfix=_POSTFIX_DATA), pkey(postfix=_POSTFIX_ZDATA),
+            pkey(postfix=_POSTFIX_CHUNKS), pkey(postfix=_POSTFIX_VERSION),
+            pkey(postfix=_POSTFIX_VERSIONS)]
+
+def _read_secret_data(ret):
+    """Return the data in a _READ_SECRET_SCRIPT reply, or None if it found none"""
+
+    if int(ret[0]) != 0:
+        return None
+    elif len(ret) > 2:
+        return decompress_data(datatypes.decode_val(ret[2]), ret[1])
+    else:
+        return datatypes.decode_val(ret[1])
+
 
 ### Objects ###
 
 class StorageServer(datatypes.ServerObject):
 
+    __slots__ = ()
+
     def __init__(self, pbackend, key=_KEY_STORAGESRV, create=False):
 
         # Call Parent
         super().__init__(pbackend, key=key, create=create)
 
-        # Setup Collections Index
-        self._collections = datatypes.ChildIndex(self, Collection, _INDEX_KEY_SECRETS)
+    @datatypes.lazy
+    def _collections(self):
+        return datatypes.ChildIndex(self, Collection, _INDEX_KEY_SECRETS)
 
-    def destroy(self):
+    @classmethod
+    def reap_indexes(cls):
+        return [(_INDEX_KEY_SECRETS, Collection, False)]
+
+    def destroy(self, cascade=None):
+        """Delete Storage Server, reaping its collections in the background if cascade"""
 
         # Cleanup Indexes
-        self._collections.destroy()
+        self._collections.destroy(cascade=cascade)
 
         # Call Parent
         super().destroy()
@@ -53,10 +168,42 @@ class StorageServer(datatypes.ServerObject):
     def collections(self):
         return self._collections
 
+    def read_secret(self, col_uid, sec_uid):
+        """Return the data of a secret, checking both indexes in one round trip"""
+
+        redis = datatypes.pbackend_redis(self.pbackend)
+        if redis is None:
+            return self._read_secret_objs(col_uid, sec_uid)
+
+        col_key = self.val_to_key(col_uid)
+        sec_key = self.val_to_key(sec_uid)
+        col_pkey = datatypes.build_pkey(col_key, prefix=_PREFIX_COLLECTION,
+                                        postfix=_INDEX_KEY_SECRETS, scheme=self._scheme)
+        keys = [self._collections.pkey, col_pkey] + _read_secret_pkeys(sec_key, self._scheme)
+        script = redis.register_script(_READ_SECRET_SCRIPT)
+        data = _read_secret_data(script(keys=keys, args=[col_key, sec_key]))
+
+        if data is None:
+            # Let the normal path raise ObjectDNE, or read an empty chunked secret
+            return self._read_secret_objs(col_uid, sec_uid)
+        return data
+
+    def _read_secret_objs(self, col_uid, sec_uid):
+        return self.collections.get(uid=col_uid).secrets.get(uid=sec_uid).data
+
 class Collection(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ('_ac_required',)
+
+    packed_fields = True
+
+    reap_prefix = _PREFIX_COLLECTION
+
+    _ac_servers = datatypes.lazy_pobj("MutableList", _POSTFIX_ACSERVERS)
+
     def __init__(self, pbackend, pindex=None, prefix=_PREFIX_COLLECTION, 
-                 ac_servers=None, ac_required=None, create=False, **kwargs):
+                 ac_servers=None, ac_required=None, compression=None,
+                 compress_threshold=_COMPRESS_THRESHOLD, create=False, **kwargs):
         """Initialize Collection"""
 
         # Check Input
@@ -64,6 +211,8 @@ class Collection(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Child
         if create:
             utility.check_isinstance(ac_servers, list)
             utility.check_isinstance(ac_required, int)
+            if compression is not None:
+                self._check_compression(compression, compress_threshold)
 
             urls = []
             for url in ac_servers:
@@ -80,23 +229,63 @@ class Collection(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Child
         super().__init__(pbackend, pindex=pindex, prefix=prefix, create=create, **kwargs)
 
         # Setup Objects
-        self._ac_servers = self._build_pobj(self.pcollections.MutableList,
-                                            _POSTFIX_ACSERVERS, create=ac_servers)
-        self._ac_required = self._build_pobj(self.pcollections.MutableString,
-                                             _POSTFIX_ACREQUIRED, create=str(ac_required))
-
-        # Setup Secret Index
-        self._secrets = datatypes.ChildIndex(self, Secret, _INDEX_KEY_SECRETS)
-
-    def destroy(self):
-        """Delete Collection"""
+        if create:
+            self._ac_servers = self._build_pobj(self.pcollections.MutableList,
+                                                _POSTFIX_ACSERVERS, create=ac_servers)
+        self._ac_required = self._build_field(_POSTFIX_ACREQUIRED,
+                                              create=str(ac_required), mutable=True)
+        if create:
+            if compression is not None:
+                self._build_pobj(self.pcollections.MutableString, _POSTFIX_COMPRESSION,
+                                 create="{}:{}".format(compression, compress_threshold))
+                self._compression = (compression, compress_threshold)
+            else:
+                self._compression = None
+
+    @staticmethod
+    def _check_compression(compression, threshold):
+
+        utility.check_isinstance(compression, str)
+        utility.check_isinstance(threshold, int)
+        if compression not in constants.COMPRESSION_TYPES:
+            raise ValueError("Unknown compression '{}'".format(compression))
+        if threshold < 0:
+            raise ValueError("compress_threshold must not be negative")
+
+    @datatypes.lazy
+    def _compression(self):
+        """(compression, threshold) for compressing collections, None otherwise"""
+
+        pkey = self._build_pkey(postfix=_POSTFIX_COMPRESSION)
+        pobj = self.pcollections.MutableString(pkey, create=None, existing=None)
+        if not pobj.exists():
+            return None
+        compression, threshold = pobj.get_val().split(":")
+        return (compression, int(threshold))
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_ACREQUIRED, _POSTFIX_ACSERVERS,
+                                           _POSTFIX_COMPRESSION]
+
+    @classmethod
+    def reap_indexes(cls):
+        return [(_INDEX_KEY_SECRETS, Secret, True)]
+
+    @datatypes.lazy
+    def _secrets(self):
+        return SecretIndex(self, Secret, _INDEX_KEY_SECRETS, ordered=True)
+
+    def destroy(self, cascade=None):
+        """Delete Collection, reaping its secrets in the background if cascade"""
 
         # Cleanup Indexes
-        self._secrets.destroy()
+        self._secrets.destroy(cascade=cascade)
 
         # Cleanup Objects
-        self._ac_required.rem()
-        self._ac_servers.rem()
+        self._rem_pobj("_ac_required", _POSTFIX_ACREQUIRED)
+        self._rem_pobj("_ac_servers", _POSTFIX_ACSERVERS)
+        self._rem_optional(self.pcollections.MutableString, _POSTFIX_COMPRESSION)
 
         # Call Parent
         super().destroy()
@@ -114,32 +303,184 @@ class Collection(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.Child
     def ac_required(self):
         return int(self._ac_required.get_val())
 
+    @property
+    def ac_policy(self):
+        """Return an ACPolicy snapshot, rebuilt only after the collection changes"""
+
+        return datatypes.generation_cache.get(self, "ac_policy", self._build_ac_policy)
+
+    def _build_ac_policy(self):
+        return ACPolicy(self.ac_servers, self.ac_required)
+
+    def set_ac_required(self, ac_required):
+        """Change the number of AC server tokens required"""
+
+        utility.check_isinstance(ac_required, int)
+        self._ac_required.set_val(str(ac_required))
+
+    @property
+    def compression(self):
+        return self._compression
+
+    def set_compression(self, compression, compress_threshold=_COMPRESS_THRESHOLD):
+        """Compress secrets created from now on, or stop if compression is None"""
+
+        pkey = self._build_pkey(postfix=_POSTFIX_COMPRESSION)
+        pobj = self.pcollections.MutableString(pkey, create=None, existing=None)
+        if compression is None:
+            entry = ("delete", (pkey,), pobj.rem)
+        else:
+            self._check_compression(compression, compress_threshold)
+            val = "{}:{}".format(compression, compress_threshold)
+            entry = ("set", (pkey, val), functools.partial(pobj.set_val, val))
+            compression = (compression, compress_threshold)
+        datatypes._run_bumped(self, [entry], [self.generation_pkey])
+        self._compression = compression
+
     @property
     def secrets(self):
         return self._secrets
 
 class Secret(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
 
+    __slots__ = ()
+
+    reap_prefix = _PREFIX_SECRET
+
+    _data = datatypes.lazy_pobj("String", _POSTFIX_DATA)
+    _zdata = datatypes.lazy_pobj("Dictionary", _POSTFIX_ZDATA)
+    _chunks = datatypes.lazy_pobj("MutableList", _POSTFIX_CHUNKS)
+    _versions = datatypes.lazy_pobj("MutableDictionary", _POSTFIX_VERSIONS)
+    _version_times = datatypes.lazy_pobj("MutableDictionary", _POSTFIX_VERSIONTIMES)
+
     def __init__(self, pbackend, pindex=None, create=False, prefix=_PREFIX_SECRET,
-                 data="", **kwargs):
-        """Initialize Secret"""
+                 data="", chunk_size=None, versioned=False, **kwargs):
+        """Initialize Secret, storing data in chunk_size pieces if chunk_size is given"""
 
         # Check Input
         utility.check_isinstance(pindex.parent, Collection)
         if create:
             utility.check_isinstance(data, str)
+            utility.check_isinstance(versioned, bool)
+            if chunk_size is not None:
+                utility.check_isinstance(chunk_size, int)
+                if chunk_size < 1:
+                    raise ValueError("chunk_size must be positive")
+                if versioned:
+                    raise ValueError("Versioned secrets can't be chunked")
 
         # Call Parent
         super().__init__(pbackend, pindex=pindex, create=create, prefix=prefix, **kwargs)
 
         # Setup Data
-        self._data = self._build_pobj(self.pcollections.String, _POSTFIX_DATA, create=data)
+        if create:
+            if versioned:
+                self._create_versioned(data)
+            elif chunk_size is not None:
+                self._create_chunked(data, chunk_size)
+            elif not self._create_compressed(data):
+                self._data = self._build_pobj(self.pcollections.String, _POSTFIX_DATA,
+                                              create=data)
+                self._layout = _POSTFIX_DATA
+
+    def _create_chunked(self, data, chunk_size):
+
+        # Empty data is kept as one empty chunk so the list exists
+        chunks = [data[i:i+chunk_size] for i in range(0, max(len(data), 1), chunk_size)]
+        self._chunks = self._build_pobj(self.pcollections.MutableList,
+                                        _POSTFIX_CHUNKS, create=chunks)
+        self._build_pobj(self.pcollections.String, _POSTFIX_CHUNKSIZE,
+                         create=str(chunk_size))
+        self._chunk_size = chunk_size
+        self._layout = _POSTFIX_CHUNKSIZE
+
+    def _create_versioned(self, data):
+
+        # Version 1 holds the initial data, the latest pointer is written last
+        now = repr(time.time())
+        self._versions = self._build_pobj(self.pcollections.MutableDictionary,
+                                          _POSTFIX_VERSIONS, create={'1': data})
+        self._version_times = self._build_pobj(self.pcollections.MutableDictionary,
+                                               _POSTFIX_VERSIONTIMES, create={'1': now})
+        self._build_pobj(self.pcollections.MutableString, _POSTFIX_VERSION, create="1")
+        self._layout = _POSTFIX_VERSION
+
+    def _create_compressed(self, data):
+        """Store data compressed if the collection asks for it and it helps"""
+
+        setting = self.collection.compression
+        if setting is None:
+            return False
+        compression, threshold = setting
+        if len(data) < threshold:
+            return False
+        size = len(data.encode('utf-8'))
+        stored = compress_data(compression, data)
+        if len(stored) >= size:
+            return False
+
+        # Sizes are kept with the data for accounting
+        zdata = {'compression': compression, 'data': stored,
+                 'size': str(size), 'stored_size': str(len(stored))}
+        self._zdata = self._build_pobj(self.pcollections.Dictionary, _POSTFIX_ZDATA,
+                                       create=zdata)
+        self._layout = _POSTFIX_ZDATA
+        return True
+
+    @datatypes.lazy
+    def _layout(self):
+        """Postfix of the pobj that marks how the data is stored"""
+        return self._probe(read_data=False)[0]
+
+    def _probe(self, read_data):
+        """Return (layout, data) in one round trip, data only for whole secrets if read_data"""
+
+        postfixes = [_POSTFIX_DATA, _POSTFIX_ZDATA, _POSTFIX_CHUNKSIZE, _POSTFIX_VERSION]
+        pkeys = [self._build_pkey(postfix=postfix) for postfix in postfixes]
+        redis = datatypes.pbackend_redis(self.pbackend)
+        if redis is None:
+            pobj = self.pcollections.String(pkeys[0], create=None, existing=None)
+            data = pobj.get_val() if read_data and pobj.exists() else None
+            found = [self.pcollections.String(pkey, create=None, existing=None).exists()
+                     for pkey in pkeys]
+        else:
+            pipe = redis.pipeline(transaction=False)
+            if read_data:
+                pipe.get(pkeys[0])
+            for pkey in pkeys:
+                pipe.exists(pkey)
+            found = pipe.execute()
+            data = datatypes.decode_val(found.pop(0)) if read_data else None
+
+        for postfix, exists in zip(postfixes, found):
+            if exists:
+                return postfix, data
+        return None, None
+
+    @datatypes.lazy
+    def _chunk_size(self):
+        """Chunk size of chunked secrets"""
+
+        pkey = self._build_pkey(postfix=_POSTFIX_CHUNKSIZE)
+        return int(self.pcollections.String(pkey, create=None, existing=None).get_val())
+
+    @classmethod
+    def reap_postfixes(cls):
+        return super().reap_postfixes() + [_POSTFIX_DATA, _POSTFIX_ZDATA, _POSTFIX_CHUNKS,
+                                           _POSTFIX_CHUNKSIZE, _POSTFIX_VERSION,
+                                           _POSTFIX_VERSIONS, _POSTFIX_VERSIONTIMES]
 
     def destroy(self):
         """Delete Secret"""
 
-        # Cleanup Objects
-        self._data.rem()
+        # Cleanup Objects, whichever layout holds the data
+        self._rem_optional(self.pcollections.String, _POSTFIX_DATA)
+        self._rem_optional(self.pcollections.Dictionary, _POSTFIX_ZDATA)
+        self._rem_optional(self.pcollections.MutableList, _POSTFIX_CHUNKS)
+        self._rem_optional(self.pcollections.String, _POSTFIX_CHUNKSIZE)
+        self._rem_optional(self.pcollections.MutableString, _POSTFIX_VERSION)
+        self._rem_optional(self.pcollections.MutableDictionary, _POSTFIX_VERSIONS)
+        self._rem_optional(self.pcollections.MutableDictionary, _POSTFIX_VERSIONTIMES)
 
         # Call Parent
         super().destroy()
@@ -154,7 +495,339 @@ class Secret(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObje
         """Return Collection"""
         return self.parent
 
+    @property
+    def chunked(self):
+        return self._layout == _POSTFIX_CHUNKSIZE
+
+    @property
+    def compressed(self):
+        return self._layout == _POSTFIX_ZDATA
+
+    @property
+    def compressed_size(self):
+        """Return the stored size of compressed data, None if uncompressed"""
+
+        if not self.compressed:
+            return None
+        return int(self._zdata['stored_size'])
+
+    @property
+    def versioned(self):
+        return self._layout == _POSTFIX_VERSION
+
+    @property
+    def version(self):
+        """Return the latest version number, 1 for unversioned secrets"""
+
+        if not self.versioned:
+            return 1
+        pkey = self._build_pkey(postfix=_POSTFIX_VERSION)
+        return int(self.pcollections.MutableString(pkey, create=None, existing=None).get_val())
+
+    def versions(self):
+        """Return [(version, creation time)] for the versions kept, oldest first"""
+
+        self._check_versioned()
+        times = self._version_times.get_val()
+        return sorted([(int(version), float(created)) for version, created in times.items()])
+
+    def get_version(self, version):
+        """Return the data of an old or current version"""
+
+        utility.check_isinstance(version, int)
+        self._check_versioned()
+        try:
+            return self._versions[str(version)]
+        except KeyError:
+            raise KeyError("Secret '{}' has no version {}".format(self.key, version))
+
+    def add_version(self, data):
+        """Store data as the new latest version and return its version number"""
+
+        utility.check_isinstance(data, str)
+        self._check_versioned()
+
+        now = repr(time.time())
+        pkeys = [self._build_pkey(postfix=postfix) for postfix in
+                 [_POSTFIX_VERSION, _POSTFIX_VERSIONS, _POSTFIX_VERSIONTIMES]]
+        pkeys.append(self.generation_pkey)
+        redis = datatypes.pbackend_redis(self.pbackend)
+        if redis is not None:
+            script = redis.register_script(_ADD_VERSION_SCRIPT)
+            return int(script(keys=pkeys, args=[data, now]))
+
+        # Move the pointer only once the version is readable
+        pointer = self.pcollections.MutableString(pkeys[0], create=None, existing=None)
+        version = int(pointer.get_val()) + 1
+        self._versions[str(version)] = data
+        self._version_times[str(version)] = now
+        pointer.set_val(str(version))
+        self._bump_generation()
+        return version
+
+    def prune_versions(self, keep=None, max_age=None):
+        """Remove and return versions past the newest keep or older than max_age seconds"""
+
+        # The latest version is never removed
+
+        if keep is not None:
+            utility.check_isinstance(keep, int)
+            if keep < 1:
+                raise ValueError("keep must be positive")
+        if max_age is not None:
+            utility.check_isinstance(max_age, int, float)
+            if max_age < 0:
+                raise ValueError("max_age must not be negative")
+
+        versions = self.versions()
+        latest = self.version
+        cutoff = time.time() - max_age if max_age is not None else None
+        pruned = []
+        for i, (version, created) in enumerate(versions):
+            if version == latest:
+                continue
+            if keep is not None and i < len(versions) - keep:
+                pruned.append(version)
+            elif cutoff is not None and created < cutoff:
+                pruned.append(version)
+        if not pruned:
+            return pruned
+
+        fields = [str(version) for version in pruned]
+        entries = []
+        for attr, postfix in [("_versions", _POSTFIX_VERSIONS),
+                              ("_version_times", _POSTFIX_VERSIONTIMES)]:
+            entries.append(("hdel", (self._build_pkey(postfix=postfix),) + tuple(fields),
+                            functools.partial(self._del_fields, attr, fields)))
+        datatypes._run_bumped(self, entries, [self.generation_pkey])
+        return pruned
+
+    def _del_fields(self, attr, fields):
+        pobj = getattr(self, attr)
+        for field in fields:
+            del pobj[field]
+
+    def _check_versioned(self):
+        if not self.versioned:
+            raise TypeError("Secret '{}' is not versioned".format(self.key))
+
     @property
     def data(self):
         """Return Secret Data"""
-        return self._data.get_val()
+
+        data = self._unchunked_data()
+        if data is None:
+            data = "".join(self._iter_chunks(_READ_CHUNKS))
+        return data
+
+    def iter_data(self, read_chunks=None):
+        """Yield Secret Data in pieces, holding at most read_chunks chunks at a time"""
+
+        if read_chunks is None:
+            read_chunks = _READ_CHUNKS
+        utility.check_isinstance(read_chunks, int)
+        if read_chunks < 1:
+            raise ValueError("read_chunks must be positive")
+
+        data = self._unchunked_data()
+        if data is None:
+            yield from self._iter_chunks(read_chunks)
+        else:
+            yield data
+
+    def read_range(self, start, end=None):
+        """Return data[start:end], reading only the chunks that cover it"""
+
+        # Offsets count characters, which are bytes for the ASCII payloads secrets hold
+
+        utility.check_isinstance(start, int)
+        if end is not None:
+            utility.check_isinstance(end, int)
+        if start < 0 or (end is not None and end < 0):
+            raise ValueError("Range offsets must not be negative")
+
+        data = self._unchunked_data()
+        if data is not None:
+            return data[start:end]
+        if end is not None and end <= start:
+            return ""
+
+        chunk_size = self._chunk_size
+        first = start // chunk_size
+        last = -1 if end is None else (end - 1) // chunk_size
+        text = "".join(self._read_chunks(first, last))
+        offset = start - (first * chunk_size)
+        return text[offset:] if end is None else text[offset:offset + (end - start)]
+
+    def _unchunked_data(self):
+        """Return the (latest) data of a secret not stored chunked, None if it is chunked"""
+
+        # Whole secrets are the common case, so try them first through the cache; a
+        # miss reads the data and probes the other layouts in the same round trip
+        if '_layout' not in self._lazy or self._layout == _POSTFIX_DATA:
+            pkey = self._build_pkey(postfix=_POSTFIX_DATA)
+            data = datatypes.value_cache.get(self, pkey, self._probe_data)
+            if data is not None:
+                return data
+
+        layout = self._layout
+        if layout == _POSTFIX_CHUNKSIZE:
+            return None
+        elif layout == _POSTFIX_VERSION:
+            return self._latest_data()
+        elif layout != _POSTFIX_ZDATA:
+            pkey = self._build_pkey(postfix=_POSTFIX_DATA)
+            raise datatypes.PObjectDNE(self.pcollections.String(pkey, create=None, existing=None))
+
+        # Cache the decompressed value
+        pkey = self._build_pkey(postfix=_POSTFIX_ZDATA)
+        return datatypes.value_cache.get(self, pkey, self._decompress)
+
+    def _probe_data(self):
+        """Return the data of a whole secret, None for other layouts"""
+
+        self._layout, data = self._probe(read_data=True)
+        return data
+
+    def _latest_data(self):
+
+        # Versions never change, so only the pointer is read once cached
+        version = self.version
+        pkey = self._build_pkey(postfix=_POSTFIX_VERSIONS) + ":" + str(version)
+        return datatypes.value_cache.get(self, pkey, lambda: self.get_version(version))
+
+    def _decompress(self):
+
+        # Read past pcollections, which would decode the compressed bytes as text
+        redis = datatypes.pbackend_redis(self.pbackend)
+        if redis is None:
+            zdata = self._zdata.get_val()
+            return decompress_data(zdata['compression'], zdata['data'])
+        pkey = self._build_pkey(postfix=_POSTFIX_ZDATA)
+        compression, stored = redis.hmget(pkey, 'compression', 'data')
+        return decompress_data(datatypes.decode_val(compression), stored)
+
+    def _iter_chunks(self, read_chunks):
+
+        start = 0
+        while True:
+            chunks = self._read_chunks(start, start + read_chunks - 1)
+            yield from chunks
+            if len(chunks) < read_chunks:
+                break
+            start += read_chunks
+
+    def _read_chunks(self, first, last):
+        pkey = self._build_pkey(postfix=_POSTFIX_CHUNKS)
+        return datatypes.range_plist(self.pbackend, pkey, lambda: self._chunks, first, last)
+
+class SecretIndex(datatypes.ChildIndex):
+
+    __slots__ = ()
+
+    def fetch_many(self, uids, userdata=False):
+        """Return {uid: data}, or {uid: (data, userdata)}, for uids in one round trip"""
+
+        keys = [self.parent.val_to_key(uid) for uid in uids]
+        redis = datatypes.pbackend_redis(self.parent.pbackend)
+        if redis is None:
+            return self._fetch_each(keys, userdata)
+
+        # Membership and whichever layout holds each secret, versions included,
+        # read by the same script as read_secret, all in one pipeline
+        scheme = self.parent._scheme
+        col_key = self.parent.key
+        script = redis.register_script(_READ_SECRET_SCRIPT)
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pkeys = [self.parent.pindex.pkey, self.pkey] + _read_secret_pkeys(key, scheme)
+            script(keys=pkeys, args=[col_key, key], client=pipe)
+            if userdata:
+                pipe.hgetall(datatypes.build_pkey(key, prefix=_PREFIX_SECRET,
+                                                  postfix=datatypes._USERDATA_POSTFIX,
+                                                  scheme=scheme))
+        replies = iter(pipe.execute())
+
+        out = {}
+        for key in keys:
+            data = _read_secret_data(next(replies))
+            vals = self._decode_hash(next(replies)) if userdata else None
+            if data is None:
+                # Let the normal path raise ObjectDNE, or read an empty chunked secret
+                data = self.get(key=key).data
+            uid = self.parent.val_to_uid(key)
+            out[uid] = (data, vals) if userdata else data
+
+        return out
+
+    def _decode_hash(self, vals):
+        return {datatypes.decode_val(k): datatypes.decode_val(v) for k, v in vals.items()}
+
+    def _fetch_each(self, keys, userdata):
+
+        out = {}
+        for secret in self.get_many(keys):
+            if userdata:
+                out[secret.uid] = (secret.data, secret.userdata)
+            else:
+                out[secret.uid] = secret.data
+        return out
+
+class ACPolicy(object):
+
+    __slots__ = ('_servers', '_required', '_sigkeys')
+
+    def __init__(self, servers, required):
+        """Initialize immutable snapshot of a collection's access control settings"""
+
+        # Call Parent
+        super().__init__()
+
+        # Check Args
+        utility.check_isinstance(servers, list, tuple)
+        utility.check_isinstance(required, int)
+
+        # Save Args
+        self._servers = tuple([self.normalize_url(url) for url in servers])
+        self._required = required
+        self._sigkeys = None
+
+    @staticmethod
+    def normalize_url(url):
+        """Return url with a lowercase scheme and host and no trailing slash"""
+
+        p = urllib.parse.urlparse(url.rstrip('/'))
+        return urllib.parse.urlunparse(p._replace(scheme=p.scheme.lower(),
+                                                  netloc=p.netloc.lower()))
+
+    @property
+    def servers(self):
+        return self._servers
+
+    @property
+    def required(self):
+        return self._required
+
+    def sigkeys(self, manager=None):
+        """Return {server: sigkey}, resolving through manager on first use"""
+
+        if self._sigkeys is None:
+            if not manager:
+                manager = utility.SigkeyManager()
+            self._sigkeys = {server: manager.get_sigkey(server) for server in self._servers}
+        return dict(self._sigkeys)
+
+    def get_sigkey(self, url_srv):
+        """Return the resolved sigkey for url_srv, so the policy can act as a manager"""
+
+        if self._sigkeys is None:
+            self.sigkeys()
+        return self._sigkeys[self.normalize_url(url_srv)]
+
+    def verify(self, tokens, objperm, objtype, objuid=None, manager=None, error=True):
+        """Verify tokens against this policy, see utility.verify_auth_token_list"""
+
+        self.sigkeys(manager=manager)
+        return utility.verify_auth_token_list(tokens, self._servers, self._required,
+                                              objperm, objtype, objuid=objuid,
+                                              manager=self, error=error)
@@ -635,6 +635,19 @@ class VerifierTestCase(AccessControlTestCase, helpers.ObjectsHelpers):
         # Test Server
         self.assertEqual(verf.server, self.acs)
 
+        # Test Missing Members Not Linked
+        auth = self._create_authenticator(self.acs)
+        uids = [uuid.uuid4(), uuid.uuid4()]
+        self.assertRaises(datatypes.ObjectDNE, verf.authenticators.add_many,
+                          [auth, uids[0]])
+        self.assertRaises(datatypes.ObjectDNE, verf.accounts.add, uids[1])
+        self.assertEqual(len(verf.authenticators), 0)
+        self.assertEqual(len(verf.accounts), 0)
+        self.assertEqual(len(auth.verifiers), 0)
+        for uid in uids:
+            self.assertEqual(list(self.pdb.keys("*{}*".format(uid))), [])
+        auth.destroy()
+
         # Cleanup
         verf.destroy()
 
@@ -874,6 +887,21 @@ class AccountTestCase(AccessControlTestCase, helpers.ObjectsHelpers):
         # Cleanup
         acct.destroy()
 
+    def test_destroy_cascade(self):
+
+        # Create Account With Clients
+        self.acs.accounts.by_key()
+        size = self.pdb.dbsize()
+        acct = self._create_account(self.acs)
+        for i in range(3):
+            self._create_client(acct)
+
+        # Test Cascade, leaving the server's generation counter
+        acct.destroy(cascade=True)
+        self.assertFalse(self.acs.accounts.exists(acct.uid))
+        datatypes.reaper.join()
+        self.assertEqual(self.pdb.dbsize(), size + 1)
+
     def test_verifiers(self):
 
         # Create Authenticator
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2015, 2016
+# Tutamen Server Tests
+# Async Datatypes Tests
+
+
+### Imports ###
+
+## stdlib ##
+import asyncio
+import functools
+import uuid
+import unittest
+
+## tutamen_server ##
+from pytutamen_server import datatypes
+from pytutamen_server import aiodatatypes
+
+## Tests Common ##
+import tests_common
+
+
+### Helpers ###
+
+def run_async(test):
+    """Run an async test method against a fresh async backend"""
+
+    @functools.wraps(test)
+    def wrapper(self):
+
+        async def run():
+            pbackend = aiodatatypes.Backend.from_db(db=tests_common._REDIS_DB)
+            try:
+                await test(self, pbackend)
+                self.assertEqual(await pbackend.redis.dbsize(), 0)
+            finally:
+                await pbackend.close()
+
+        asyncio.run(run())
+
+    return wrapper
+
+class UUIDChild(aiodatatypes.UUIDObject, aiodatatypes.UserDataObject, aiodatatypes.ChildObject):
+
+    def __init__(self, pbackend, data=None, create=False, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, create=create, prefix="child", **kwargs)
+
+        # Setup Data
+        self._data = self._build_pobj(aiodatatypes.String, "data", create=data)
+
+    async def destroy(self):
+
+        # Cleanup Data
+        self._rem_pobj(self._data)
+
+        # Call Parent
+        await super().destroy()
+
+    @property
+    async def data(self):
+        return await self._data.get_val()
+
+class SyncUUIDChild(datatypes.UUIDObject, datatypes.UserDataObject, datatypes.ChildObject):
+
+    def __init__(self, pbackend, data=None, create=False, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, create=create, prefix="child", **kwargs)
+
+        # Setup Data
+        self._data = self._build_pobj(self.pcollections.String, "data", create=data)
+
+    def destroy(self):
+
+        # Cleanup Data
+        self._rem_pobj("_data", "data")
+
+        # Call Parent
+        super().destroy()
+
+    @property
+    def data(self):
+        return self._data.get_val()
+
+class MasterTestObj(aiodatatypes.UUIDObject):
+
+    def __init__(self, pbackend, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, prefix="master", **kwargs)
+
+        # Setup Index
+        async def slave_gen(key):
+            return (await SlaveTestObj(pbackend, key=key)).slaves
+        self.masters = aiodatatypes.MasterObjIndex(self, "slaves", slave_gen, SlaveTestObj)
+
+class SlaveTestObj(aiodatatypes.UUIDObject):
+
+    def __init__(self, pbackend, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, prefix="slave", **kwargs)
+
+        # Setup Index
+        async def master_gen(key):
+            return (await MasterTestObj(pbackend, key=key)).masters
+        self.slaves = aiodatatypes.SlaveObjIndex(self, "masters", master_gen, MasterTestObj)
+
+
+### Test Classes ###
+
+class ChildIndexTestCase(tests_common.BaseTestCase):
+
+    @run_async
+    async def test_create_get_and_destroy(self, pbackend):
+
+        # Create Index
+        parent = await aiodatatypes.PersistentObject(pbackend, key="TestParent")
+        idx = aiodatatypes.ChildIndex(parent, UUIDChild, "children")
+
+        # Test Create
+        child = await idx.create(data="test_data", userdata={'a': "1"})
+        self.assertIsInstance(child, UUIDChild)
+        self.assertTrue(await idx.exists(child.uid))
+        self.assertEqual(await idx.length(), 1)
+
+        # Test Get
+        got = await idx.get(uid=child.uid)
+        self.assertEqual(got, child)
+        self.assertEqual(await got.data, "test_data")
+        self.assertEqual(await got.userdata, {'a': "1"})
+
+        # Test Exists Errors
+        with self.assertRaises(datatypes.ObjectExists):
+            await idx.create(uid=child.uid, data="other")
+        with self.assertRaises(datatypes.ObjectDNE):
+            await idx.get(uid=uuid.uuid4())
+
+        # Test Destroy
+        await child.destroy()
+        self.assertFalse(await idx.exists(child.uid))
+
+        # Test Parent Generation
+        self.assertEqual(await parent.generation(), 2)
+
+        # Cleanup
+        await idx.destroy()
+        await parent.destroy()
+
+    @run_async
+    async def test_by_obj_and_paging(self, pbackend):
+
+        # Create Index
+        parent = await aiodatatypes.PersistentObject(pbackend, key="TestParent")
+        idx = aiodatatypes.ChildIndex(parent, UUIDChild, "children", ordered=True)
+
+        # Create Children
+        children = []
+        for i in range(12):
+            children.append(await idx.create(data=str(i)))
+        keys = [child.key for child in children]
+
+        # Test by_obj
+        self.assertEqual(await idx.by_obj(), set(children))
+        self.assertEqual(await idx.exists_many(keys + ["missing"]), ([True] * 12) + [False])
+
+        # Test Iter and Page
+        self.assertEqual(set([key async for key in idx.iter_by_key(batch_size=5)]), set(keys))
+        paged = set()
+        cursor = None
+        while True:
+            cursor, page = await idx.page_by_key(cursor=cursor, count=5)
+            paged.update(page)
+            if cursor is None:
+                break
+        self.assertEqual(paged, set(keys))
+
+        # Test Ordered Range
+        self.assertEqual(await idx.range_by_key(), keys)
+        self.assertEqual(await idx.range_by_obj(stop=1, reverse=True), children[-1:-3:-1])
+
+        # Cleanup
+        for child in children:
+            await child.destroy()
+        await idx.destroy()
+        await parent.destroy()
+
+class MasterSlaveObjIndexTestCase(tests_common.BaseTestCase):
+
+    @run_async
+    async def test_add_remove_and_destroy(self, pbackend):
+
+        # Create Objects
+        master = await MasterTestObj(pbackend, create=True)
+        slave = await SlaveTestObj(pbackend, create=True)
+
+        # Test Add
+        await master.masters.add(slave)
+        self.assertTrue(await master.masters.ismember(slave))
+        self.assertTrue(await slave.slaves.ismember(master))
+        self.assertEqual(await master.generation(), 1)
+        self.assertEqual(await slave.generation(), 1)
+
+        # Test Remove
+        await master.masters.remove(slave)
+        self.assertFalse(await master.masters.ismember(slave))
+        self.assertFalse(await slave.slaves.ismember(master))
+
+        # Test Destroy
+        await master.masters.add(slave)
+        await master.masters.destroy()
+        self.assertEqual(await slave.slaves.length(), 0)
+        self.assertEqual(await slave.generation(), 4)
+
+        # Test Add and Remove Many
+        others = [await SlaveTestObj(pbackend, create=True) for i in range(2)]
+        await master.masters.add_many(others)
+        self.assertEqual(await master.masters.by_key(), set([other.key for other in others]))
+        self.assertTrue(await others[1].slaves.ismember(master))
+        await master.masters.remove_many(others)
+        self.assertEqual(await master.masters.length(), 0)
+        self.assertFalse(await others[1].slaves.ismember(master))
+
+        # Test Abstract
+        self.assertRaises(TypeError, aiodatatypes._MemberIndex, master, "test",
+                          lambda key: None, SlaveTestObj)
+
+        # Cleanup
+        await master.destroy()
+        await slave.destroy()
+        for other in others:
+            await other.destroy()
+
+class CrossLayerTestCase(tests_common.BaseTestCase):
+
+    @run_async
+    async def test_sync_to_async(self, pbackend):
+
+        # Create Objects
+        parent = datatypes.PersistentObject(self.pbackend, key="TestParent", create=True)
+        idx = datatypes.ChildIndex(parent, SyncUUIDChild, "children", ordered=True)
+        child = idx.create(data="sync_data", userdata={'a': "1"})
+
+        # Test Read
+        aparent = await aiodatatypes.PersistentObject(pbackend, key="TestParent")
+        aidx = aiodatatypes.ChildIndex(aparent, UUIDChild, "children", ordered=True)
+        achild = await aidx.get(uid=child.uid)
+        self.assertEqual(await achild.data, "sync_data")
+        self.assertEqual(await achild.userdata, {'a': "1"})
+        self.assertEqual(await aidx.range_by_key(), [child.key])
+        self.assertEqual(await aparent.generation(), parent.generation())
+
+        # Test Destroy
+        await achild.destroy()
+        self.assertFalse(idx.exists(child.key))
+        self.assertEqual(parent.generation(), 2)
+
+        # Cleanup
+        idx.destroy()
+        parent.destroy()
+
+    @run_async
+    async def test_async_to_sync(self, pbackend):
+
+        # Create Objects
+        aparent = await aiodatatypes.PersistentObject(pbackend, key="TestParent", create=True)
+        aidx = aiodatatypes.ChildIndex(aparent, UUIDChild, "children", ordered=True)
+        achild = await aidx.create(data="async_data", userdata={'a': "1"})
+
+        # Test Read
+        parent = datatypes.PersistentObject(self.pbackend, key="TestParent")
+        idx = datatypes.ChildIndex(parent, SyncUUIDChild, "children", ordered=True)
+        child = idx.get(uid=achild.uid)
+        self.assertEqual(child.data, "async_data")
+        self.assertEqual(child.userdata, {'a': "1"})
+        self.assertEqual(idx.range_by_key(), [achild.key])
+        self.assertEqual(parent.generation(), await aparent.generation())
+
+        # Test Destroy
+        child.destroy()
+        self.assertFalse(await aidx.exists(achild.key))
+        self.assertEqual(await aparent.generation(), 2)
+
+        # Cleanup
+        await aidx.destroy()
+        await aparent.destroy()
+
+    @run_async
+    async def test_server_nonce(self, pbackend):
+
+        # Test Created Async, Destroyed Sync
+        await aiodatatypes.ServerObject(pbackend, key="TestServer", create=True)
+        srv = datatypes.ServerObject(self.pbackend, key="TestServer")
+        self.assertTrue(srv.get_nonce())
+        srv.destroy()
+
+        # Test Created Sync, Destroyed Async
+        srv = datatypes.ServerObject(self.pbackend, key="TestServer", create=True)
+        asrv = await aiodatatypes.ServerObject(pbackend, key="TestServer")
+        await asrv.destroy()
+
+
+### Main ###
+
+if __name__ == '__main__':
+    unittest.main(warnings="always")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2016
+# Tutamen Server Tests
+# Backup Tests
+
+
+### Imports ###
+
+## stdlib ##
+import datetime
+import io
+import json
+import unittest
+import uuid
+
+## Tests Common ##
+import tests_common
+
+## tutamen_server ##
+from pytutamen_server import constants
+from pytutamen_server import datatypes
+from pytutamen_server import storage
+from pytutamen_server import accesscontrol
+from pytutamen_server import backup
+
+
+### Test Classes ###
+
+class BackupTestCase(tests_common.BaseTestCase):
+
+    def _create_tree(self):
+
+        srv = storage.StorageServer(self.pbackend, create=True)
+        col = srv.collections.create(ac_servers=["https://acsrv.test"], ac_required=1,
+                                     compression=constants.COMPRESSION_ZLIB,
+                                     compress_threshold=10)
+        data = "".join([chr(ord('a') + (i % 26)) for i in range(1000)])
+        secs = {}
+        for i in range(20):
+            secs[col.secrets.create(data="test_data_{}".format(i)).uid] = "test_data_{}".format(i)
+        secs[col.secrets.create(data=data, chunk_size=64, userdata={'a': "1"}).uid] = data
+        secs[col.secrets.create(data=data).uid] = data
+        sec = col.secrets.create(data="v1", versioned=True)
+        sec.add_version("v2 ☃")
+        secs[sec.uid] = "v2 ☃"
+        return srv, col, secs
+
+    def _create_acs(self):
+
+        acs = accesscontrol.AccessControlServer(self.pbackend, create=True,
+                                                ca_crt_pem="test_crt", ca_key_pem="test_key",
+                                                sigkey_pub_pem="test_pub",
+                                                sigkey_priv_pem="test_priv")
+        acct = acs.accounts.create()
+        authn = acs.authenticators.create(module_name="dummy")
+        verifier = acs.verifiers.create(accounts=[acct], authenticators=[authn])
+        acs.permissions.create(objtype=constants.TYPE_COL, objuid=uuid.uuid4(),
+                               v_default=[verifier])
+        acs.authorizations.create(accountuid=acct.uid, clientuid=uuid.uuid4(),
+                                  expiration=datetime.datetime.now(),
+                                  objperm=constants.PERM_READ, objtype=constants.TYPE_COL,
+                                  objuid=uuid.uuid4())
+        return acs, acct, verifier
+
+    def _snapshot(self):
+        out = io.StringIO()
+        backup.dump(self.pbackend, out)
+        return sorted(out.getvalue().splitlines())
+
+    def test_dump_and_restore(self):
+
+        # Create Objects
+        srv, col, secs = self._create_tree()
+        acs, acct, verifier = self._create_acs()
+        size = self.pdb.dbsize()
+        before = self._snapshot()
+        order = col.secrets.range_by_key()
+
+        # Leave reaper and internal keys behind
+        pcollections = datatypes.pcollections_for(self.pbackend)
+        pcollections.MutableList(datatypes._REAP_JOBS_PKEY, create=["test_job"])
+        pcollections.MutableSet("reap_test", create=set(["test_key"]))
+
+        # Test Dump, reading 4 children at a time
+        out = io.StringIO()
+        cnt = backup.dump(self.pbackend, out, batch_size=4)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(cnt, len(lines))
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(cnt, 2 + 1 + len(secs) + 5)
+        self.assertEqual(len(set([(record['class'], record['key']) for record in records])), cnt)
+        dumped = set()
+        for record in records:
+            dumped.update(record['pobjs'])
+            if 'index' in record:
+                dumped.add(record['index'])
+            if 'order' in record:
+                dumped.add(record['order'][0])
+        self.assertEqual(len(dumped), size)
+        self.assertNotIn(datatypes._REAP_JOBS_PKEY, dumped)
+        self.assertNotIn("reap_test", dumped)
+
+        # Test Restore
+        self.pdb.flushdb()
+        datatypes.value_cache.clear()
+        datatypes.generation_cache.clear()
+        self.assertEqual(backup.restore(self.pbackend, lines, workers=3, batch_size=4), cnt)
+        self.assertEqual(self.pdb.dbsize(), size)
+        self.assertEqual(self._snapshot(), before)
+
+        # Test Objects
+        srv = storage.StorageServer(self.pbackend, create=False)
+        col = srv.collections.get(uid=col.uid)
+        self.assertEqual(col.secrets.fetch_many(list(secs)), secs)
+        self.assertEqual(col.secrets.range_by_key(), order)
+        for uid, data in secs.items():
+            self.assertEqual(srv.read_secret(col.uid, uid), data)
+        acs = accesscontrol.AccessControlServer(self.pbackend, create=False)
+        self.assertEqual(acs.sigkey_pub, "test_pub")
+        verifier = acs.verifiers.get(uid=verifier.uid)
+        self.assertTrue(verifier.accounts.ismember(acct))
+        self.assertTrue(acs.accounts.get(uid=acct.uid).verifiers.ismember(verifier))
+
+        # Test Restore Replaces
+        self.assertEqual(backup.restore(self.pbackend, lines), cnt)
+        self.assertEqual(self._snapshot(), before)
+
+        # Test Bad Records
+        record = {'class': "Test", 'key': "k", 'pobjs': {"k": ["stream", []]}}
+        self.assertRaises(ValueError, backup.restore, self.pbackend, [json.dumps(record)])
+        self.assertRaises(ValueError, backup.dump, self.pbackend, out, batch_size=0)
+
+        # Cleanup
+        srv.destroy(cascade=True)
+        for obj in acs.permissions.by_obj():
+            obj.destroy()
+        for obj in acs.authorizations.by_obj():
+            obj.destroy()
+        for obj in acs.verifiers.by_obj():
+            obj.destroy()
+        for obj in acs.authenticators.by_obj():
+            obj.destroy()
+        for obj in acs.accounts.by_obj():
+            obj.destroy()
+        acs.destroy()
+        datatypes.reaper.join()
+
+
+### Main ###
+
+if __name__ == '__main__':
+    unittest.main(warnings="always")
@@ -11,8 +11,10 @@
 ### Imports ###
 
 ## stdlib ##
+import gc
 import uuid
 import unittest
+import weakref
 
 ## pcollections ##
 from pcollections import collections
@@ -20,6 +22,7 @@ from pcollections import abc_base
 
 ## tutamen_server ##
 from pytutamen_server import datatypes
+from pytutamen_server import membackend
 
 ## Tests Common ##
 import tests_common
@@ -52,9 +55,78 @@ class FunctionsTestCase(tests_common.BaseTestCase):
         key = datatypes.build_pkey(base_key, prefix=prefix, postfix=postfix)
         self.assertEqual(key, (prefix + sep + base_key + sep + postfix))
 
+    def test_key_schemes(self):
+
+        uid = uuid.uuid4()
+        scheme = datatypes.COMPACT_KEYS
+
+        # Test Plain
+        self.assertIs(datatypes.key_scheme(self.pbackend), datatypes.PLAIN_KEYS)
+        self.assertEqual(datatypes.PLAIN_KEYS.encode_uid(uid), str(uid))
+
+        # Test Compact UUIDs
+        key = scheme.encode_uid(uid)
+        self.assertEqual(len(key), 22)
+        self.assertNotIn(datatypes._SEPERATOR, key)
+        self.assertEqual(scheme.decode_uid(key), uid)
+        self.assertEqual(scheme.decode_uid(str(uid)), uid)
+        self.assertEqual(scheme.normalize_key(str(uid)), key)
+        self.assertEqual(scheme.normalize_key("test_key"), "test_key")
+
+        # Test Compact Affixes
+        key = datatypes.build_pkey(key, prefix="srv", postfix="userdata", scheme=scheme)
+        self.assertEqual(key, "V_{}_U".format(scheme.encode_uid(uid)))
+
+        # Test Conflicting Codes
+        self.assertRaises(ValueError, datatypes.register_key_codes, {"srv": "X"})
+        self.assertRaises(ValueError, datatypes.register_key_codes, {"test_affix": "V"})
+        self.assertRaises(ValueError, datatypes.register_key_codes, {"test_affix": "X_Y"})
+
+        # Test Scheme Recorded
+        pbackend = membackend.MemoryBackend()
+        datatypes.set_key_scheme(pbackend, scheme)
+        self.assertIs(datatypes.key_scheme(pbackend), scheme)
+        self.assertRaises(ValueError, datatypes.set_key_scheme, pbackend, datatypes.PLAIN_KEYS)
+        del datatypes._key_schemes[pbackend]
+        self.assertRaises(ValueError, datatypes.key_scheme, pbackend)
+        datatypes.set_key_scheme(pbackend, scheme)
+
+        # Test Plain Data Refuses Other Schemes
+        plain = membackend.MemoryBackend()
+        plain.pcollections.String("test_key", create="val")
+        self.assertIs(datatypes.key_scheme(plain), datatypes.PLAIN_KEYS)
+        self.assertRaises(ValueError, datatypes.set_key_scheme, plain, scheme)
+
+        # Test Dropped Backend Not Held
+        ref = weakref.ref(pbackend)
+        del pbackend
+        gc.collect()
+        self.assertIsNone(ref())
+
 
 ### Object Classes ###
 
+class DefaultTestObj(datatypes.PersistentObject):
+
+    __slots__ = ()
+
+    def __init__(self, pbackend, create=False, **kwargs):
+        """Initialize Default Test Object"""
+
+        # Call Parent
+        super().__init__(pbackend, create=create, **kwargs)
+
+        # Setup Objects
+        self._build_pobj(self.pcollections.String, "val", create="default")
+
+class RacingChildIndex(datatypes.ChildIndex):
+
+    __slots__ = ()
+
+    def exists_many(self, keys):
+        # Miss every key, as if another writer got in after the check
+        return [False] * len(keys)
+
 class PersistentObjectTestCase(tests_common.BaseTestCase):
 
     def test_init(self):
@@ -64,6 +136,21 @@ class PersistentObjectTestCase(tests_common.BaseTestCase):
         obj = datatypes.PersistentObject(self.pbackend, key)
         self.assertIsInstance(obj, datatypes.PersistentObject)
 
+    def test_open_missing(self):
+
+        # Test First Pobj Default Not Written
+        self.assertRaises(datatypes.PObjectDNE, DefaultTestObj, self.pbackend, key="test_obj")
+        self.assertEqual(self.pdb.dbsize(), 0)
+
+        # Test Create Then Open
+        DefaultTestObj(self.pbackend, key="test_obj", create=True)
+        obj = DefaultTestObj(self.pbackend, key="test_obj")
+        self.assertEqual(self.pdb.dbsize(), 2)
+
+        # Cleanup
+        obj.pcollections.String(obj._build_pkey(postfix="val")).rem()
+        obj.destroy()
+
     def test_pbackend(self):
 
         # Create Obj
@@ -80,7 +167,22 @@ class PersistentObjectTestCase(tests_common.BaseTestCase):
         obj = datatypes.PersistentObject(self.pbackend, key)
 
         # Test Pcollections
-        self.assertIsInstance(obj.pcollections, collections.PCollections)
+        self.assertIsInstance(obj.pcollections, (collections.PCollections,
+                                                 membackend.MemoryCollections))
+
+        # Test Shared Factory
+        other = datatypes.PersistentObject(self.pbackend, "test_other")
+        self.assertIs(obj.pcollections, other.pcollections)
+
+    def test_slots(self):
+
+        # Create Obj
+        key = "test_obj"
+        obj = datatypes.PersistentObject(self.pbackend, key)
+
+        # Test No Instance Dict
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertRaises(AttributeError, setattr, obj, 'test_attr', None)
 
     def test_key(self):
 
@@ -150,7 +252,7 @@ class PersistentObjectTestCase(tests_common.BaseTestCase):
 
         # Create Obj
         key = "test_obj"
-        obj = datatypes.PersistentObject(self.pbackend, key)
+        obj = datatypes.PersistentObject(self.pbackend, key, create=True)
 
         # Build Obj
         postfix = "test_postfix"
@@ -159,6 +261,39 @@ class PersistentObjectTestCase(tests_common.BaseTestCase):
 
         # Cleanup
         pobj.rem()
+        obj.destroy()
+
+        # Test Missing
+        self.assertRaises(datatypes.PObjectDNE, obj._build_pobj,
+                          obj.pcollections.String, postfix)
+
+        # Test Default Skipped When Opening
+        obj = datatypes.PersistentObject(self.pbackend, key)
+        self.assertRaises(datatypes.PObjectDNE, obj._build_pobj,
+                          obj.pcollections.String, postfix, create="")
+        self.assertEqual(self.pdb.dbsize(), 0)
+
+    def test_open_pobjs(self):
+
+        # Create Obj
+        key = "test_obj"
+        obj = datatypes.PersistentObject(self.pbackend, key, create=True)
+
+        # Test Deferred Open
+        obj._pending = []
+        pobj = obj._build_pobj(obj.pcollections.String, "test_exists", create="")
+        obj._build_pobj(obj.pcollections.String, "test_missing")
+        self.assertRaises(datatypes.PObjectDNE, obj._open_pobjs)
+
+        # Test Open
+        obj._pending = []
+        obj._build_pobj(obj.pcollections.String, "test_exists")
+        obj._open_pobjs()
+        self.assertIsNone(obj._pending)
+
+        # Cleanup
+        pobj.rem()
+        obj.destroy()
 
     def test_val_to_key(self):
 
@@ -249,18 +384,21 @@ class UUIDObjectTestCase(tests_common.BaseTestCase):
         # Test Create Object w/ Random UUID
         obj = datatypes.UUIDObject(self.pbackend, create=True)
         self.assertIsInstance(obj, datatypes.UUIDObject)
+        obj.destroy()
 
         # Test Create Object w/ UUID String
         key = "eb424026-6f54-4ef8-a4d0-bb658a1fc6cf"
         obj = datatypes.UUIDObject(self.pbackend, key=key, create=True)
         self.assertIsInstance(obj, datatypes.UUIDObject)
         self.assertEqual(obj.key, key)
+        obj.destroy()
 
         # Test Create Object w/ UUID Object
         uid = uuid.uuid4()
         obj = datatypes.UUIDObject(self.pbackend, uid=uid, create=True)
         self.assertIsInstance(obj, datatypes.UUIDObject)
         self.assertEqual(obj.uid, uid)
+        obj.destroy()
 
     def test_init_existing(self):
 
@@ -293,6 +431,9 @@ class UUIDObjectTestCase(tests_common.BaseTestCase):
         self.assertIsInstance(obj, datatypes.UUIDObject)
         self.assertEqual(obj.uid, uid)
 
+        # Cleanup
+        obj.destroy()
+
     def test_uuid(self):
 
         # Create Object
@@ -301,6 +442,9 @@ class UUIDObjectTestCase(tests_common.BaseTestCase):
         # Test UUID
         self.assertEqual(str(obj.uid), obj.key)
 
+        # Cleanup
+        obj.destroy()
+
 class PermissionsObjectTestCase(tests_common.BaseTestCase):
 
     def test_init(self):
@@ -405,6 +549,17 @@ class UserDataObjectTestCase(tests_common.BaseTestCase):
         # Cleanup
         obj.destroy()
 
+    def test_userdata_lazy(self):
+
+        # Test Open Missing
+        key = "TestUserDataObject"
+        obj = datatypes.UserDataObject(self.pbackend, key=key, create=False)
+        self.assertNotIn("_userdata", obj._lazy)
+
+        # Test Validated on Access
+        with self.assertRaises(datatypes.PObjectDNE):
+            obj.userdata
+
 class ServerObjectTestCase(tests_common.BaseTestCase):
 
     def test_init_and_destroy(self):
@@ -417,6 +572,260 @@ class ServerObjectTestCase(tests_common.BaseTestCase):
         # Cleanup
         srv.destroy()
 
+class ValueCacheTestCase(tests_common.BaseTestCase):
+
+    def test_get_and_discard(self):
+
+        # Create Objs
+        cache = datatypes.ValueCache(max_bytes=8)
+        obj_a = datatypes.PersistentObject(self.pbackend, key="test_obj_a", create=True)
+        obj_b = datatypes.PersistentObject(self.pbackend, key="test_obj_b", create=True)
+        pobj_a = obj_a._build_pobj(obj_a.pcollections.String, "val", create="aaaa")
+        pobj_b = obj_b._build_pobj(obj_b.pcollections.String, "val", create="bbbb")
+
+        # Test Read Through
+        self.assertEqual(cache.get(obj_a, pobj_a.key, pobj_a.get_val), "aaaa")
+        self.assertEqual(cache.get(obj_a, pobj_a.key, None), "aaaa")
+        self.assertEqual(cache.size, 4)
+
+        # Test Budget
+        self.assertEqual(cache.get(obj_b, pobj_b.key, pobj_b.get_val), "bbbb")
+        self.assertEqual(cache.size, 8)
+        obj_c = datatypes.PersistentObject(self.pbackend, key="test_obj_c")
+        self.assertEqual(cache.get(obj_c, "test_obj_c_val", lambda: "c"), "c")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 5)
+
+        # Test Oversize
+        self.assertEqual(cache.get(obj_c, "test_obj_c_big", lambda: "c" * 9), "c" * 9)
+        self.assertEqual(len(cache), 2)
+
+        # Test Discard
+        cache.discard(obj_b)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, 1)
+
+        # Cleanup
+        pobj_b.rem()
+        pobj_a.rem()
+        obj_b.destroy()
+        obj_a.destroy()
+
+    def test_recreated(self):
+
+        # Create Obj
+        cache = datatypes.ValueCache()
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv", create=True)
+        self.assertEqual(cache.get(obj, "test_srv_val", lambda: "v1"), "v1")
+
+        # Test Hit From Other Instance
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv", create=False)
+        self.assertEqual(cache.get(obj, "test_srv_val", lambda: "v2"), "v1")
+
+        # Test Recreated Without Discard
+        obj.destroy()
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv", create=True)
+        self.assertEqual(cache.get(obj, "test_srv_val", lambda: "v3"), "v3")
+        self.assertEqual(len(cache), 1)
+
+        # Cleanup
+        obj.destroy()
+        self.assertEqual(self.pdb.dbsize(), 0)
+
+class GenerationCacheTestCase(tests_common.BaseTestCase):
+
+    def test_get_and_discard(self):
+
+        # Create Objs
+        cache = datatypes.GenerationCache(max_items=2)
+        obj_a = datatypes.PersistentObject(self.pbackend, key="test_obj_a")
+        obj_b = datatypes.PersistentObject(self.pbackend, key="test_obj_b")
+        loads = []
+        def loader(val):
+            loads.append(val)
+            return val
+
+        # Test Read Through
+        self.assertEqual(cache.get(obj_a, "val", lambda: loader("a1")), "a1")
+        self.assertEqual(cache.get(obj_a, "val", lambda: loader("a2")), "a1")
+        self.assertEqual(loads, ["a1"])
+
+        # Test Generation Change
+        obj_a._bump_generation()
+        self.assertEqual(cache.get(obj_a, "val", lambda: loader("a3")), "a3")
+        self.assertEqual(cache.get(obj_a, "val", lambda: loader("a4")), "a3")
+        self.assertEqual(loads, ["a1", "a3"])
+
+        # Test Budget
+        cache.get(obj_a, "other", lambda: "x")
+        cache.get(obj_b, "val", lambda: "b")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(obj_a, "val", lambda: loader("a5")), "a5")
+
+        # Test Discard
+        cache.discard(obj_a)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        # Cleanup
+        obj_a.destroy()
+        obj_b.destroy()
+
+    def test_recreated(self):
+
+        # Create Obj
+        cache = datatypes.GenerationCache()
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv", create=True)
+        self.assertEqual(cache.get(obj, "val", lambda: "v1"), "v1")
+
+        # Test Recreated Without Discard, back at the same generation
+        obj.destroy()
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv", create=True)
+        self.assertEqual(obj.generation(), 0)
+        self.assertEqual(cache.get(obj, "val", lambda: "v2"), "v2")
+
+        # Test Hit From Other Instance
+        obj = datatypes.ServerObject(self.pbackend, key="test_srv")
+        self.assertEqual(cache.get(obj, "val", lambda: "v3"), "v2")
+
+        # Cleanup
+        obj.destroy()
+        self.assertEqual(self.pdb.dbsize(), 0)
+
+class PackedTestObj(datatypes.PersistentObject):
+
+    packed_fields = True
+
+    def __init__(self, pbackend, create=False, name=None, state=None, **kwargs):
+        """Initialize Packed Test Object"""
+
+        # Call Parent
+        super().__init__(pbackend, create=create, **kwargs)
+
+        # Setup Fields
+        self._name = self._build_field("name", create=name)
+        self._state = self._build_field("state", create=state, mutable=True)
+
+    @property
+    def name(self):
+        return self._name.get_val()
+
+    @property
+    def state(self):
+        return self._state.get_val()
+
+class PackedFieldsTestCase(tests_common.BaseTestCase):
+
+    def test_create_and_get(self):
+
+        # Create Object
+        key = "test_packed"
+        obj = PackedTestObj(self.pbackend, key=key, create=True, name="a", state="new")
+        self.assertIsInstance(obj._name, datatypes.PackedField)
+        self.assertEqual(obj.name, "a")
+        self.assertEqual(obj.state, "new")
+
+        # Test Existing
+        obj = PackedTestObj(self.pbackend, key=key)
+        self.assertEqual(obj.name, "a")
+        self.assertEqual(obj.state, "new")
+
+        # Test Set
+        obj._state.set_val("done")
+        self.assertEqual(PackedTestObj(self.pbackend, key=key).state, "done")
+        self.assertRaises(TypeError, obj._name.set_val, "b")
+
+        # Cleanup
+        obj.destroy()
+
+    def test_migrate_fields(self):
+
+        # Create Legacy Object
+        key = "test_packed"
+        PackedTestObj.packed_fields = False
+        try:
+            obj = PackedTestObj(self.pbackend, key=key, create=True, name="a", state="new")
+        finally:
+            PackedTestObj.packed_fields = True
+        self.assertNotIsInstance(obj._name, datatypes.PackedField)
+
+        # Test Legacy Open
+        obj = PackedTestObj(self.pbackend, key=key)
+        self.assertNotIsInstance(obj._name, datatypes.PackedField)
+        self.assertEqual(obj.name, "a")
+
+        # Test Migrate
+        self.assertTrue(obj.migrate_fields())
+        obj = PackedTestObj(self.pbackend, key=key)
+        self.assertIsInstance(obj._name, datatypes.PackedField)
+        self.assertEqual(obj.name, "a")
+        self.assertEqual(obj.state, "new")
+        self.assertFalse(obj.migrate_fields())
+
+        # Cleanup
+        obj.destroy()
+
+    def test_open_many(self):
+
+        # Create Objects
+        base = datatypes.PersistentObject(self.pbackend, key="test_base")
+        PackedTestObj(self.pbackend, key="test_packed", create=True, name="a", state="new")
+        PackedTestObj.packed_fields = False
+        try:
+            PackedTestObj(self.pbackend, key="test_legacy", create=True, name="b", state="old")
+        finally:
+            PackedTestObj.packed_fields = True
+
+        # Test Bulk Open
+        packed, legacy = base.vals_to_objs(["test_packed", "test_legacy"], PackedTestObj)
+        self.assertEqual(packed._field_vals, {'name': "a", 'state': "new"})
+        self.assertEqual(packed.name, "a")
+        self.assertEqual(packed.state, "new")
+        self.assertNotIsInstance(legacy._name, datatypes.PackedField)
+        self.assertEqual(legacy.name, "b")
+
+        # Test Missing
+        self.assertRaises(datatypes.PObjectDNE, base.vals_to_objs,
+                          ["test_packed", "test_missing"], PackedTestObj)
+
+        # Cleanup
+        legacy.migrate_fields()
+        legacy = PackedTestObj(self.pbackend, key="test_legacy")
+        legacy.destroy()
+        packed.destroy()
+
+    def test_generation(self):
+
+        # Create Objects
+        obj = PackedTestObj(self.pbackend, key="test_packed", create=True, name="a", state="new")
+        PackedTestObj.packed_fields = False
+        try:
+            legacy = PackedTestObj(self.pbackend, key="test_legacy", create=True,
+                                   name="b", state="old")
+        finally:
+            PackedTestObj.packed_fields = True
+        self.assertEqual(datatypes.generations([obj, legacy]), [0, 0])
+
+        # Test Set Bumps Generation
+        obj._state.set_val("done")
+        legacy._state.set_val("done")
+        legacy._state.set_val("gone")
+        self.assertEqual(obj.generation(), 1)
+        self.assertEqual(legacy.generation(), 2)
+        self.assertEqual(datatypes.generations([obj, legacy]), [1, 2])
+        self.assertEqual(datatypes.generations([]), [])
+
+        # Test Shared Across Instances
+        self.assertEqual(PackedTestObj(self.pbackend, key="test_packed").generation(), 1)
+
+        # Cleanup
+        legacy.migrate_fields()
+        legacy = PackedTestObj(self.pbackend, key="test_legacy")
+        legacy.destroy()
+        obj.destroy()
+        self.assertEqual(obj.generation(), 0)
+
 class ChildObjectTestCase(tests_common.BaseTestCase):
 
     def setUp(self):
@@ -469,8 +878,12 @@ class ChildObjectTestCase(tests_common.BaseTestCase):
         self.assertEqual(obj.key, key)
 
         # Test Existing (create=True)
+        nonce = obj.get_nonce()
+        generation = self.parent.generation()
         self.assertRaises(datatypes.ObjectExists, datatypes.ChildObject, self.pbackend,
                           pindex=self.pindex, key=key, create=True)
+        self.assertEqual(obj.get_nonce(), nonce)
+        self.assertEqual(self.parent.generation(), generation)
 
         # Cleanup
         obj.destroy()
@@ -514,6 +927,75 @@ class ChildObjectTestCase(tests_common.BaseTestCase):
         # Test DNE
         self.assertFalse(obj.exists())
 
+    def test_create_atomic(self):
+
+        # Test Failed Create Leaves No Registration
+        key = "TestChild"
+        size = self.pdb.dbsize()
+        self.assertRaises(ValueError, FailingChildObj, self.pbackend,
+                          pindex=self.pindex, key=key, create=True)
+        self.assertFalse(self.pindex.exists(key))
+
+        # Test Failed Check Leaves No Defaults
+        if datatypes.pbackend_redis(self.pbackend) is not None:
+            self.assertEqual(self.pdb.dbsize(), size)
+            self.assertRaises(datatypes.PObjectDNE, MissingPObjChildObj, self.pbackend,
+                              pindex=self.pindex, key=key, create=True)
+            self.assertFalse(self.pindex.exists(key))
+            self.assertEqual(self.pdb.dbsize(), size)
+        else:
+            # Without redis the default is written as it is built
+            pcollections = datatypes.pcollections_for(self.pbackend)
+            pcollections.String(datatypes.build_pkey(key, postfix="val")).rem()
+
+    def test_destroy_atomic(self):
+
+        # Create Object
+        key = "TestChild"
+        obj = FailingDestroyObj(self.pbackend, pindex=self.pindex, key=key, create=True)
+
+        # Test Failed Destroy Leaves Object
+        self.assertRaises(ValueError, obj.destroy)
+        self.assertTrue(obj.exists())
+
+        # Test Destroy
+        datatypes.ChildObject.destroy(obj)
+        self.assertFalse(obj.exists())
+
+class FailingChildObj(datatypes.ChildObject):
+
+    def __init__(self, pbackend, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, **kwargs)
+
+        # Setup Vals
+        self._build_pobj(self.pcollections.String, "val", create="default")
+
+        # Fail After Setup
+        raise ValueError("Failed after setup")
+
+class MissingPObjChildObj(datatypes.ChildObject):
+
+    def __init__(self, pbackend, **kwargs):
+
+        # Call Parent
+        super().__init__(pbackend, **kwargs)
+
+        # Setup Vals, expecting one that was never written
+        self._build_pobj(self.pcollections.String, "val", create="default")
+        self._build_pobj(self.pcollections.String, "missing")
+
+class FailingDestroyObj(datatypes.ChildObject):
+
+    def destroy(self):
+
+        # Call Parent
+        super().destroy()
+
+        # Fail After Cleanup
+        raise ValueError("Failed after cleanup")
+
 class ChildIndexTestCase(tests_common.BaseTestCase):
 
     def setUp(self):
@@ -642,6 +1124,79 @@ class ChildIndexTestCase(tests_common.BaseTestCase):
         child.destroy()
         idx.destroy()
 
+    def test_create_many_get_many(self):
+
+        # Create Index
+        label = "TestChildIndex"
+        idx = datatypes.ChildIndex(self.parent, datatypes.ChildObject, label)
+
+        # Test Create Many
+        keys = ["child_{}".format(i) for i in range(10)]
+        children = idx.create_many([{'key': key} for key in keys])
+        self.assertEqual([child.key for child in children], keys)
+        self.assertEqual(idx.by_key(), set(keys))
+        self.assertEqual(idx.exists_many(keys + ["nochild"]), [True] * 10 + [False])
+
+        # Test Create Many Existing
+        self.assertRaises(datatypes.ObjectExists, idx.create_many,
+                          [{'key': "newchild"}, {'key': keys[0]}])
+        self.assertFalse(idx.exists("newchild"))
+        self.assertRaises(ValueError, idx.create_many, [{'key': "a"}, {'key': "a"}])
+
+        # Test Create Many Losing Race
+        if datatypes.pbackend_redis(self.pbackend) is not None:
+            racing = RacingChildIndex(self.parent, datatypes.ChildObject, label)
+            self.assertRaises(datatypes.ObjectExists, racing.create_many,
+                              [{'key': "newchild"}, {'key': keys[0]}])
+            self.assertFalse(idx.exists("newchild"))
+            self.assertTrue(idx.exists(keys[0]))
+
+        # Test Get Many
+        got = idx.get_many(reversed(keys))
+        self.assertEqual([child.key for child in got], list(reversed(keys)))
+        self.assertRaises(datatypes.ObjectDNE, idx.get_many, [keys[0], "nochild"])
+
+        # Cleanup
+        for child in children:
+            child.destroy()
+        idx.destroy()
+
+    def test_get_identity_map(self):
+
+        # Create Index
+        label = "TestChildIndex"
+        idx = datatypes.ChildIndex(self.parent, datatypes.ChildObject, label)
+
+        # Create Child
+        key = "test_child"
+        idx.create(key=key)
+
+        with datatypes.IdentityMap() as imap:
+
+            # Test Same Instance
+            child = idx.get(key=key)
+            self.assertIs(idx.get(key=key), child)
+            self.assertIs(self.parent.val_to_obj(key, datatypes.ChildObject, pindex=idx),
+                          child)
+            self.assertEqual(len(imap), 1)
+
+            # Test Other Index Still Checked
+            other = datatypes.ChildIndex(self.parent, datatypes.ChildObject, "TestOtherIndex")
+            self.assertRaises(datatypes.ObjectDNE, other.get, key=key)
+            self.assertEqual(len(imap), 1)
+            other.destroy()
+
+            # Test Invalidate on Destroy
+            child.destroy()
+            self.assertEqual(len(imap), 0)
+            self.assertRaises(datatypes.ObjectDNE, idx.get, key=key)
+
+        # Test Scope Closed
+        self.assertIsNone(datatypes.identity_map())
+
+        # Cleanup
+        idx.destroy()
+
     def test_exists(self):
 
         # Create Index
@@ -685,6 +1240,138 @@ class ChildIndexTestCase(tests_common.BaseTestCase):
             child.destroy()
         idx.destroy()
 
+    def test_iter_and_page_by_key(self):
+
+        # Create Index
+        label = "TestChildIndex"
+        idx = datatypes.ChildIndex(self.parent, datatypes.ChildObject, label)
+
+        # Test Empty
+        self.assertEqual(list(idx.iter_by_key()), [])
+        self.assertEqual(idx.page_by_key(), (None, []))
+
+        # Create Children
+        children = set()
+        keys = set()
+        for i in range(25):
+            key = "child_{}".format(i)
+            child = idx.create(key=key)
+            keys.add(key)
+            children.add(child)
+
+        # Test iter_by_key
+        self.assertEqual(set(idx.iter_by_key(batch_size=4)), keys)
+        self.assertEqual(set(obj.key for obj in idx.iter_by_obj(batch_size=4)), keys)
+
+        # Test page_by_key
+        paged = set()
+        cursor = None
+        while True:
+            cursor, page = idx.page_by_key(cursor=cursor, count=4)
+            paged.update(page)
+            if cursor is None:
+                break
+        self.assertEqual(paged, keys)
+
+        # Cleanup
+        for child in children:
+            child.destroy()
+        idx.destroy()
+
+    def test_compact_keys(self):
+
+        class UUIDChild(datatypes.ChildObject, datatypes.UUIDObject):
+            pass
+
+        # Create Index
+        datatypes.set_key_scheme(self.pbackend, datatypes.COMPACT_KEYS)
+        parent = datatypes.PersistentObject(self.pbackend, key="TestParent", prefix="srv")
+        idx = datatypes.ChildIndex(parent, UUIDChild, "TestChildIndex")
+        self.assertEqual(idx.pkey, "V_TestParent_TestChildIndex")
+
+        # Test Create
+        child = idx.create()
+        self.assertEqual(len(child.key), 22)
+        self.assertEqual(idx.by_key(), set([child.key]))
+        self.assertEqual(idx.by_uid(), set([child.uid]))
+
+        # Test Get by UUID and Canonical String
+        self.assertEqual(idx.get(uid=child.uid), child)
+        self.assertEqual(idx.get(key=str(child.uid)), child)
+        self.assertTrue(idx.exists(str(child.uid)))
+
+        # Cleanup
+        child.destroy()
+        idx.destroy()
+        parent.destroy()
+        datatypes.pcollections_for(self.pbackend).String(datatypes._KEY_SCHEME_PKEY).rem()
+
+    def test_range_and_page_by_created(self):
+
+        # Create Index
+        label = "TestChildIndex"
+        idx = datatypes.ChildIndex(self.parent, datatypes.ChildObject, label, ordered=True)
+
+        # Test Unordered
+        plain = datatypes.ChildIndex(self.parent, datatypes.ChildObject, "TestPlainIndex")
+        self.assertRaises(TypeError, plain.range_by_key)
+
+        # Test Empty
+        self.assertEqual(idx.range_by_key(), [])
+        self.assertEqual(idx.page_by_created(), (None, []))
+
+        # Create Children
+        children = []
+        keys = []
+        for i in range(10):
+            key = "child_{}".format(i)
+            children.append(idx.create(key=key))
+            keys.append(key)
+        children += idx.create_many([{'key': "child_10"}, {'key': "child_11"}])
+        keys += ["child_10", "child_11"]
+
+        # Test range_by_key
+        self.assertEqual(idx.range_by_key(), keys)
+        self.assertEqual(idx.range_by_key(start=0, stop=2, reverse=True), keys[-1:-4:-1])
+        self.assertEqual([obj.key for obj in idx.range_by_obj(start=3, stop=4)], keys[3:5])
+
+        # Test page_by_created
+        paged = []
+        cursor = None
+        while True:
+            cursor, page = idx.page_by_created(cursor=cursor, count=5)
+            paged += page
+            if cursor is None:
+                break
+        self.assertEqual(paged, keys)
+        paged = []
+        cursor = None
+        while True:
+            cursor, page = idx.page_by_created(cursor=cursor, count=5, reverse=True)
+            paged += page
+            if cursor is None:
+                break
+        self.assertEqual(paged, list(reversed(keys)))
+
+        # Test Page Stable Across Changes, including keys sharing a score
+        cursor, page = idx.page_by_created(count=11)
+        self.assertEqual(page, keys[:11])
+        children.pop(0).destroy()
+        children.append(idx.create(key="child_12"))
+        cursor, page = idx.page_by_created(cursor=cursor, count=5)
+        self.assertEqual(page, ["child_11", "child_12"])
+        self.assertIsNone(cursor)
+        keys = keys[1:] + ["child_12"]
+
+        # Test Destroy Drops Order
+        children.pop(0).destroy()
+        self.assertEqual(idx.range_by_key(), keys[1:])
+
+        # Cleanup
+        for child in children:
+            child.destroy()
+        idx.destroy()
+
     def test_by_uid(self):
 
         class UUIDChild(datatypes.ChildObject, datatypes.UUIDObject):
@@ -732,6 +1419,28 @@ class ChildIndexTestCase(tests_common.BaseTestCase):
             child.destroy()
         idx.destroy()
 
+    def test_generation(self):
+
+        # Create Index
+        idx = datatypes.ChildIndex(self.parent, datatypes.ChildObject, "TestChildIndex")
+        self.assertEqual(self.parent.generation(), 0)
+
+        # Test Create Bumps Parent
+        child = idx.create(key="test_child")
+        self.assertEqual(self.parent.generation(), 1)
+        children = idx.create_many([{'key': "test_child_{}".format(i)} for i in range(3)])
+        self.assertEqual(self.parent.generation(), 2)
+        self.assertEqual(child.generation(), 0)
+
+        # Test Destroy Bumps Parent
+        child.destroy()
+        self.assertEqual(self.parent.generation(), 3)
+
+        # Cleanup
+        for child in children:
+            child.destroy()
+        idx.destroy()
+
 class MasterTestObj(datatypes.UUIDObject):
 
     def __init__(self, pbackend, **kwargs):
@@ -774,6 +1483,49 @@ class SlaveTestObj(datatypes.UUIDObject):
         # Call Parent
         super().destroy()
 
+def _no_generator(key):
+    raise AssertionError("Peer generator should not be called for keyed peers")
+
+class KeyedMasterTestObj(datatypes.UUIDObject):
+
+    def __init__(self, pbackend, **kwargs):
+        """Initialize Keyed Master Test Object"""
+
+        # Call Parent
+        super().__init__(pbackend, prefix="kmaster", **kwargs)
+
+        # Setup Master Index
+        self.slaves = datatypes.MasterObjIndex(self, "slaves", _no_generator, KeyedSlaveTestObj,
+                                               peer_label="masters", peer_prefix="kslave")
+
+    def destroy(self):
+
+        # Cleanup Index
+        self.slaves.destroy()
+
+        # Call Parent
+        super().destroy()
+
+class KeyedSlaveTestObj(datatypes.UUIDObject):
+
+    def __init__(self, pbackend, **kwargs):
+        """Initialize Keyed Slave Test Object"""
+
+        # Call Parent
+        super().__init__(pbackend, prefix="kslave", **kwargs)
+
+        # Setup Slave Index
+        self.masters = datatypes.SlaveObjIndex(self, "masters", _no_generator, KeyedMasterTestObj,
+                                               peer_label="slaves", peer_prefix="kmaster")
+
+    def destroy(self):
+
+        # Cleanup Index
+        self.masters.destroy()
+
+        # Call Parent
+        super().destroy()
+
 class MasterSlaveObjIndexTestCase(tests_common.BaseTestCase):
 
     def test_init_and_destroy(self):
@@ -1127,6 +1879,119 @@ class MasterSlaveObjIndexTestCase(tests_common.BaseTestCase):
         # Cleanup Slave
         slave.destroy()
 
+    def test_keyed_many(self):
+
+        # Create Objects
+        master = KeyedMasterTestObj(self.pbackend, create=True)
+        slaves = [KeyedSlaveTestObj(self.pbackend, create=True) for i in range(10)]
+
+        # Test Add Many
+        master.slaves.add_many(slaves)
+        self.assertEqual(master.slaves.by_key(), set([slave.key for slave in slaves]))
+        for slave in slaves:
+            self.assertTrue(slave.masters.ismember(master))
+
+        # Test Remove Many
+        master.slaves.remove_many([slave.uid for slave in slaves[:5]])
+        self.assertEqual(master.slaves.by_key(), set([slave.key for slave in slaves[5:]]))
+        for slave in slaves[:5]:
+            self.assertFalse(slave.masters.ismember(master))
+
+        # Test Generator Path
+        other = MasterTestObj(self.pbackend, create=True)
+        plain = [SlaveTestObj(self.pbackend, create=True) for i in range(3)]
+        other.slaves.add_many(plain)
+        self.assertTrue(all([slave.masters.ismember(other) for slave in plain]))
+        for slave in plain:
+            slave.destroy()
+        other.destroy()
+
+        # Test Slave Destroy
+        slaves[5].destroy()
+        self.assertFalse(master.slaves.ismember(slaves[5]))
+
+        # Test Master Destroy
+        master.destroy()
+        for slave in slaves[6:]:
+            self.assertEqual(len(slave.masters), 0)
+
+        # Cleanup
+        for slave in slaves[:5] + slaves[6:]:
+            slave.destroy()
+
+    def test_set_queries(self):
+
+        # Create Objects
+        masters = [KeyedMasterTestObj(self.pbackend, create=True) for i in range(3)]
+        slaves = [KeyedSlaveTestObj(self.pbackend, create=True) for i in range(6)]
+        masters[0].slaves.add_many(slaves[0:3])
+        masters[1].slaves.add_many(slaves[2:5])
+        holder = datatypes.PersistentObject(self.pbackend, key="test_holder", create=True)
+        granted = datatypes.PlainObjIndex(holder, "granted", KeyedMasterTestObj)
+        granted.add(masters[0])
+        granted.add(masters[1])
+        granted.add(masters[2])
+        keys = [slave.key for slave in slaves]
+
+        # Test Inter, Union, Diff
+        sources = [masters[0].slaves, masters[1].slaves]
+        self.assertEqual(datatypes.inter_keys(self.pbackend, sources), set(keys[2:3]))
+        self.assertEqual(datatypes.union_keys(self.pbackend, sources), set(keys[0:5]))
+        self.assertEqual(datatypes.diff_keys(self.pbackend, sources), set(keys[0:2]))
+        self.assertEqual(datatypes.inter_keys(self.pbackend, []), set())
+        self.assertEqual(datatypes.inter_keys(self.pbackend, sources + [masters[2].slaves]),
+                         set())
+
+        # Test Inter Count
+        self.assertEqual(datatypes.inter_count(self.pbackend, [slaves[2].masters]), 2)
+        self.assertEqual(datatypes.inter_count(self.pbackend, [slaves[2].masters], limit=1), 1)
+        self.assertEqual(datatypes.inter_count(self.pbackend, sources), 1)
+
+        # Test Member Index Fan Out
+        pkeys = datatypes.member_pkeys(granted, "slaves", prefix="kmaster")
+        self.assertEqual(sorted(pkeys), sorted([master.slaves.pkey for master in masters]))
+        self.assertEqual(datatypes.union_keys(self.pbackend, pkeys), set(keys[0:5]))
+        found = datatypes.ismember_any(self.pbackend, pkeys, slaves + [uuid.uuid4()])
+        self.assertEqual(found, [True, True, True, True, True, False, False])
+        self.assertEqual(datatypes.ismember_any(self.pbackend, [], keys), [False] * 6)
+        self.assertEqual(datatypes.ismember_any(self.pbackend, pkeys, []), [])
+
+        # Cleanup
+        granted.destroy()
+        holder.destroy()
+        for master in masters:
+            master.destroy()
+        for slave in slaves:
+            slave.destroy()
+
+
+    def test_generation(self):
+
+        # Create Objects
+        master = KeyedMasterTestObj(self.pbackend, create=True)
+        slaves = [KeyedSlaveTestObj(self.pbackend, create=True) for i in range(2)]
+        other = MasterTestObj(self.pbackend, create=True)
+        slave = SlaveTestObj(self.pbackend, create=True)
+
+        # Test Link Bumps Both Sides
+        master.slaves.add_many(slaves)
+        other.slaves.add(slave)
+        self.assertEqual(datatypes.generations([master] + slaves), [1, 1, 1])
+        self.assertEqual(datatypes.generations([other, slave]), [1, 1])
+        master.slaves.remove(slaves[0])
+        self.assertEqual(datatypes.generations([master] + slaves), [2, 2, 1])
+
+        # Test Destroy Bumps Peers
+        slaves[1].destroy()
+        self.assertEqual(master.generation(), 3)
+        other.destroy()
+        self.assertEqual(slave.generation(), 2)
+
+        # Cleanup
+        master.destroy()
+        slaves[0].destroy()
+        slave.destroy()
+
 class PlainObjIndexTestCase(tests_common.BaseTestCase):
 
     def setUp(self):
@@ -1289,6 +2154,25 @@ class PlainObjIndexTestCase(tests_common.BaseTestCase):
             member.destroy()
         idx.destroy()
 
+    def test_generation(self):
+
+        # Create Index
+        idx = datatypes.PlainObjIndex(self.obj, "TestPlainIndex", datatypes.PersistentObject)
+        member = datatypes.PersistentObject(self.pbackend, key="test_member", create=True)
+
+        # Test Add and Remove Bump Owner
+        idx.add(member)
+        self.assertTrue(idx.ismember(member))
+        self.assertEqual(self.obj.generation(), 1)
+        idx.remove(member)
+        self.assertFalse(idx.ismember(member))
+        self.assertEqual(self.obj.generation(), 2)
+        self.assertEqual(member.generation(), 0)
+
+        # Cleanup
+        member.destroy()
+        idx.destroy()
+
 
 ### Main ###
 
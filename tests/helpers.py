@@ -80,7 +80,9 @@ class ObjectsHelpers(object):
     def helper_test_obj_existing(self, obj_type, obj_index, create_obj, get_obj,
                                  uuidobj=True, permobj=False):
 
-        # Test DNE
+        # Test DNE, with the index set opened so only the lookup could write
+        obj_index.by_key()
+        size = self.pdb.dbsize()
         if uuidobj:
             uid = uuid.uuid4()
             self.assertRaises(datatypes.ObjectDNE, get_obj, uid=uid)
@@ -90,6 +92,7 @@ class ObjectsHelpers(object):
             self.assertRaises(datatypes.ObjectDNE, get_obj, objuid=objuid, objtype=objtype)
         else:
             raise Exception("Requires either uuidobj or permobj")
+        self.assertEqual(self.pdb.dbsize(), size)
 
         # Create Object
         obj = create_obj()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2015, 2016
+# Tutamen Server Tests
+# Memory Backend Tests
+
+
+### Imports ###
+
+## stdlib ##
+import os
+import tempfile
+import threading
+import unittest
+
+## pcollections ##
+from pcollections import abc_base
+
+## tutamen_server ##
+from pytutamen_server import membackend
+from pytutamen_server import storage
+
+
+### Test Classes ###
+
+class MemoryBackendTestCase(unittest.TestCase):
+
+    def setUp(self):
+
+        # Call Parent
+        super().setUp()
+
+        # Setup Backend
+        self.pbackend = membackend.MemoryBackend()
+        self.pcollections = self.pbackend.pcollections
+
+    def test_string(self):
+
+        # Test Create or Open
+        pobj = self.pcollections.String("test_str", create="val")
+        self.assertIsInstance(pobj, abc_base.Persistent)
+        self.assertTrue(pobj.exists())
+        self.assertEqual(pobj.get_val(), "val")
+        pobj = self.pcollections.String("test_str", create="other")
+        self.assertEqual(pobj.get_val(), "val")
+
+        # Test Open Missing
+        pobj = self.pcollections.String("test_missing")
+        self.assertFalse(pobj.exists())
+        self.assertRaises(KeyError, pobj.get_val)
+
+        # Test Item
+        self.assertEqual(self.pbackend.item("test_str"), ("String", "val"))
+        self.assertIsNone(self.pbackend.item("test_missing"))
+
+        # Test Wrong Type
+        self.assertRaises(TypeError, self.pcollections.MutableSet, "test_str", create=set())
+
+        # Test Remove
+        self.pcollections.String("test_str").rem()
+        self.assertEqual(self.pbackend.dbsize(), 0)
+
+    def test_containers(self):
+
+        # Test Set
+        pset = self.pcollections.MutableSet("test_set", create=set())
+        self.assertTrue(pset.exists())
+        pset.add("a")
+        pset.add("b")
+        pset.discard("a")
+        self.assertIn("b", pset)
+        self.assertEqual(len(pset), 1)
+        self.assertEqual(pset.get_val(), set(["b"]))
+
+        # Test Dictionary
+        pdict = self.pcollections.MutableDictionary("test_dict", create={'a': "1"})
+        pdict['b'] = "2"
+        del pdict['a']
+        self.assertEqual(pdict['b'], "2")
+        self.assertEqual(pdict.get_val(), {'b': "2"})
+
+        # Test Values Are Copies
+        val = pdict.get_val()
+        val['c'] = "3"
+        self.assertEqual(pdict.get_val(), {'b': "2"})
+
+        # Test List
+        plist = self.pcollections.MutableList("test_list", create=["x"])
+        plist.append("y")
+        self.assertEqual(plist.get_val(), ["x", "y"])
+        self.assertEqual(plist[1], "y")
+
+    def test_threads(self):
+
+        # Add From Many Threads
+        pset = self.pcollections.MutableSet("test_set", create=set())
+        def add(i):
+            for j in range(100):
+                pset.add("{}_{}".format(i, j))
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Test All Added
+        self.assertEqual(len(pset), 800)
+
+        # Read While Writing
+        pdict = self.pcollections.MutableDictionary("test_dict", create={})
+        errors = []
+        def write():
+            for i in range(2000):
+                pdict[str(i)] = str(i)
+        def read():
+            try:
+                for i in range(200):
+                    pdict.get_val()
+                    pset.get_val()
+            except Exception as err:
+                errors.append(err)
+        threads = [threading.Thread(target=write)]
+        threads += [threading.Thread(target=read) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Test No Read Saw a Changing Value
+        self.assertEqual(errors, [])
+        self.assertEqual(len(pdict), 2000)
+
+    def test_snapshot(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot.pickle")
+
+            # Create Objects
+            pbackend = membackend.MemoryBackend(path=path)
+            srv = storage.StorageServer(pbackend, create=True)
+            col = srv.collections.create(ac_servers=["https://acsrv.test"], ac_required=1)
+            sec = col.secrets.create(data="test_data")
+            pbackend.close()
+
+            # Test Reload
+            pbackend = membackend.MemoryBackend(path=path)
+            srv = storage.StorageServer(pbackend, create=False)
+            col = srv.collections.get(uid=col.uid)
+            self.assertEqual(col.secrets.get(uid=sec.uid).data, "test_data")
+
+
+### Main ###
+
+if __name__ == '__main__':
+    unittest.main(warnings="always")
@@ -11,15 +11,21 @@
 ### Imports ###
 
 ## stdlib ##
+import datetime
 import functools
 import unittest
 import uuid
+import zlib
+
+## pcollections ##
+from pcollections import backends
 
 ## Tests ##
 import tests_common
 import helpers
 
 ## tutamen_server ##
+from pytutamen_server import constants
 from pytutamen_server import crypto
 from pytutamen_server import utility
 from pytutamen_server import datatypes
@@ -42,6 +48,13 @@ class StorageTestCase(tests_common.BaseTestCase):
         # Call Parent
         super().tearDownClass()
 
+    def _other_backend(self):
+        """Return a second pbackend on the same database, standing in for another process"""
+
+        if datatypes.pbackend_redis(self.pbackend) is None:
+            self.skipTest("Requires a database shared between backends")
+        return backends.RedisBaseBackend(self.pdriver)
+
     def _create_storageserver(self, pbackend, **kwargs_user):
 
         kwargs = {}
@@ -92,6 +105,48 @@ class StorageServerTestCase(StorageTestCase):
         # Cleanup
         ss.destroy()
 
+    def test_read_secret(self):
+
+        # Create Secrets
+        ss = self._create_storageserver(self.pbackend)
+        col = self._create_collection(ss)
+        zcol = self._create_collection(ss, compression=constants.COMPRESSION_ZLIB,
+                                       compress_threshold=10)
+        data = "".join([chr(ord('a') + (i % 26)) for i in range(1000)])
+        sec = self._create_secret(col, data="test_data")
+        chunked = self._create_secret(col, data=data, chunk_size=64)
+        empty = self._create_secret(col, data="", chunk_size=64)
+        zsec = self._create_secret(zcol, data=data)
+
+        # Test Read
+        self.assertEqual(ss.read_secret(col.uid, sec.uid), "test_data")
+        self.assertEqual(ss.read_secret(col.uid, chunked.uid), data)
+        self.assertEqual(ss.read_secret(col.uid, empty.uid), "")
+        self.assertEqual(ss.read_secret(zcol.uid, zsec.uid), data)
+
+        # Test Missing
+        self.assertRaises(datatypes.ObjectDNE, ss.read_secret, uuid.uuid4(), sec.uid)
+        self.assertRaises(datatypes.ObjectDNE, ss.read_secret, col.uid, uuid.uuid4())
+        self.assertRaises(datatypes.ObjectDNE, ss.read_secret, col.uid, zsec.uid)
+
+        # Cleanup
+        ss.destroy(cascade=True)
+        datatypes.reaper.join()
+
+    def test_destroy_cascade(self):
+
+        # Create Server With Children
+        ss = self._create_storageserver(self.pbackend)
+        for i in range(3):
+            col = self._create_collection(ss)
+            for j in range(5):
+                self._create_secret(col, data="test_data")
+
+        # Test Cascade
+        ss.destroy(cascade=True)
+        datatypes.reaper.join()
+        self.assertEqual(self.pdb.dbsize(), 0)
+
 class CollectionTestCase(StorageTestCase, helpers.ObjectsHelpers):
 
     def setUp(self):
@@ -160,6 +215,68 @@ class CollectionTestCase(StorageTestCase, helpers.ObjectsHelpers):
         # Cleanup
         col.destroy()
 
+    def test_ac_policy(self):
+
+        # Create Collection
+        servers = ['HTTPS://TestSrv1.tutamen.com', 'https://testsrv2.tutamen.com']
+        col = self._create_collection(self.ss, ac_servers=servers, ac_required=1)
+
+        # Test Policy
+        policy = col.ac_policy
+        self.assertIsInstance(policy, storage.ACPolicy)
+        self.assertEqual(policy.servers, ('https://testsrv1.tutamen.com',
+                                          'https://testsrv2.tutamen.com'))
+        self.assertEqual(policy.required, 1)
+
+        # Test Cached
+        self.assertIs(self.ss.collections.get(uid=col.uid).ac_policy, policy)
+
+        # Test Invalidated
+        col.set_ac_required(2)
+        self.assertEqual(col.ac_required, 2)
+        policy = self.ss.collections.get(uid=col.uid).ac_policy
+        self.assertEqual(policy.required, 2)
+        self.assertIs(col.ac_policy, policy)
+
+        # Test Verify
+        pub, priv = crypto.gen_key_pair()
+        manager = utility.SigkeyManager()
+        manager.cache['https://testsrv1.tutamen.com'] = pub
+        manager.cache['https://testsrv2.tutamen.com'] = pub
+        expiration = datetime.datetime.fromtimestamp(int(datetime.datetime.now().timestamp()) + 60)
+        token = utility.encode_auth_token(priv, uuid.uuid4(), uuid.uuid4(), expiration,
+                                          "test_perm", "test_obj", col.uid)
+        self.assertEqual(policy.sigkeys(manager), {server: pub for server in policy.servers})
+        self.assertEqual(policy.verify([token, token], "test_perm", "test_obj", col.uid), 2)
+        self.assertRaises(utility.TokenVerificationFailed, policy.verify, [token],
+                          "test_perm", "test_obj", col.uid)
+
+        # Cleanup
+        col.destroy()
+        self.assertEqual(len([key for key in datatypes.generation_cache._owners
+                              if key[2] == col.key]), 0)
+
+    def test_ac_policy_recreated(self):
+
+        other = storage.StorageServer(self._other_backend())
+
+        # Create Collection
+        col = self._create_collection(self.ss, ac_servers=['https://old.tutamen.com'],
+                                      ac_required=1)
+        self.assertEqual(col.ac_policy.servers, ('https://old.tutamen.com',))
+
+        # Recreate at the same uid from another process
+        other.collections.get(uid=col.uid).destroy()
+        other.collections.create(uid=col.uid, ac_servers=['https://new.tutamen.com'],
+                                 ac_required=1)
+
+        # Test New Servers
+        col = self.ss.collections.get(uid=col.uid)
+        self.assertEqual(col.ac_policy.servers, ('https://new.tutamen.com',))
+
+        # Cleanup
+        col.destroy()
+
     def test_secrets(self):
 
         # Create Collection
@@ -173,6 +290,80 @@ class CollectionTestCase(StorageTestCase, helpers.ObjectsHelpers):
         # Cleanup
         col.destroy()
 
+    def test_destroy_cascade(self):
+
+        # Create Collection With Secrets
+        self.ss.collections.by_key()
+        size = self.pdb.dbsize()
+        col = self._create_collection(self.ss)
+        for i in range(250):
+            self._create_secret(col, data=str(i))
+
+        # Test Parent Removed at Once
+        col.destroy(cascade=True)
+        self.assertFalse(self.ss.collections.exists(col.uid))
+
+        # Test Secrets Reaped, leaving the server's generation counter
+        datatypes.reaper.join()
+        self.assertEqual(self.pdb.dbsize(), size + 1)
+
+    def test_destroy_resume(self):
+
+        redis = datatypes.pbackend_redis(self.pbackend)
+        if redis is None:
+            self.skipTest("Reap jobs are only recorded with redis")
+
+        # Create Collection With Secrets
+        self.ss.collections.by_key()
+        size = self.pdb.dbsize()
+        col = self._create_collection(self.ss)
+        for i in range(25):
+            self._create_secret(col, data=str(i), chunk_size=1)
+
+        # Leave the server's index as a process stopped mid reap would
+        reap_pkey = "reap_" + str(uuid.uuid4())
+        record = datatypes.reap_record(reap_pkey, datatypes.reap_layout(storage.Collection))
+        redis.rename(self.ss.collections.pkey, reap_pkey)
+        redis.rpush(datatypes._REAP_JOBS_PKEY, record)
+
+        # Test Resumed Once Per Backend
+        reaper = datatypes.Reaper(batch_size=8)
+        reaper.resume(self.pbackend)
+        reaper.resume(self.pbackend)
+        reaper.join()
+        self.assertEqual(self.pdb.dbsize(), size + 1)
+        self.assertFalse(self.ss.collections.exists(col.uid))
+
+    def test_compression(self):
+
+        # Test Bad Settings
+        self.assertRaises(ValueError, self._create_collection, self.ss, compression="rot13")
+        self.assertRaises(ValueError, self._create_collection, self.ss,
+                          compression=constants.COMPRESSION_ZLIB, compress_threshold=-1)
+
+        # Test Create
+        col = self._create_collection(self.ss, compression=constants.COMPRESSION_ZLIB,
+                                      compress_threshold=100)
+        self.assertEqual(col.compression, (constants.COMPRESSION_ZLIB, 100))
+        plain = self._create_collection(self.ss)
+        self.assertIsNone(plain.compression)
+
+        # Test Existing
+        self.assertEqual(self.ss.collections.get(uid=col.uid).compression,
+                         (constants.COMPRESSION_ZLIB, 100))
+        self.assertIsNone(self.ss.collections.get(uid=plain.uid).compression)
+
+        # Test Set
+        plain.set_compression(constants.COMPRESSION_ZLIB)
+        self.assertEqual(self.ss.collections.get(uid=plain.uid).compression[0],
+                         constants.COMPRESSION_ZLIB)
+        plain.set_compression(None)
+        self.assertIsNone(self.ss.collections.get(uid=plain.uid).compression)
+
+        # Cleanup
+        col.destroy()
+        plain.destroy()
+
 class SecretTestCase(StorageTestCase, helpers.ObjectsHelpers):
 
     def setUp(self):
@@ -293,6 +484,179 @@ AEnFf7VvhdEQQ7h1nL5a3yDGD39HUXQRjv8OYm4l0ahOW8nFmM92trkbrpc2wA==
         # Cleanup
         sec.destroy()
 
+    def test_data_recreated(self):
+
+        other = storage.StorageServer(self._other_backend())
+
+        # Create Secret
+        sec = self._create_secret(self.col, data="old")
+        self.assertEqual(sec.data, "old")
+
+        # Recreate at the same uid from another process
+        secrets = other.collections.get(uid=self.col.uid).secrets
+        secrets.get(uid=sec.uid).destroy()
+        secrets.create(uid=sec.uid, data="new")
+
+        # Test New Data
+        sec = self.col.secrets.get(uid=sec.uid)
+        self.assertEqual(sec.data, "new")
+
+        # Cleanup
+        sec.destroy()
+
+    def test_compressed_data(self):
+
+        # Create Secrets
+        col = self._create_collection(self.ss, compression=constants.COMPRESSION_ZLIB,
+                                      compress_threshold=100)
+        data = "-----BEGIN FAKE DATA-----\n" + ("QUJDREVGR0hJSktMTU5PUFFSU1RVVldY\n" * 64)
+        sec = self._create_secret(col, data=data)
+        tiny = self._create_secret(col, data="short")
+        chunked = self._create_secret(col, data=data, chunk_size=256)
+
+        # Test Layout
+        sec = col.secrets.get(uid=sec.uid)
+        self.assertTrue(sec.compressed)
+        self.assertFalse(tiny.compressed)
+        self.assertFalse(chunked.compressed)
+        self.assertLess(sec.compressed_size, len(data) // 3)
+        self.assertIsNone(tiny.compressed_size)
+
+        # Test Raw Bytes Stored
+        self.assertEqual(sec.compressed_size, len(zlib.compress(data.encode('utf-8'))))
+
+        # Test Data
+        self.assertEqual(sec.data, data)
+        self.assertEqual(tiny.data, "short")
+        self.assertEqual(chunked.data, data)
+        self.assertEqual("".join(sec.iter_data()), data)
+        self.assertEqual(sec.read_range(10, 50), data[10:50])
+        self.assertEqual(self.ss.read_secret(col.uid, sec.uid), data)
+        self.assertEqual(col.secrets.fetch_many([sec.uid]), {sec.uid: data})
+
+        # Cleanup
+        for obj in [sec, tiny, chunked]:
+            obj.destroy()
+            self.assertEqual(self.pdb.keys("*{}*".format(obj.key)), [])
+        col.destroy()
+
+    def test_chunked_data(self):
+
+        # Create Secrets
+        data = "".join([chr(ord('a') + (i % 26)) for i in range(1000)])
+        sec = self._create_secret(self.col, data=data, chunk_size=64)
+        whole = self._create_secret(self.col, data=data)
+        empty = self._create_secret(self.col, data="", chunk_size=64)
+        self.assertRaises(ValueError, self._create_secret, self.col, data=data, chunk_size=0)
+
+        # Test Data
+        sec = self.col.secrets.get(uid=sec.uid)
+        self.assertTrue(sec.chunked)
+        self.assertFalse(whole.chunked)
+        self.assertEqual(sec.data, data)
+        self.assertEqual(empty.data, "")
+
+        # Test Streaming
+        pieces = list(sec.iter_data(read_chunks=3))
+        self.assertEqual(len(pieces), 16)
+        self.assertTrue(all([len(piece) <= 64 for piece in pieces]))
+        self.assertEqual("".join(pieces), data)
+        self.assertEqual(list(whole.iter_data()), [data])
+
+        # Test Ranges
+        for start, end in [(0, 10), (60, 70), (64, 128), (100, None), (999, 1000),
+                           (990, 2000), (500, 500), (1200, None)]:
+            self.assertEqual(sec.read_range(start, end), data[start:end])
+            self.assertEqual(whole.read_range(start, end), data[start:end])
+        self.assertRaises(ValueError, sec.read_range, -1)
+
+        # Cleanup
+        for obj in [sec, whole, empty]:
+            obj.destroy()
+            self.assertEqual(self.pdb.keys("*{}*".format(obj.key)), [])
+
+    def test_fetch_many(self):
+
+        # Create Secrets
+        data = "".join([chr(ord('a') + (i % 26)) for i in range(1000)])
+        sec = self._create_secret(self.col, data="test_data", userdata={'a': "1"})
+        chunked = self._create_secret(self.col, data=data, chunk_size=64)
+        empty = self._create_secret(self.col, data="", chunk_size=64)
+        col = self._create_collection(self.ss, compression=constants.COMPRESSION_ZLIB,
+                                      compress_threshold=100)
+        zsec = self._create_secret(col, data=data)
+        versioned = self._create_secret(self.col, data="v1", versioned=True)
+        versioned.add_version("v2")
+
+        # Test Fetch
+        out = self.col.secrets.fetch_many([sec.uid, chunked.uid, empty.uid, versioned.uid])
+        self.assertEqual(out, {sec.uid: "test_data", chunked.uid: data, empty.uid: "",
+                               versioned.uid: "v2"})
+        self.assertEqual(col.secrets.fetch_many([zsec.uid]), {zsec.uid: data})
+        self.assertEqual(self.col.secrets.fetch_many([]), {})
+
+        # Test Userdata
+        out = self.col.secrets.fetch_many([sec.uid, chunked.uid], userdata=True)
+        self.assertEqual(out, {sec.uid: ("test_data", {'a': "1"}), chunked.uid: (data, {})})
+
+        # Test Missing
+        self.assertRaises(datatypes.ObjectDNE, self.col.secrets.fetch_many,
+                          [sec.uid, zsec.uid])
+        self.assertRaises(datatypes.ObjectDNE, self.col.secrets.fetch_many, [uuid.uuid4()])
+
+        # Cleanup
+        for obj in [sec, chunked, empty, zsec, versioned]:
+            obj.destroy()
+            self.assertEqual(self.pdb.keys("*{}*".format(obj.key)), [])
+        col.destroy()
+
+    def test_versioned_data(self):
+
+        # Create Secrets
+        sec = self._create_secret(self.col, data="v1", versioned=True)
+        plain = self._create_secret(self.col, data="test_data")
+        self.assertRaises(ValueError, self._create_secret, self.col, data="v1",
+                          versioned=True, chunk_size=64)
+
+        # Test Initial Version
+        self.assertTrue(sec.versioned)
+        self.assertFalse(plain.versioned)
+        self.assertEqual(sec.version, 1)
+        self.assertEqual(plain.version, 1)
+        self.assertEqual(sec.data, "v1")
+        self.assertRaises(TypeError, plain.add_version, "v2")
+
+        # Test Add Versions
+        gen = sec.generation()
+        self.assertEqual(sec.add_version("v2"), 2)
+        self.assertEqual(sec.add_version("v3"), 3)
+        self.assertGreater(sec.generation(), gen)
+        self.assertEqual(sec.version, 3)
+        self.assertEqual(sec.data, "v3")
+        self.assertEqual(self.col.secrets.get(uid=sec.uid).data, "v3")
+        self.assertEqual(sec.read_range(0, 1), "v")
+        self.assertEqual(sec.get_version(1), "v1")
+        self.assertEqual([version for version, _ in sec.versions()], [1, 2, 3])
+        self.assertRaises(KeyError, sec.get_version, 4)
+
+        # Test Prune
+        self.assertEqual(sec.prune_versions(keep=2), [1])
+        self.assertEqual(sec.prune_versions(keep=2), [])
+        self.assertRaises(KeyError, sec.get_version, 1)
+        self.assertEqual(sec.prune_versions(max_age=0), [2])
+        self.assertEqual(sec.versions()[0][0], 3)
+        self.assertEqual(sec.data, "v3")
+        self.assertRaises(ValueError, sec.prune_versions, keep=0)
+
+        # Test One-Shot Reads
+        self.assertEqual(self.ss.read_secret(self.col.uid, sec.uid), "v3")
+        self.assertEqual(self.col.secrets.fetch_many([sec.uid]), {sec.uid: "v3"})
+
+        # Cleanup
+        for obj in [sec, plain]:
+            obj.destroy()
+            self.assertEqual(self.pdb.keys("*{}*".format(obj.key)), [])
+
 
 ### Main ###
 
@@ -10,6 +10,7 @@
 ### Imports ###
 
 ## stdlib ##
+import os
 import unittest
 import warnings
 
@@ -17,11 +18,17 @@ import warnings
 from pcollections import drivers
 from pcollections import backends
 
+## tutamen_server ##
+from pytutamen_server import membackend
+
 
 ### Globals ###
 
 _REDIS_DB = 9
 
+# Set to "memory" to run against the in-process backend instead of redis
+_BACKEND = os.environ.get("TUTAMEN_TEST_BACKEND", "redis")
+
 
 ### Exceptions ###
 
@@ -43,8 +50,13 @@ class BaseTestCase(unittest.TestCase):
     def __init__(self, *args, **kwargs):
 
         super().__init__(*args, **kwargs)
-        self.pdriver = drivers.RedisDriver(db=_REDIS_DB)
-        self.pbackend = backends.RedisBaseBackend(self.pdriver)
+        if _BACKEND == "memory":
+            self.pbackend = membackend.MemoryBackend()
+            self.pdb = self.pbackend
+        else:
+            self.pdriver = drivers.RedisDriver(db=_REDIS_DB)
+            self.pbackend = backends.RedisBaseBackend(self.pdriver)
+            self.pdb = self.pdriver.redis
 
     def setUp(self):
 
@@ -52,17 +64,17 @@ class BaseTestCase(unittest.TestCase):
         super().setUp()
 
         # Confirm Empty DB
-        if (self.pdriver.redis.dbsize() != 0):
-            raise RedisDatabaseNotEmpty(self.pdriver.redis)
+        if (self.pdb.dbsize() != 0):
+            raise RedisDatabaseNotEmpty(self.pdb)
 
     def tearDown(self):
 
         # Confirm Empty DB
-        if (self.pdriver.redis.dbsize() != 0):
-            msg = "\nRedis DB not empty: {:d} keys".format(self.pdriver.redis.dbsize())
-            msg += "\n{}".format(self.pdriver.redis.keys("*"))
+        if (self.pdb.dbsize() != 0):
+            msg = "\nRedis DB not empty: {:d} keys".format(self.pdb.dbsize())
+            msg += "\n{}".format(self.pdb.keys("*"))
             warnings.warn(msg)
-            self.pdriver.redis.flushdb()
+            self.pdb.flushdb()
 
         # Call Parent
         super().tearDown()